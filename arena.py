@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Head-to-head arena: play two agents against each other
+
+Examples:
+    python arena.py rl:q_table.json dq:dqn_policy.pt -n 1000
+    python arena.py dq:new_policy.pt dq:dqn_policy.pt --seed 1
+    python arena.py smart random --sprt --elo0 0 --elo1 50
+"""
+
+import sys
+import os
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.agents import load_agent
+from tictactoe_package.arena import ResultCache, play_match
+from tictactoe_package.gamelog import GameLogWriter
+from tictactoe_package.sprt import run_sprt
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play two TicTacToe agents head to head")
+    parser.add_argument("agent_a", help="random, smart, rl[:path] or dq[:path]")
+    parser.add_argument("agent_b", help="random, smart, rl[:path] or dq[:path]")
+    parser.add_argument("-n", "--games", type=int, default=1000, help="number of games (colours alternate)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--deterministic", action="store_true",
+                        help="fixed tie-breaking for Q-learning agents; repeated games are cached")
+    parser.add_argument("--sprt", action="store_true",
+                        help="stop early with a sequential test; -n becomes the maximum")
+    parser.add_argument("--elo0", type=float, default=0.0, help="SPRT H0 Elo difference")
+    parser.add_argument("--elo1", type=float, default=50.0, help="SPRT H1 Elo difference")
+    parser.add_argument("--alpha", type=float, default=0.05, help="SPRT false positive rate")
+    parser.add_argument("--beta", type=float, default=0.05, help="SPRT false negative rate")
+    parser.add_argument("--batch", type=int, default=20, help="SPRT games per batch")
+    parser.add_argument("--log", metavar="PATH", help="append every game to a binary game log")
+    args = parser.parse_args()
+
+    agent_a = load_agent(args.agent_a, deterministic=args.deterministic)
+    agent_b = load_agent(args.agent_b, deterministic=args.deterministic)
+
+    if args.sprt:
+        outcome = run_sprt(agent_a, agent_b, args.elo0, args.elo1, args.alpha, args.beta,
+                           args.batch, args.games, seed=args.seed)
+        verdict = {"H1": f"{args.agent_a} is stronger (H1: Elo {args.elo1:+g})",
+                   "H0": f"no improvement (H0: Elo {args.elo0:+g})",
+                   None: "undecided at the game limit"}[outcome.decision]
+        print("\n" + "=" * 60)
+        print(outcome.result.summary(args.agent_a, args.agent_b))
+        print(f"    SPRT    LLR {outcome.llr:.2f} in [{outcome.lower:.2f}, {outcome.upper:.2f}] -> {verdict}")
+        print("=" * 60 + "\n")
+        return
+
+    cache = ResultCache()
+    if args.log:
+        with GameLogWriter(args.log) as writer:
+            result = play_match(agent_a, agent_b, args.games, seed=args.seed, cache=cache,
+                                record=writer.write, names=(args.agent_a, args.agent_b))
+    else:
+        result = play_match(agent_a, agent_b, args.games, seed=args.seed, cache=cache)
+
+    print("\n" + "=" * 60)
+    print(result.summary(args.agent_a, args.agent_b))
+    if cache.hits:
+        print(f"  ({cache.misses} game(s) played, {cache.hits} replayed from cache)")
+    print("=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark micro-batched DQN inference: throughput vs latency
+
+Many concurrent requesters ask for moves continuously. Each setting of
+max batch size and max delay is compared with one forward pass per request.
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_heuristic import random_positions
+from tictactoe_package.batching import BatchedInference
+from tictactoe_package.dqn_agent import DQNAgent, DQNConfig
+from tictactoe_package.latency import LatencyHistogram, format_latency
+
+
+async def _drive(pick, positions, concurrency, duration):
+    """Run ``concurrency`` requesters for ``duration`` seconds; return (moves/s, histogram)"""
+    hist = LatencyHistogram()
+    deadline = time.perf_counter() + duration
+
+    async def requester(seed):
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            board, player = rng.choice(positions)
+            start = time.perf_counter()
+            await pick(board, player)
+            hist.record(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(requester(i) for i in range(concurrency)))
+    return hist.count / (time.perf_counter() - start), hist
+
+
+def bench(agent, positions, concurrency, duration, max_batch, max_delay):
+    if max_batch <= 1:
+        async def pick(board, player):
+            await asyncio.sleep(0)  # yield like a server handler would
+            return agent.pick_move(board, player)
+        return asyncio.run(_drive(pick, positions, concurrency, duration)) + (1.0,)
+
+    async def run():
+        batcher = BatchedInference(agent, max_batch, max_delay)
+        rate, hist = await _drive(batcher.pick_move, positions, concurrency, duration)
+        return rate, hist, batcher.mean_batch_size
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-batched DQN inference benchmark")
+    parser.add_argument("-c", "--concurrency", type=int, default=256, help="concurrent requesters")
+    parser.add_argument("-t", "--duration", type=float, default=2.0, help="seconds per setting")
+    args = parser.parse_args()
+
+    cfg = DQNConfig(verbose=False, device="cpu")
+    agent = DQNAgent(cfg)
+    positions = random_positions(5000)
+
+    print(f"\n{args.concurrency} concurrent requesters, {args.duration:g} s per setting\n")
+    print(f"  {'batch':>6} {'delay':>8} {'moves/s':>10} {'mean batch':>11} {'p50':>10} {'p99':>10}")
+    settings = [(1, 0.0)] + [(b, d) for b in (8, 32, 128) for d in (0.0005, 0.002)]
+    for max_batch, max_delay in settings:
+        rate, hist, mean_batch = bench(agent, positions, args.concurrency, args.duration,
+                                       max_batch, max_delay)
+        delay = "-" if max_batch <= 1 else f"{max_delay * 1000:g} ms"
+        p50, p99 = format_latency(hist.percentile(50)), format_latency(hist.percentile(99))
+        print(f"  {max_batch:>6} {delay:>8} {rate:>10,.0f} {mean_batch:>11.1f} {p50:>10} {p99:>10}")
+
+
+if __name__ == "__main__":
+    main()
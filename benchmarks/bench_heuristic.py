@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Benchmark the smart opponent: moves per second on random mid-game boards
+"""
+
+import sys
+import os
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tictactoe_package.game import TicTacToe
+from tictactoe_package.heuristic import smart_opponent_move
+
+
+def random_positions(n, seed=0):
+    """Collect n non-terminal positions from random play"""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < n:
+        env = TicTacToe()
+        while env.check_winner() is None and not env.is_board_full():
+            positions.append((env.board.copy(), env.current_player))
+            env.make_move(rng.choice(env.get_available_positions()))
+            env.switch_player()
+    return positions[:n]
+
+
+def bench_smart_opponent(n=100_000):
+    """Return smart-opponent moves per second"""
+    positions = random_positions(n)
+    start = time.perf_counter()
+    for board, mark in positions:
+        smart_opponent_move(board, mark)
+    return n / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print(f"smart_opponent_move: {bench_smart_opponent():,.0f} moves/sec")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Benchmark the alpha-beta agent: depth reached and nodes per second per board shape
+"""
+
+import sys
+import os
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tictactoe_package.search import AlphaBetaAgent
+
+SHAPES = [(3, 3, 3), (4, 4, 4), (5, 5, 4), (7, 7, 5), (15, 15, 5)]
+
+
+def bench_search(rows, cols, k, time_limit, moves):
+    """Play ``moves`` moves of self-play from the empty board; return the stats of each"""
+    agent = AlphaBetaAgent(rows, cols, k, time_limit=time_limit)
+    board = [' '] * (rows * cols)
+    mark = 'X'
+    stats = []
+    for _ in range(moves):
+        result = agent.search(board, mark)
+        if result.move < 0:
+            break
+        stats.append(result)
+        board[result.move] = mark
+        mark = 'O' if mark == 'X' else 'X'
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Alpha-beta search benchmark")
+    parser.add_argument("--time", type=float, default=0.5, help="seconds per move")
+    parser.add_argument("--moves", type=int, default=4, help="self-play moves per board shape")
+    args = parser.parse_args()
+    for rows, cols, k in SHAPES:
+        stats = bench_search(rows, cols, k, args.time, args.moves)
+        nodes = sum(s.nodes for s in stats)
+        seconds = sum(s.seconds for s in stats)
+        depths = ", ".join(str(s.depth) for s in stats)
+        print(f"{rows}x{cols} k={k}: {nodes / seconds:>9,.0f} nodes/s, depth reached {depths}")
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Performance benchmark suite with stored baselines
+
+    python benchmarks/run_benchmarks.py                 # run and print
+    python benchmarks/run_benchmarks.py --save          # store as the baseline
+    python benchmarks/run_benchmarks.py --check         # fail on regressions
+    python benchmarks/run_benchmarks.py --check --only dqn_pick_move
+
+benchmarks/baseline.json is the committed reference. Baselines are machine
+specific: on other hardware, save a fresh one before relying on --check.
+Each benchmark is run a few times and the best result is kept.
+"""
+
+import sys
+import os
+import argparse
+import contextlib
+import io
+import json
+import random
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_heuristic import random_positions
+from tictactoe_package.game import TicTacToe
+from tictactoe_package.rl_agent import RLAgent, board_to_state
+from tictactoe_package.heuristic import smart_opponent_move
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+BENCHMARKS = {}  # name -> (function, unit, higher_is_better)
+
+
+def benchmark(name, unit, higher_is_better=True):
+    """Register a benchmark function returning a single number"""
+    def register(fn):
+        BENCHMARKS[name] = (fn, unit, higher_is_better)
+        return fn
+    return register
+
+
+def _rate(fn, n):
+    """Calls per second of fn() over n calls"""
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return n / (time.perf_counter() - start)
+
+
+def _dqn_agent():
+    from tictactoe_package.dqn_agent import DQNAgent, DQNConfig
+    cfg = DQNConfig(verbose=False, device="cpu")
+    return DQNAgent(cfg)
+
+
+_trained_rl = []
+
+
+def _rl_agent():
+    if not _trained_rl:
+        random.seed(0)
+        agent = RLAgent()
+        agent.train_self_play(episodes=2000)
+        _trained_rl.append(agent)
+    return _trained_rl[0]
+
+
+# ---------- Game engine ----------
+
+@benchmark("game_moves", "moves/s")
+def bench_game_moves():
+    """make_move + check_winner + switch_player over random games"""
+    rng = random.Random(0)
+    moves = 0
+    start = time.perf_counter()
+    for _ in range(5000):
+        env = TicTacToe()
+        while True:
+            env.make_move(rng.choice(env.get_available_positions()))
+            moves += 1
+            if env.check_winner() or env.is_board_full():
+                break
+            env.switch_player()
+    return moves / (time.perf_counter() - start)
+
+
+@benchmark("game_moves_7x7k5", "moves/s")
+def bench_game_moves_large():
+    """As game_moves on a 7x7 board with 5 in a row; should stay close to it"""
+    rng = random.Random(0)
+    moves = 0
+    start = time.perf_counter()
+    for _ in range(500):
+        env = TicTacToe(7, 7, 5)
+        while True:
+            env.make_move(rng.choice(env.get_available_positions()))
+            moves += 1
+            if env.check_winner() or env.is_board_full():
+                break
+            env.switch_player()
+    return moves / (time.perf_counter() - start)
+
+
+@benchmark("check_winner", "calls/s")
+def bench_check_winner():
+    """Full-board win detection: consecutive boards differ, so no call is a cache hit"""
+    boards = [board for board, _ in random_positions(1000)]
+    env = TicTacToe()
+    start = time.perf_counter()
+    for _ in range(50):
+        for board in boards:
+            env.board = board
+            env.check_winner()
+    return 50 * len(boards) / (time.perf_counter() - start)
+
+
+# ---------- Encodings ----------
+
+@benchmark("board_to_state", "calls/s")
+def bench_board_to_state():
+    positions = random_positions(1000)
+    start = time.perf_counter()
+    for _ in range(50):
+        for board, player in positions:
+            board_to_state(board, player)
+    return 50 * len(positions) / (time.perf_counter() - start)
+
+
+@benchmark("encode_board", "calls/s")
+def bench_encode_board():
+    from tictactoe_package.dqn_agent import encode_board
+    positions = random_positions(1000)
+    start = time.perf_counter()
+    for _ in range(10):
+        for board, player in positions:
+            encode_board(board, player)
+    return 10 * len(positions) / (time.perf_counter() - start)
+
+
+# ---------- Agents ----------
+
+@benchmark("rl_pick_move", "us/move", higher_is_better=False)
+def bench_rl_pick_move():
+    agent = _rl_agent()
+    positions = random_positions(2000)
+    start = time.perf_counter()
+    for board, player in positions:
+        agent.pick_move(board, player)
+    return (time.perf_counter() - start) / len(positions) * 1e6
+
+
+@benchmark("dqn_pick_move", "us/move", higher_is_better=False)
+def bench_dqn_pick_move():
+    agent = _dqn_agent()
+    positions = random_positions(1000)
+    start = time.perf_counter()
+    for board, player in positions:
+        agent.pick_move(board, player)
+    return (time.perf_counter() - start) / len(positions) * 1e6
+
+
+@benchmark("smart_opponent_move", "moves/s")
+def bench_smart_opponent():
+    positions = random_positions(20000)
+    start = time.perf_counter()
+    for board, mark in positions:
+        smart_opponent_move(board, mark)
+    return len(positions) / (time.perf_counter() - start)
+
+
+@benchmark("dqn_learn", "steps/s")
+def bench_dqn_learn():
+    from tictactoe_package.dqn_agent import encode_board, legal_mask
+    agent = _dqn_agent()
+    agent.cfg.start_training_after = 0
+    for board, player in random_positions(2000):
+        a = board.index(' ')
+        after = board.copy()
+        after[a] = player
+        agent.remember(encode_board(board, player), a, -0.01,
+                       encode_board(after, player), False, legal_mask(after))
+    agent.step_count = 1
+    return _rate(agent.learn, 200)
+
+
+@benchmark("rl_self_play", "episodes/s")
+def bench_rl_self_play():
+    random.seed(0)
+    agent = RLAgent()
+    start = time.perf_counter()
+    agent.train_self_play(episodes=2000)
+    return 2000 / (time.perf_counter() - start)
+
+
+@benchmark("run_auto", "games/s")
+def bench_run_auto():
+    from tictactoe_package import GameController
+    from tictactoe_package.player import PlayerInput
+    from tictactoe_package.tournament import run_tournament
+    PlayerInput._ai_kind = "rl"
+    controller = GameController()
+    controller.num_human_players = 0
+    controller._rl_agent = _rl_agent()
+    start = time.perf_counter()
+    run_tournament(controller, 2000, seed=0)
+    return 2000 / (time.perf_counter() - start)
+
+
+# ---------- Persistence ----------
+
+@benchmark("rl_policy_load", "ms", higher_is_better=False)
+def bench_rl_policy_load():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "q_table.json")
+        _rl_agent().save(path)
+        start = time.perf_counter()
+        for _ in range(5):
+            RLAgent().load(path)
+        return (time.perf_counter() - start) / 5 * 1000
+
+
+@benchmark("dqn_policy_load", "ms", higher_is_better=False)
+def bench_dqn_policy_load():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dqn_policy.pt")
+        _dqn_agent().save(path)
+        start = time.perf_counter()
+        for _ in range(5):
+            _dqn_agent().load(path)
+        return (time.perf_counter() - start) / 5 * 1000
+
+
+# ---------- Runner ----------
+
+def run(names, repeat=3):
+    """Run the named benchmarks; keep the best of ``repeat`` runs"""
+    results = {}
+    for name in names:
+        fn, unit, higher = BENCHMARKS[name]
+        with contextlib.redirect_stdout(io.StringIO()):
+            values = [fn() for _ in range(repeat)]
+        best = max(values) if higher else min(values)
+        results[name] = {"value": best, "unit": unit, "higher_is_better": higher}
+        print(f"  {name:<22} {best:14,.2f} {unit}")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return a list of (name, baseline, current, change) regressions"""
+    regressions = []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]["value"]
+        value = current["value"]
+        change = (value - base) / base if current["higher_is_better"] else (base - value) / base
+        if change < -threshold:
+            regressions.append((name, base, value, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the performance benchmarks")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="save results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown as a fraction (default 0.25 = 25%%)")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="run only these benchmarks")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("\nRunning benchmarks...")
+    results = run(args.only or list(BENCHMARKS), args.repeat)
+
+    if args.save:
+        baseline = {}
+        if args.only and os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nSaved baseline -> {args.baseline}")
+
+    if args.check:
+        if not os.path.exists(args.baseline):
+            print(f"\nNo baseline at {args.baseline}; run with --save first.")
+            return 1
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions beyond {args.threshold:.0%}:")
+            for name, base, value, change in regressions:
+                print(f"  {name:<22} {base:,.2f} -> {value:,.2f} ({change:+.1%})")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
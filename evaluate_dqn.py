@@ -10,33 +10,17 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from tictactoe_package.dqn_agent import DQNAgent, DQNConfig
 from tictactoe_package.game import TicTacToe
+from tictactoe_package.arena import ResultCache, play_game
 import random
 
 
-def play_game_dqn_vs_dqn(agent):
-    """Play a game where DQN agent plays both sides"""
-    env = TicTacToe()
-    
-    while True:
-        # Get available positions
-        available = env.get_available_positions()
-        if not available:
-            break
-        
-        # DQN picks move
-        position = agent.pick_move(env.board, env.current_player)
-        if position not in available:
-            position = random.choice(available)
-        
-        env.make_move(position)
-        winner = env.check_winner()
-        
-        if winner or env.is_board_full():
-            return winner
-        
-        env.switch_player()
-    
-    return None
+def play_game_dqn_vs_dqn(agent, cache=None):
+    """Play a game where DQN agent plays both sides
+
+    Greedy DQN play is deterministic, so with a ``cache`` the game is only
+    played out once per set of weights.
+    """
+    return play_game(agent, agent, cache=cache)
 
 
 def play_game_dqn_vs_random(agent, dqn_player='X'):
@@ -89,14 +73,16 @@ def evaluate_dqn_agent(policy_path="dqn_policy.pt"):
     # Test 1: DQN vs DQN (should mostly draw since both play optimally)
     print("\n--- Test 1: DQN vs DQN (100 games) ---")
     results = {'X': 0, 'O': 0, 'Draw': 0}
+    cache = ResultCache()
     
     for _ in range(100):
-        winner = play_game_dqn_vs_dqn(agent)
+        winner = play_game_dqn_vs_dqn(agent, cache)
         if winner:
             results[winner] += 1
         else:
             results['Draw'] += 1
     
+    print(f"(played {cache.misses} game(s), {cache.hits} replayed from cache)")
     print(f"X wins: {results['X']}")
     print(f"O wins: {results['O']}")
     print(f"Draws: {results['Draw']}")
@@ -11,59 +11,10 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from tictactoe_package.dqn_agent import DQNAgent, DQNConfig
 from tictactoe_package.game import TicTacToe
+from tictactoe_package.heuristic import smart_opponent_move
 import random
 
 
-def check_winning_move(board, player):
-    """Check if there's a winning move for the player"""
-    for pos in range(9):
-        if board[pos] == ' ':
-            # Try the move
-            board[pos] = player
-            game = TicTacToe()
-            game.board = board.copy()
-            if game.check_winner() == player:
-                board[pos] = ' '  # Undo
-                return pos
-            board[pos] = ' '  # Undo
-    return None
-
-
-def smart_opponent_move(board, opponent_mark):
-    """
-    Smart opponent strategy:
-    1. Win if possible
-    2. Block opponent from winning
-    3. Take center if available
-    4. Take corner
-    5. Random
-    """
-    # 1. Check if we can win
-    winning_move = check_winning_move(board, opponent_mark)
-    if winning_move is not None:
-        return winning_move
-    
-    # 2. Check if we need to block opponent
-    player_mark = 'X' if opponent_mark == 'O' else 'O'
-    blocking_move = check_winning_move(board, player_mark)
-    if blocking_move is not None:
-        return blocking_move
-    
-    # 3. Take center if available
-    if board[4] == ' ':
-        return 4
-    
-    # 4. Take a corner
-    corners = [0, 2, 6, 8]
-    available_corners = [c for c in corners if board[c] == ' ']
-    if available_corners:
-        return random.choice(available_corners)
-    
-    # 5. Take any available space
-    available = [i for i in range(9) if board[i] == ' ']
-    return random.choice(available) if available else None
-
-
 def play_game_dqn_vs_smart(agent, dqn_player='X'):
     """Play a game where DQN plays against a smart opponent"""
     env = TicTacToe()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Exact evaluation: worst-case result of an agent's greedy policy against a
+perfect adversary, as X and as O, with every losing line, plus exact
+win/draw/loss probabilities against the random and smart opponents.
+
+Example:
+    python evaluate_exact.py dq:dqn_policy.pt
+    python evaluate_exact.py rl:q_table.json --max-lines 50
+"""
+
+import sys
+import os
+import argparse
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.agents import load_agent
+from tictactoe_package.exact_eval import (
+    exploitability, expected_result, format_line, uniform_random_distribution, PolicyCache
+)
+from tictactoe_package.heuristic import smart_move_distribution
+
+OPPONENTS = [("Random", uniform_random_distribution), ("Smart", smart_move_distribution)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exact worst-case evaluation of a policy")
+    parser.add_argument("agent", nargs="?", default="dq:dqn_policy.pt", help="rl[:path] or dq[:path]")
+    parser.add_argument("--max-lines", type=int, default=20, help="losing lines to print per side")
+    args = parser.parse_args()
+
+    agent = load_agent(args.agent, deterministic=True)
+    policy = PolicyCache(agent)
+
+    print("\n" + "=" * 60)
+    print(f"Exact evaluation of {args.agent}")
+    print("=" * 60)
+    for mark in ('X', 'O'):
+        start = time.perf_counter()
+        report = exploitability(agent, mark, policy=policy)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n--- Agent as {mark}: worst case {report.result.upper()} "
+              f"({len(report.losing_lines)} losing line(s), {report.positions} positions, {elapsed:.1f} ms) ---")
+        for line in report.losing_lines[:args.max_lines]:
+            print(f"  {format_line(line)}")
+        if len(report.losing_lines) > args.max_lines:
+            print(f"  ... and {len(report.losing_lines) - args.max_lines} more")
+
+    print("\n--- Exact results against stochastic opponents ---")
+    for name, opponent in OPPONENTS:
+        for mark in ('X', 'O'):
+            r = expected_result(agent, mark, opponent, policy=policy)
+            print(f"  as {mark} vs {name:<6}: win {r.win * 100:6.2f}%  draw {r.draw * 100:6.2f}%  "
+                  f"loss {r.loss * 100:6.2f}%  (score {r.score:.4f})")
+    print("\n" + "=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Summarize a binary game log without replaying the games
+
+Example:
+    python tictactoe.py -auto 100000 --seed 1 --log games.ttt
+    python game_log.py games.ttt
+"""
+
+import sys
+import os
+import argparse
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.gamelog import read_games
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize a binary game log")
+    parser.add_argument("path", help="game log written with --log / --game-log")
+    parser.add_argument("--top", type=int, default=5, help="most common openings to show")
+    args = parser.parse_args()
+
+    matchups = Counter()
+    results = Counter()
+    openings = Counter()
+    lengths = 0
+    games = 0
+    for game in read_games(args.path):
+        key = (game.agent_x, game.agent_o)
+        matchups[key] += 1
+        results[key, game.result or "Draw"] += 1
+        if game.moves:
+            openings[game.starting, game.moves[0]] += 1
+        lengths += len(game.moves)
+        games += 1
+
+    print("\n" + "=" * 60)
+    print(f"  {games:,} games, {os.path.getsize(args.path):,} bytes"
+          + (f" ({os.path.getsize(args.path) / games:.1f} bytes/game)" if games else ""))
+    if games:
+        print(f"  Average length: {lengths / games:.2f} moves")
+    print("=" * 60)
+    for (x, o), n in matchups.most_common():
+        counts = "  ".join(f"{r} {results[(x, o), r] / n * 100:5.1f}%" for r in ("X", "O", "Draw"))
+        print(f"  {x} (X) vs {o} (O): {n:,} games  {counts}")
+    if openings:
+        print("\n  Most common openings:")
+        for (mark, move), n in openings.most_common(args.top):
+            print(f"    {mark}{move + 1:<3} {n:8,}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
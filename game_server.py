@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Asyncio game server: many concurrent TicTacToe sessions over TCP
+
+Each line is a JSON request, e.g. {"cmd": "new", "ai": "dq", "human": "X"}.
+See tictactoe_package/server.py for the protocol.
+
+Examples:
+    python game_server.py --port 8765 --preload dq smart
+    python game_server.py --preload dq --batch-size 64 --batch-delay-ms 2
+    python load_generator.py --port 8765 -c 1000 -g 5 --ai dq
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.agents import AGENT_KINDS
+from tictactoe_package.server import serve_forever
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve TicTacToe games over a TCP line protocol")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--preload", nargs="*", default=[], choices=AGENT_KINDS,
+                        help="agent kinds to load before accepting connections")
+    parser.add_argument("--batch-size", type=int, default=1,
+                        help="batch DQN moves from concurrent sessions, up to this many (1 = off)")
+    parser.add_argument("--batch-delay-ms", type=float, default=2.0,
+                        help="longest a DQN move waits for its batch to fill")
+    args = parser.parse_args()
+
+    print(f"Serving TicTacToe on {args.host}:{args.port} (Ctrl+C to stop)")
+    try:
+        asyncio.run(serve_forever(args.host, args.port, args.preload,
+                                  args.batch_size, args.batch_delay_ms / 1000))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+if __name__ == "__main__":
+    main()
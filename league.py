@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Round-robin league: rank every policy in a directory
+
+Plays each pairing of *.pt (DQN) and *.json (Q-table) policies, caching
+results by policy checksum so only new checkpoints need new games.
+
+Example:
+    python league.py checkpoints/ -n 200 -j 4
+"""
+
+import sys
+import os
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.league import run_league
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank saved policies with a round-robin league")
+    parser.add_argument("directory", help="directory with *.pt and *.json policies")
+    parser.add_argument("-n", "--games", type=int, default=200, help="games per pairing")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes")
+    parser.add_argument("--cache", default=None,
+                        help="pairing results cache (default: <directory>/league_results.cache)")
+    args = parser.parse_args()
+
+    cache_path = args.cache or os.path.join(args.directory, "league_results.cache")
+
+    def progress(a, b, result):
+        print(f"  {a} vs {b}: +{result.wins} ={result.draws} -{result.losses}")
+
+    ratings, results = run_league(args.directory, args.games, args.jobs, cache_path, progress)
+
+    print("\n" + "=" * 60)
+    print(f"  {'Policy':<32} {'Elo':>7} {'±':>6}")
+    print("=" * 60)
+    for name, (elo, err) in sorted(ratings.items(), key=lambda kv: -kv[1][0]):
+        print(f"  {name:<32} {elo:7.0f} {1.96 * err:6.0f}")
+    print("=" * 60)
+    print(f"  {len(results)} pairings, cache: {cache_path}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Load generator for game_server.py
+
+Opens many concurrent connections that play complete games with random
+moves, then reports requests/sec and round-trip latency percentiles.
+
+Example:
+    python load_generator.py -c 1000 -g 5 --ai dq
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.agents import AGENT_KINDS
+from tictactoe_package.latency import format_latency
+from tictactoe_package.loadgen import run_load
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure game server throughput and latency")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("-c", "--clients", type=int, default=100, help="concurrent connections")
+    parser.add_argument("-g", "--games", type=int, default=10, help="games per client")
+    parser.add_argument("--ai", default="random", choices=AGENT_KINDS, help="server-side opponent")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    result = asyncio.run(run_load(args.host, args.port, args.clients, args.games, args.ai, args.seed))
+    s = result.latency.summary()
+
+    print("\n" + "=" * 60)
+    print(f"  {result.clients} clients, {result.games} games, {result.requests} requests "
+          f"in {result.elapsed:.2f} s")
+    print(f"  Throughput: {result.requests_per_sec:,.0f} requests/s, {result.games_per_sec:,.0f} games/s")
+    print(f"  Latency:    p50 {format_latency(s['p50'])}  p95 {format_latency(s['p95'])}  "
+          f"p99 {format_latency(s['p99'])}  max {format_latency(s['max'])}")
+    if result.errors:
+        print(f"  Errors:     {result.errors}")
+    print("=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
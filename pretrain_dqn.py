@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Offline pretraining of the DQN from solver values or recorded games
+
+Examples:
+    python pretrain_dqn.py                          # label positions with the exact solver
+    python pretrain_dqn.py --from-log games.ttt     # learn from logged games
+    python pretrain_dqn.py --out dqn_policy.pt      # replace the policy the game plays
+
+The dataset file is rebuilt unless --reuse is given. The policy is saved to
+dqn_pretrained.pt by default, so the shipped dqn_policy.pt is only replaced
+when asked for. Fine-tune the result with train_dqn.py as usual.
+"""
+
+import sys
+import os
+import argparse
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.dqn_agent import DQNAgent, DQNConfig
+from tictactoe_package.exact_eval import exploitability, expected_result
+from tictactoe_package.pretrain import open_dataset, pretrain, write_game_log_dataset, write_solver_dataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pretrain the DQN offline")
+    parser.add_argument("--from-log", nargs="+", metavar="PATH",
+                        help="game logs to learn from (default: exact solver values)")
+    parser.add_argument("--dataset", default="pretrain_dataset.bin", help="memory-mapped dataset file")
+    parser.add_argument("--reuse", action="store_true", help="train on an existing dataset file as is")
+    parser.add_argument("--discount", type=float, default=0.95, help="value of a result one move later")
+    parser.add_argument("--epochs", type=int, default=300)
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--lr", type=float, default=1e-2)
+    parser.add_argument("--init", metavar="PATH", help="start from an existing policy")
+    parser.add_argument("--out", default="dqn_pretrained.pt",
+                        help="where to save the policy (the game plays dqn_policy.pt)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.time()
+    if not args.reuse:
+        if os.path.exists(args.dataset):
+            os.remove(args.dataset)
+        if args.from_log:
+            rows = write_game_log_dataset(args.dataset, args.from_log, args.discount)
+        else:
+            rows = write_solver_dataset(args.dataset, args.discount)
+        print(f"Wrote {rows:,} labeled positions -> {args.dataset} ({time.time() - start:.1f} s)")
+    data = open_dataset(args.dataset)
+
+    cfg = DQNConfig(verbose=False)
+    agent = DQNAgent(cfg)
+    if args.init:
+        agent.load(args.init)
+
+    report_every = max(1, args.epochs // 10)
+
+    def progress(epoch, loss):
+        if epoch % report_every == 0 or epoch == args.epochs:
+            print(f"Epoch {epoch}/{args.epochs} | loss {loss:.4f}")
+
+    t = time.time()
+    pretrain(agent, data, args.epochs, args.batch_size, args.lr, args.seed, progress)
+    print(f"Trained on {len(data):,} positions in {time.time() - t:.1f} s")
+
+    agent.save(args.out)
+    print(f"Saved DQN policy -> {args.out}")
+    for mark in ("X", "O"):
+        worst = exploitability(agent, mark).result
+        score = expected_result(agent, mark).score
+        print(f"  as {mark}: worst case {worst}, score vs random {score:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tests for the head-to-head arena
+"""
+
+import sys
+import os
+import random
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.agents import load_agent, parse_spec, RandomAgent
+from tictactoe_package.arena import play_match, play_game, wilson_interval, MatchResult, ResultCache
+from tictactoe_package.rl_agent import RLAgent, board_to_state
+from tictactoe_package.sprt import run_sprt, sprt_llr
+
+
+class _RecordingAgent(RandomAgent):
+    """Random agent that remembers which marks it played"""
+
+    def __init__(self):
+        self.marks = set()
+
+    def pick_move(self, board, current_player, rng=None):
+        self.marks.add(current_player)
+        return super().pick_move(board, current_player, rng)
+
+
+def test_parse_spec():
+    """Test agent spec parsing and default policy paths"""
+    assert parse_spec("rl") == ("rl", "q_table.json")
+    assert parse_spec("dq:new.pt") == ("dq", "new.pt")
+    assert parse_spec("random") == ("random", None)
+    try:
+        parse_spec("minimax")
+        assert False, "Unknown kinds should be rejected"
+    except ValueError:
+        pass
+    print("✓ Agent spec parsing test passed")
+
+
+def test_match_alternates_colours():
+    """Test that both agents play both colours"""
+    print("\n✓ Testing colour alternation...")
+
+    a, b = _RecordingAgent(), _RecordingAgent()
+    result = play_match(a, b, 10, seed=3)
+    assert result.games == 10, "All games should be counted"
+    assert a.marks == {'X', 'O'} and b.marks == {'X', 'O'}, "Both agents should play both colours"
+
+    print("  ✓ Colours alternate between games")
+
+
+def test_smart_beats_random():
+    """Test that the smart agent clearly outscores the random agent"""
+    print("\n✓ Testing smart vs random...")
+
+    result = play_match(load_agent("smart"), load_agent("random"), 400, seed=1)
+    lo, hi = result.score_interval()
+    assert lo > 0.8, f"Smart agent should score well above 0.8, got CI ({lo:.3f}, {hi:.3f})"
+    assert result.losses < result.wins, "Smart agent should win far more than it loses"
+
+    print("  ✓ Smart agent beats random with a tight confidence interval")
+
+
+def test_confidence_intervals():
+    """Test Wilson and score intervals"""
+    lo, hi = wilson_interval(50, 100)
+    assert 0.39 < lo < 0.41 and 0.59 < hi < 0.61, f"Unexpected Wilson interval ({lo}, {hi})"
+    assert wilson_interval(0, 20)[0] == 0.0, "Lower bound of 0/n should be 0"
+    even = MatchResult(wins=10, draws=80, losses=10)
+    assert even.score == 0.5 and abs(even.elo_difference()) < 1e-9
+    lo, hi = even.score_interval()
+    assert lo < 0.5 < hi
+    print("✓ Confidence interval test passed")
+
+
+def test_deterministic_tie_breaking():
+    """Test that deterministic RL agents break ties by lowest position"""
+    agent = RLAgent(deterministic=True)
+    s = board_to_state([' '] * 9, 'X')
+    agent.q[(s, 3)] = 0.5
+    agent.q[(s, 7)] = 0.5
+    assert all(agent.best_action(s, list(range(9))) == 3 for _ in range(20)), "Ties should go to position 3"
+    assert RLAgent().fingerprint() != agent.fingerprint(), "Different tables should differ"
+    print("✓ Deterministic tie-breaking test passed")
+
+
+def test_deterministic_games_are_cached():
+    """Test that deterministic matchups are only played once per colour/opening"""
+    print("\n✓ Testing result cache for deterministic agents...")
+
+    a, b = RLAgent(deterministic=True), RLAgent(deterministic=True)
+    b.q[(board_to_state([' '] * 9, 'X'), 4)] = 1.0
+    cache = ResultCache()
+    result = play_match(a, b, 50, cache=cache)
+    assert result.games == 50
+    assert cache.misses == 2 and cache.hits == 48, f"Expected 2 played games, got {cache.misses}"
+
+    winner = play_game(a, b, opening=(0, 4), cache=cache)
+    assert cache.misses == 3, "A new opening is a new cache entry"
+    assert play_game(a, b, opening=(0, 4), cache=cache) == winner and cache.misses == 3
+
+    # Stochastic agents are never cached
+    play_match(RLAgent(), RandomAgent(), 10, cache=cache)
+    assert cache.misses == 3 and len(cache) == 3, "Stochastic games must be played out"
+
+    print("  ✓ Deterministic games are replayed from the cache")
+
+
+def test_seeded_match_leaves_global_random_alone():
+    """Test that a seeded match is reproducible without reseeding the global RNG"""
+    random.seed(5)
+    expected = random.random()
+    random.seed(5)
+    first = play_match(RandomAgent(), load_agent("smart"), 40, seed=9)
+    assert random.random() == expected, "the caller's random sequence should be untouched"
+    assert play_match(RandomAgent(), load_agent("smart"), 40, seed=9) == first
+    print("✓ Seeded match RNG test passed")
+
+
+def test_sprt_llr_sign():
+    """Test that the LLR favours the hypothesis closer to the observed score"""
+    strong = MatchResult(wins=60, draws=20, losses=20)
+    even = MatchResult(wins=30, draws=40, losses=30)
+    assert sprt_llr(strong, 0, 50) > 0, "A clearly winning record should favour H1"
+    assert sprt_llr(even, 0, 50) < 0, "An even record should favour H0"
+    assert sprt_llr(MatchResult(), 0, 50) == 0.0
+    print("✓ SPRT log-likelihood ratio test passed")
+
+
+def test_sprt_stops_early_on_clear_results():
+    """Test that a clear-cut comparison needs only a handful of games"""
+    print("\n✓ Testing SPRT early stopping...")
+
+    outcome = run_sprt(load_agent("smart"), load_agent("random"), elo0=0, elo1=50, batch=10, seed=1)
+    assert outcome.decision == 'H1', f"Smart should be accepted as stronger, got {outcome.decision}"
+    assert outcome.result.games <= 40, f"Clear result should stop early, took {outcome.result.games} games"
+
+    outcome = run_sprt(load_agent("random"), load_agent("smart"), elo0=0, elo1=50, batch=10, seed=1)
+    assert outcome.decision == 'H0', "Random should not be accepted as stronger than smart"
+
+    random.seed(5)
+    expected = random.random()
+    random.seed(5)
+    again = run_sprt(load_agent("random"), load_agent("smart"), elo0=0, elo1=50, batch=10, seed=1)
+    assert random.random() == expected, "a seeded SPRT run should not reseed the global RNG"
+    assert again.result == outcome.result
+
+    print(f"  ✓ Decided in {outcome.result.games} games")
+
+
+def run_all_tests():
+    """Run all arena tests"""
+    print("\nRunning Arena Tests...")
+    print("=" * 60)
+
+    test_parse_spec()
+    test_confidence_intervals()
+    test_match_alternates_colours()
+    test_smart_beats_random()
+    test_deterministic_tie_breaking()
+    test_deterministic_games_are_cached()
+    test_seeded_match_leaves_global_random_alone()
+    test_sprt_llr_sign()
+    test_sprt_stops_early_on_clear_results()
+
+    print("=" * 60)
+    print("All arena tests passed! ✓")
+    print()
+
+
+if __name__ == "__main__":
+    run_all_tests()
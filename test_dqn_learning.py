@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for the DQN learning schedule and replay augmentation
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.dqn_agent import DQNAgent, DQNConfig, encode_board, legal_mask
+from tictactoe_package.game import TicTacToe
+from tictactoe_package.symmetry import SYMMETRIES, transform_board
+import torch
+
+
+def _fill_buffer(agent, n):
+    """Store n simple transitions from the empty board"""
+    env = TicTacToe()
+    s = encode_board(env.board, 'X')
+    for i in range(n):
+        a = i % 9
+        board = env.board.copy()
+        board[a] = 'X'
+        agent.remember(s, a, -0.01, encode_board(board, 'O'), False, legal_mask(board))
+
+
+def test_maybe_learn_respects_learn_every():
+    """Test that learning only happens every K env steps"""
+    print("\n✓ Testing learn_every schedule...")
+
+    cfg = DQNConfig(verbose=False, batch_size=8, start_training_after=0, learn_every=4,
+                    gradient_steps=3)
+    agent = DQNAgent(cfg)
+    _fill_buffer(agent, 16)
+
+    taken = []
+    for _ in range(8):
+        agent.step_count += 1
+        taken.append(agent.maybe_learn())
+
+    assert taken == [0, 0, 0, 3, 0, 0, 0, 3], f"Unexpected schedule: {taken}"
+    assert agent.grad_steps == 6, f"Expected 6 gradient steps, got {agent.grad_steps}"
+
+    losses = []
+    learn = agent.learn
+    agent.learn = lambda: losses.append(learn()) or losses[-1]
+    agent.step_count += 4
+    assert agent.maybe_learn() == 3
+    assert abs(agent.round_loss - sum(losses) / 3) < 1e-9, "the round reports its mean loss"
+
+    print("  ✓ Learning runs G gradient steps every K env steps")
+
+
+def test_maybe_learn_waits_for_warmup():
+    """Test that no gradient steps happen before the warm-up is over"""
+    print("\n✓ Testing warm-up is respected...")
+
+    cfg = DQNConfig(verbose=False, batch_size=8, start_training_after=100)
+    agent = DQNAgent(cfg)
+    _fill_buffer(agent, 16)
+
+    agent.step_count = 10
+    assert agent.maybe_learn() == 0, "Should not learn during warm-up"
+    assert agent.learn() is None, "learn() should return None when it cannot learn"
+
+    print("  ✓ Warm-up correctly delays learning")
+
+
+def test_target_sync_with_sparse_learning():
+    """Test that the target network is still synced when learning is sparse"""
+    print("\n✓ Testing target sync with learn_every > 1...")
+
+    cfg = DQNConfig(verbose=False, batch_size=8, start_training_after=0, learn_every=7,
+                    target_sync_every=10)
+    agent = DQNAgent(cfg)
+    _fill_buffer(agent, 16)
+
+    for _ in range(14):
+        agent.step_count += 1
+        agent.maybe_learn()
+
+    # Step 14 is the first learning round at or past 10 steps since the last sync
+    assert agent._last_sync_step == 14, f"Expected a sync at step 14, got {agent._last_sync_step}"
+
+    print("  ✓ Target network sync is not skipped")
+
+
+def test_symmetry_augment_matches_transformed_boards():
+    """Test that batch augmentation equals encoding each transformed board"""
+    print("\n✓ Testing symmetry-augmented batches...")
+
+    cfg = DQNConfig(verbose=False)
+    agent = DQNAgent(cfg)
+
+    board = ['X', ' ', ' ', ' ', 'O', ' ', ' ', ' ', ' ']
+    action = 1
+    after = board.copy()
+    after[action] = 'X'
+
+    s = encode_board(board, 'X').unsqueeze(0)
+    s_next = encode_board(after, 'O').unsqueeze(0)
+    a = torch.tensor([action])
+    r = torch.tensor([-0.01])
+    done = torch.tensor([0.0])
+    mask_next = legal_mask(after).unsqueeze(0)
+
+    s8, a8, r8, s_next8, done8, mask8 = agent._augment(s, a, r, s_next, done, mask_next)
+    assert s8.shape == (8, 28) and a8.shape == (8,), "Batch should grow 8x"
+
+    for g, perm in enumerate(SYMMETRIES):
+        b = transform_board(board, perm)
+        b_after = transform_board(after, perm)
+        assert torch.equal(s8[g], encode_board(b, 'X')), f"State mismatch for symmetry {g}"
+        assert torch.equal(s_next8[g], encode_board(b_after, 'O')), f"Next state mismatch for symmetry {g}"
+        assert torch.equal(mask8[g], legal_mask(b_after)), f"Mask mismatch for symmetry {g}"
+        played = [i for i in range(9) if b[i] == ' ' and b_after[i] == 'X']
+        assert played == [int(a8[g])], f"Action mismatch for symmetry {g}"
+    assert torch.all(r8 == r[0]) and torch.all(done8 == 0.0), "Rewards and done flags are invariant"
+
+    print("  ✓ Augmented states, actions and masks are consistent")
+
+
+def test_train_leaves_callers_config_alone():
+    """Test that train() works on a copy of the config it is given"""
+    from train_dqn import train
+    cfg = DQNConfig(verbose=True, device="cpu", batch_size=4, start_training_after=0)
+    with tempfile.TemporaryDirectory() as tmp:
+        agent = train(episodes=2, cfg=cfg, policy_path=os.path.join(tmp, "policy.pt"))
+    assert cfg.verbose, "the caller's config must not be changed"
+    assert not agent.cfg.verbose and agent.explain_subscribers == []
+    print("✓ Training config copy test passed")
+
+
+def run_all_tests():
+    """Run all DQN learning schedule tests"""
+    print("\nRunning DQN Learning Schedule Tests...")
+    print("=" * 60)
+
+    test_maybe_learn_respects_learn_every()
+    test_maybe_learn_waits_for_warmup()
+    test_target_sync_with_sparse_learning()
+    test_symmetry_augment_matches_transformed_boards()
+    test_train_leaves_callers_config_alone()
+
+    print("=" * 60)
+    print("All DQN learning schedule tests passed! ✓")
+    print()
+
+
+if __name__ == "__main__":
+    run_all_tests()
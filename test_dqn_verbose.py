@@ -10,8 +10,10 @@ from io import StringIO
 # Add the parent directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from tictactoe_package.dqn_agent import DQNAgent, DQNConfig
+from tictactoe_package import GameController
+from tictactoe_package.dqn_agent import DQNAgent, DQNConfig, ExplainLog
 from tictactoe_package.game import TicTacToe
+from tictactoe_package.player import PlayerInput
 
 
 def test_verbose_true_prints_why():
@@ -198,6 +200,79 @@ def test_multiple_moves_with_verbose():
         sys.stdout = original_stdout
 
 
+def test_explain_log_records_without_printing():
+    """
+    Test that an ExplainLog subscriber records decisions silently
+    """
+    print("\n✓ Testing ExplainLog subscriber...")
+
+    cfg = DQNConfig()
+    cfg.verbose = False
+    agent = DQNAgent(cfg)
+    log = ExplainLog(maxlen=2)
+    agent.subscribe_explain(log)
+
+    env = TicTacToe()
+    env.board = ['X', 'O', ' ', ' ', ' ', ' ', ' ', ' ', ' ']
+
+    original_stdout = sys.stdout
+    captured = StringIO()
+    sys.stdout = captured
+    try:
+        for _ in range(3):
+            position = agent.select_action(env.board, 'X', explore=False)
+    finally:
+        sys.stdout = original_stdout
+
+    assert captured.getvalue() == "", "ExplainLog should not print anything"
+    assert len(log) == 2, f"Ring buffer should keep only 2 records, got {len(log)}"
+    expl = log.records[-1]
+    assert expl.action == position, "Explanation should record the chosen action"
+    assert len(expl.candidates) == 3, "Explanation should record the top 3 candidates"
+    assert all(expl.board[i] == ' ' for i, _ in expl.candidates), "Candidates must be legal"
+    assert expl.candidates[0][0] == position, "Best candidate should be the chosen action"
+
+    agent.unsubscribe_explain(log)
+    agent.select_action(env.board, 'X', explore=False)
+    assert len(log) == 2, "Unsubscribed log should not receive new records"
+
+    print("  ✓ ExplainLog records top candidates without printing")
+
+
+def test_controller_explains_from_the_move_itself():
+    """
+    Test that interactive play explains the AI move with a single forward pass
+    """
+    print("\n✓ Testing controller explanations...")
+
+    agent = DQNAgent(DQNConfig(verbose=False, device="cpu"))
+    forwards = []
+    agent.qnet.register_forward_hook(lambda *args: forwards.append(1))
+    saved = PlayerInput._ai_kind
+    PlayerInput._ai_kind = "dq"
+    original_stdout = sys.stdout
+    try:
+        for quiet in (False, True):
+            controller = GameController()
+            controller._dq_agent = agent
+            controller.quiet = quiet
+            controller.game.board = ['X', 'O', ' ', ' ', ' ', ' ', ' ', ' ', ' ']
+            forwards.clear()
+            sys.stdout = captured = StringIO()
+            try:
+                position = controller._get_ai_move()
+            finally:
+                sys.stdout = original_stdout
+            assert len(forwards) == 1, f"expected one forward pass, got {len(forwards)}"
+            assert ("[Why]" in captured.getvalue()) != quiet, captured.getvalue()
+            assert agent.explain_subscribers == [], "the controller must not stay subscribed"
+            assert 0 <= position < 9
+    finally:
+        PlayerInput._ai_kind = saved
+
+    print("  ✓ One forward pass per move, explained only in interactive play")
+
+
 def run_all_tests():
     """Run all verbose parameter tests"""
     print("\nRunning DQN Verbose Parameter Tests...")
@@ -208,6 +283,8 @@ def run_all_tests():
     test_verbose_false_no_print()
     test_pick_move_respects_verbose()
     test_multiple_moves_with_verbose()
+    test_explain_log_records_without_printing()
+    test_controller_explains_from_the_move_itself()
     
     print("=" * 60)
     print("All verbose parameter tests passed! ✓")
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for exact policy evaluation
+"""
+
+import sys
+import os
+from functools import lru_cache
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.exact_eval import (
+    exploitability, expected_result, winner_of, other, format_line, uniform_random_distribution
+)
+from tictactoe_package.heuristic import smart_move_distribution
+
+
+@lru_cache(maxsize=None)
+def _negamax(board, mark):
+    """Game value for the player to move"""
+    if winner_of(board) is not None:
+        return -1
+    if ' ' not in board:
+        return 0
+    return max(-_negamax(board[:i] + (mark,) + board[i + 1:], other(mark))
+               for i in range(9) if board[i] == ' ')
+
+
+class _PerfectAgent:
+    def pick_move(self, board, current_player):
+        b = tuple(board)
+        return max((i for i in range(9) if b[i] == ' '),
+                   key=lambda i: -_negamax(b[:i] + (current_player,) + b[i + 1:], other(current_player)))
+
+
+class _FirstEmptyAgent:
+    def pick_move(self, board, current_player):
+        return board.index(' ')
+
+
+def test_perfect_agent_is_unexploitable():
+    """Test that a minimax agent draws against any adversary"""
+    print("\n✓ Testing perfect agent...")
+
+    for mark in ('X', 'O'):
+        report = exploitability(_PerfectAgent(), mark)
+        assert report.worst_case == 0, f"Perfect agent as {mark} should draw, got {report.result}"
+        assert report.losing_lines == [], "Perfect agent should have no losing lines"
+
+    print("  ✓ Perfect agent's worst case is a draw as X and as O")
+
+
+def test_weak_agent_losing_lines():
+    """Test that losing lines are real, complete losses"""
+    print("\n✓ Testing losing lines of a weak agent...")
+
+    report = exploitability(_FirstEmptyAgent(), 'O')
+    assert report.worst_case == -1, "First-empty agent should be beatable as O"
+    assert report.losing_lines, "Losing lines should be listed"
+    for line in report.losing_lines:
+        board = [' '] * 9
+        mark = 'X'
+        for move in line:
+            board[move] = mark
+            mark = other(mark)
+        assert winner_of(tuple(board)) == 'X', f"Line {format_line(line)} should end in an X win"
+    assert len(set(report.losing_lines)) == len(report.losing_lines), "Lines should be unique"
+
+    print(f"  ✓ {len(report.losing_lines)} losing lines, all ending in a loss")
+
+
+def test_illegal_move_is_a_loss():
+    """Test that an agent returning an occupied cell forfeits"""
+    class Stubborn:
+        def pick_move(self, board, current_player):
+            return 0
+    report = exploitability(Stubborn(), 'X')
+    assert report.worst_case == -1, "Illegal moves should count as a loss"
+    print("✓ Illegal move test passed")
+
+
+def test_expected_result_against_random():
+    """Test exact probabilities against known values and simple cases"""
+    print("\n✓ Testing exact results against stochastic opponents...")
+
+    # First-empty as O against a uniformly random X (checked against 100k simulated games)
+    r = expected_result(_FirstEmptyAgent(), 'O')
+    assert abs(r.win + r.draw + r.loss - 1.0) < 1e-12, "Probabilities should sum to 1"
+    assert abs(r.win - 0.4402116) < 1e-6 and abs(r.draw - 0.0380952) < 1e-6, f"Unexpected result {r}"
+
+    # A perfect agent never loses to either opponent
+    for opponent in (uniform_random_distribution, smart_move_distribution):
+        for mark in ('X', 'O'):
+            r = expected_result(_PerfectAgent(), mark, opponent)
+            assert r.loss < 1e-12, f"Perfect agent as {mark} should never lose, got {r}"
+
+    print("  ✓ Exact probabilities are consistent")
+
+
+def test_smart_move_distribution():
+    """Test that the smart opponent's distribution follows its priorities"""
+    assert smart_move_distribution(['O', 'O', ' ', 'X', 'X', ' ', ' ', ' ', ' '], 'O') == {2: 1.0}
+    assert smart_move_distribution(['X'] + [' '] * 8, 'O') == {4: 1.0}
+    dist = smart_move_distribution([' '] * 4 + ['X'] + [' '] * 4, 'O')
+    assert dist == {0: 0.25, 2: 0.25, 6: 0.25, 8: 0.25}
+    print("✓ Smart move distribution test passed")
+
+
+def run_all_tests():
+    """Run all exact evaluation tests"""
+    print("\nRunning Exact Evaluation Tests...")
+    print("=" * 60)
+
+    test_perfect_agent_is_unexploitable()
+    test_weak_agent_losing_lines()
+    test_illegal_move_is_a_loss()
+    test_smart_move_distribution()
+    test_expected_result_against_random()
+
+    print("=" * 60)
+    print("All exact evaluation tests passed! ✓")
+    print()
+
+
+if __name__ == "__main__":
+    run_all_tests()
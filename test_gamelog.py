@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the binary game-record log
+"""
+
+import sys
+import os
+import random
+import tempfile
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package import GameController
+from tictactoe_package.agents import RandomAgent, SmartAgent
+from tictactoe_package.arena import play_match
+from tictactoe_package.exact_eval import winner_of
+from tictactoe_package.gamelog import GameLogWriter, GameRecord, read_games
+from tictactoe_package.player import PlayerInput
+from tictactoe_package.rl_agent import RLAgent
+from tictactoe_package.tournament import run_tournament
+
+
+def _replay(game):
+    """Winner of a record's moves, checked from scratch"""
+    board = [' '] * 9
+    mark = game.starting
+    for move in game.moves:
+        assert board[move] == ' ', "moves must be legal"
+        board[move] = mark
+        mark = 'O' if mark == 'X' else 'X'
+    return winner_of(tuple(board))
+
+
+def test_round_trip():
+    """Test that records survive writing and reading, across writer sessions"""
+    rng = random.Random(0)
+    records = [
+        GameRecord((4, 0, 8, 2, 1, 7, 6, 3, 5), None, 'X', "rl", "dq", 12345678901, 0),
+        GameRecord((0, 3, 1, 4, 2), 'X', 'O', "smart", "random", None, None),
+        GameRecord((), None, 'X', "", "", 7, 2 ** 40),
+    ]
+    for i in range(200):
+        moves = tuple(rng.sample(range(9), rng.randint(5, 9)))
+        records.append(GameRecord(moves, rng.choice(['X', 'O', None]), rng.choice("XO"),
+                                  rng.choice(["rl", "dq", "smärt"]), "rl", 99 if i < 100 else 5, i))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "games.ttt")
+        with GameLogWriter(path) as writer:
+            for record in records[:100]:
+                writer.write(record)
+        with GameLogWriter(path) as writer:  # a second session appends
+            for record in records[100:]:
+                writer.write(record)
+        assert list(read_games(path)) == records
+        size = os.path.getsize(path)
+        assert size < 10 * len(records), f"expected a compact log, got {size} bytes"
+
+        with open(path, "ab") as f:
+            f.write(bytes([0x09, 0x02, 0x00]))  # truncated final record
+        assert len(list(read_games(path))) == len(records)
+    print(f"✓ Round-trip test passed ({size / len(records):.1f} bytes/game)")
+
+
+def test_tournament_and_match_logging():
+    """Test that auto games and arena matches produce replayable records"""
+    PlayerInput._ai_kind = "random"
+    controller = GameController()
+    controller.num_human_players = 0
+    games = []
+    totals = run_tournament(controller, 100, seed=3, record=games.append)
+    assert len(games) == 100 and [g.index for g in games] == list(range(100))
+    assert all(g.seed == 3 for g in games)
+    assert sum(g.result == 'X' for g in games) == totals['X']
+    assert all(_replay(g) == g.result for g in games)
+
+    match = []
+    result = play_match(SmartAgent(), RandomAgent(), 20, seed=1, record=match.append,
+                        names=("smart", "random"))
+    assert len(match) == 20 and match[1].agent_x == "random" and match[1].agent_o == "smart"
+    assert all(_replay(g) == g.result for g in match)
+    wins = sum((g.result == 'X') == (g.agent_x == "smart") and g.result is not None for g in match)
+    assert wins == result.wins
+    print("✓ Tournament and match logging test passed")
+
+
+def test_training_logging():
+    """Test that self-play training logs every episode"""
+    games = []
+    RLAgent().train_self_play(episodes=50, record=games.append)
+    assert len(games) == 50 and games[-1].index == 50
+    assert all(_replay(g) == g.result for g in games)
+    print("✓ Training logging test passed")
+
+
+def run_all_tests():
+    """Run all game log tests"""
+    print("Running game log tests...\n")
+    test_round_trip()
+    test_tournament_and_match_logging()
+    test_training_logging()
+    print("\n✅ All game log tests passed!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the table-driven smart opponent
+"""
+
+import sys
+import os
+import random
+from itertools import product
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.heuristic import (
+    LINES, check_winning_move, smart_opponent_move, smart_move_distribution, board_to_masks
+)
+
+
+def _reference_winning_cells(board, player):
+    """All cells that complete a line for player, computed the slow way"""
+    cells = set()
+    for combo in LINES:
+        values = [board[i] for i in combo]
+        if values.count(player) == 2 and values.count(' ') == 1:
+            cells.add(combo[values.index(' ')])
+    return cells
+
+
+def test_winning_move_matches_reference():
+    """Test the lookup table against a line scan on every board"""
+    print("\n✓ Testing winning-move table on all boards...")
+
+    for cells in product(' XO', repeat=9):
+        board = list(cells)
+        for player in ('X', 'O'):
+            expected = _reference_winning_cells(board, player)
+            got = check_winning_move(board, player)
+            if expected:
+                assert got in expected, f"{board} {player}: got {got}, expected one of {expected}"
+            else:
+                assert got is None, f"{board} {player}: got {got}, expected None"
+
+    print("  ✓ Winning-move lookups match a full line scan")
+
+
+def test_smart_opponent_priorities():
+    """Test win > block > center > corner ordering"""
+    print("\n✓ Testing smart opponent priorities...")
+
+    # O can win at 2 and must prefer that over blocking X at 5
+    board = ['O', 'O', ' ', 'X', 'X', ' ', ' ', ' ', ' ']
+    assert smart_opponent_move(board, 'O') == 2, "Should take the win"
+    # X must block O at 2
+    board = ['O', 'O', ' ', 'X', ' ', ' ', ' ', ' ', ' ']
+    assert smart_opponent_move(board, 'X') == 2, "Should block"
+    # Empty center is taken
+    board = ['X', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ']
+    assert smart_opponent_move(board, 'O') == 4, "Should take the center"
+    # Otherwise a corner
+    board = [' ', ' ', ' ', ' ', 'X', ' ', ' ', ' ', ' ']
+    assert smart_opponent_move(board, 'O', random.Random(0)) in (0, 2, 6, 8), "Should take a corner"
+    # Full board
+    assert smart_opponent_move(['X'] * 9, 'O') is None, "No move on a full board"
+
+    print("  ✓ Smart opponent follows its priorities")
+
+
+def test_moves_follow_distribution():
+    """Test that every sampled move has positive probability in the distribution"""
+    rng = random.Random(5)
+    for cells in product(' XO', repeat=9):
+        board = list(cells)
+        dist = smart_move_distribution(board, 'O')
+        assert abs(sum(dist.values()) - 1.0) < 1e-9 or not dist
+        for _ in range(3):
+            move = smart_opponent_move(board, 'O', rng)
+            assert (move is None) == (not dist) and (move is None or move in dist), board
+    print("✓ Move/distribution agreement test passed")
+
+
+def test_board_to_masks():
+    """Test bitmask conversion"""
+    board = ['X', 'O', ' ', ' ', 'X', ' ', ' ', ' ', 'O']
+    own, opp = board_to_masks(board, 'X')
+    assert own == 0b000010001 and opp == 0b100000010, f"Unexpected masks {own:b} {opp:b}"
+    print("✓ Board to masks test passed")
+
+
+def run_all_tests():
+    """Run all heuristic opponent tests"""
+    print("\nRunning Heuristic Opponent Tests...")
+    print("=" * 60)
+
+    test_board_to_masks()
+    test_winning_move_matches_reference()
+    test_smart_opponent_priorities()
+    test_moves_follow_distribution()
+
+    print("=" * 60)
+    print("All heuristic opponent tests passed! ✓")
+    print()
+
+
+if __name__ == "__main__":
+    run_all_tests()
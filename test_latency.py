@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for AI move latency instrumentation
+"""
+
+import sys
+import os
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package import GameController
+from tictactoe_package.latency import LatencyHistogram, LatencyRecorder, format_latency
+from tictactoe_package.player import PlayerInput
+
+
+def test_histogram_percentiles():
+    """Test that percentiles land in the right buckets"""
+    hist = LatencyHistogram()
+    for _ in range(90):
+        hist.record(10e-6)
+    for _ in range(10):
+        hist.record(5e-3)
+    assert hist.count == 100
+    assert 10e-6 <= hist.percentile(50) < 15e-6, f"p50 should be ~10us, got {hist.percentile(50)}"
+    assert hist.percentile(99) == 5e-3, "p99 should be clamped to the observed maximum"
+    assert LatencyHistogram().percentile(50) == 0.0
+    assert [format_latency(t) for t in (12e-6, 3.5e-3, 2.0)] == ["12.0 us", "3.50 ms", "2.00 s"]
+    print("✓ Histogram percentile test passed")
+
+
+def test_recorder_merge():
+    """Test merging recorders from several workers"""
+    a, b = LatencyRecorder(), LatencyRecorder()
+    a.record_move("rl", 1e-5)
+    b.record_move("rl", 2e-5)
+    b.record_move("dq", 1e-4)
+    b.record_load("dq", 0.5)
+    a.merge(b)
+    data = a.as_dict()
+    assert data["moves"]["rl"]["count"] == 2 and data["moves"]["dq"]["count"] == 1
+    assert data["loads"] == {"dq": [0.5]}
+    print("✓ Recorder merge test passed")
+
+
+def test_controller_records_moves_and_loads():
+    """Test that the controller times AI moves and policy loads separately"""
+    print("\n✓ Testing controller latency instrumentation...")
+
+    PlayerInput._ai_kind = "rl"
+    controller = GameController()
+    controller.num_human_players = 0
+    for _ in range(5):
+        controller.play_game_auto()
+
+    data = controller.latency.as_dict()
+    assert data["moves"]["rl"]["count"] >= 5 * 5, "Every AI move should be recorded"
+    assert len(data["loads"]["rl"]) == 1, "The policy should be loaded (and timed) once"
+    assert "p95" in controller.latency.report()
+
+    print("  ✓ Move latency and load time are recorded per agent kind")
+
+
+def test_auto_games_cache_only_when_deterministic():
+    """Test that DQN auto games are replayed from the cache only with --deterministic"""
+    PlayerInput._ai_kind = "dq"
+    try:
+        controller = GameController()
+        controller.num_human_players = 0
+        for _ in range(6):
+            controller.play_game_auto()
+        assert controller.result_cache.hits == 0, "caching must be opt-in"
+        assert controller.latency.as_dict()["moves"]["dq"]["count"] >= 6 * 5
+
+        controller.deterministic = True
+        for _ in range(6):
+            controller.play_game_auto()
+        assert controller.result_cache.hits >= 4, "at most two distinct games per agent"
+    finally:
+        PlayerInput._ai_kind = "rl"
+    print("✓ Deterministic result cache test passed")
+
+
+def run_all_tests():
+    """Run all latency tests"""
+    print("\nRunning Latency Tests...")
+    print("=" * 60)
+
+    test_histogram_percentiles()
+    test_recorder_merge()
+    test_controller_records_moves_and_loads()
+    test_auto_games_cache_only_when_deterministic()
+
+    print("=" * 60)
+    print("All latency tests passed! ✓")
+    print()
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the round-robin league
+"""
+
+import sys
+import os
+import json
+import tempfile
+import warnings
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.arena import MatchResult
+from tictactoe_package.dqn_agent import DQNAgent, DQNConfig
+from tictactoe_package.league import fit_elo, run_league, discover_entrants, PairingCache
+from tictactoe_package.rl_agent import RLAgent, board_to_state
+
+
+def _save_policy(path, opening_move):
+    """Save a tiny Q-table that prefers one opening move"""
+    agent = RLAgent()
+    agent.q[(board_to_state([' '] * 9, 'X'), opening_move)] = 1.0
+    agent.save(path)
+
+
+def test_fit_elo_orders_players():
+    """Test that the Elo fit ranks a stronger player higher"""
+    results = {
+        ("a", "b"): MatchResult(wins=70, draws=20, losses=10),
+        ("b", "c"): MatchResult(wins=70, draws=20, losses=10),
+    }
+    ratings = fit_elo(["a", "b", "c"], results)
+    assert ratings["a"][0] > ratings["b"][0] > ratings["c"][0], f"Unexpected order: {ratings}"
+    even = fit_elo(["x", "y"], {("x", "y"): MatchResult(wins=10, draws=0, losses=10)})
+    assert abs(even["x"][0] - even["y"][0]) < 1e-6, "Even results should give equal ratings"
+    print("✓ Elo fit test passed")
+
+
+def test_pairing_cache_is_symmetric():
+    """Test that cached pairings are found in either order"""
+    cache = PairingCache(None)
+    cache.put("bbb", "aaa", 10, MatchResult(wins=6, draws=3, losses=1))
+    assert cache.get("bbb", "aaa", 10) == MatchResult(6, 3, 1)
+    assert cache.get("aaa", "bbb", 10) == MatchResult(1, 3, 6)
+    assert cache.get("aaa", "bbb", 20) is None, "Game count is part of the key"
+    print("✓ Pairing cache symmetry test passed")
+
+
+def test_league_only_plays_new_pairings():
+    """Test that adding a checkpoint only plays its new pairings"""
+    print("\n✓ Testing league caching...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "league.cache")
+        _save_policy(os.path.join(tmp, "center.json"), 4)
+        _save_policy(os.path.join(tmp, "corner.json"), 0)
+
+        played = []
+        progress = lambda a, b, r: played.append((a, b))
+        ratings, results = run_league(tmp, 20, cache_path=cache_path, progress=progress)
+        assert len(played) == 1 and len(results) == 1 and len(ratings) == 2
+
+        _save_policy(os.path.join(tmp, "edge.json"), 1)
+        played.clear()
+        ratings, results = run_league(tmp, 20, cache_path=cache_path, progress=progress)
+        assert len(results) == 3, "All three pairings should be rated"
+        assert len(played) == 2 and all("edge.json" in p for p in played), \
+            f"Only the new policy's pairings should be played, got {played}"
+
+    print("  ✓ Only new pairings are played")
+
+
+def test_non_q_table_json_is_skipped():
+    """Test that other JSON files next to the policies are not entered"""
+    with tempfile.TemporaryDirectory() as tmp:
+        _save_policy(os.path.join(tmp, "center.json"), 4)
+        cache = PairingCache(os.path.join(tmp, "league_cache.json"))
+        cache.put("aaa", "bbb", 10, MatchResult(wins=6, draws=3, losses=1))
+        cache.save()
+        for name, content in (("config.json", {"episodes": 100}), ("list.json", [1, 2])):
+            with open(os.path.join(tmp, name), "w", encoding="utf-8") as f:
+                json.dump(content, f)
+        with open(os.path.join(tmp, "broken.json"), "w", encoding="utf-8") as f:
+            f.write("{")
+        wide = RLAgent(rows=4, cols=4, k=3)
+        wide.q[(" " * 16 + "|X", 5)] = 1.0
+        wide.save(os.path.join(tmp, "q_table_4x4k3.json"))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            entrants = discover_entrants(tmp)
+        assert [e.name for e in entrants] == ["center.json"]
+        assert len(caught) == 5 and all("not a 3x3 Q-table" in str(w.message) for w in caught)
+    print("✓ Non-Q-table JSON test passed")
+
+
+def test_other_board_networks_are_skipped():
+    """Test that a DQN saved for another board is skipped instead of aborting the league"""
+    with tempfile.TemporaryDirectory() as tmp:
+        _save_policy(os.path.join(tmp, "center.json"), 4)
+        _save_policy(os.path.join(tmp, "corner.json"), 0)
+        DQNAgent(DQNConfig(rows=4, cols=4, k=3, verbose=False, device="cpu")).save(
+            os.path.join(tmp, "dqn_policy_4x4k3.pt"))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            ratings, results = run_league(tmp, 10)
+        assert sorted(ratings) == ["center.json", "corner.json"] and len(results) == 1
+        assert any("dqn_policy_4x4k3.pt" in str(w.message) for w in caught)
+    print("✓ Other-board network test passed")
+
+
+def run_all_tests():
+    """Run all league tests"""
+    print("\nRunning League Tests...")
+    print("=" * 60)
+
+    test_fit_elo_orders_players()
+    test_pairing_cache_is_symmetric()
+    test_league_only_plays_new_pairings()
+    test_non_q_table_json_is_skipped()
+    test_other_board_networks_are_skipped()
+
+    print("=" * 60)
+    print("All league tests passed! ✓")
+    print()
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming training metrics log
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.metrics import TrainingMetrics
+from tictactoe_package.rl_agent import RLAgent
+
+
+def test_self_play_streams_jsonl():
+    """Test that train_self_play writes one record per interval"""
+    print("\n✓ Testing self-play metrics stream...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "metrics.jsonl")
+        agent = RLAgent()
+        with TrainingMetrics(path, log_every=10) as metrics:
+            agent.train_self_play(episodes=35, metrics=metrics)
+
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+
+    assert [r["episode"] for r in records] == [10, 20, 30, 35], "One record per 10 episodes plus a final one"
+    last = records[-1]
+    for key in ("episodes_per_sec", "env_steps_per_sec", "grad_steps_per_sec",
+                "mean_loss", "mean_td_error", "epsilon", "q_size",
+                "time_env", "time_inference", "time_learn"):
+        assert key in last, f"Record should contain {key}"
+    assert last["q_size"] == len(agent.q), "Q-table size should be reported"
+    assert last["env_steps"] >= 35 * 5, "Every game has at least 5 moves"
+    assert last["grad_steps"] >= last["env_steps"], "Every move produces at least one update"
+
+    print("  ✓ Self-play metrics are streamed as JSONL")
+
+
+def test_metrics_file_is_buffered():
+    """Test that records are buffered until close"""
+    print("\n✓ Testing metrics buffering...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "metrics.jsonl")
+        metrics = TrainingMetrics(path, log_every=1)
+        metrics.add_steps(3)
+        metrics.end_episode(epsilon=0.5)
+        assert os.path.getsize(path) == 0, "Small writes should stay in the buffer"
+        metrics.close()
+        with open(path, encoding="utf-8") as f:
+            record = json.loads(f.readline())
+    assert record["env_steps"] == 3 and record["epsilon"] == 0.5
+
+    print("  ✓ Metrics are flushed on close")
+
+
+def run_all_tests():
+    """Run all metrics tests"""
+    print("\nRunning Training Metrics Tests...")
+    print("=" * 60)
+
+    test_self_play_streams_jsonl()
+    test_metrics_file_is_buffered()
+
+    print("=" * 60)
+    print("All training metrics tests passed! ✓")
+    print()
+
+
+if __name__ == "__main__":
+    run_all_tests()
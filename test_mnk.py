@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Tests for m,n,k boards: the engine, encodings and agents beyond 3x3
+"""
+
+import sys
+import os
+import random
+import tempfile
+
+import torch
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.game import TicTacToe, win_lines
+from tictactoe_package.dqn_agent import DQNAgent, DQNConfig, encode_board, legal_mask, input_size
+from tictactoe_package.heuristic import smart_move_mnk
+from tictactoe_package.rl_agent import RLAgent
+from tictactoe_package.symmetry import board_symmetries, transform_board
+
+
+def _brute_winner(board, rows, cols, k):
+    """Reference winner check straight from the board coordinates"""
+    for r in range(rows):
+        for c in range(cols):
+            mark = board[r * cols + c]
+            if mark == ' ':
+                continue
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                cells = [(r + dr * i, c + dc * i) for i in range(k)]
+                if all(0 <= rr < rows and 0 <= cc < cols and board[rr * cols + cc] == mark
+                       for rr, cc in cells):
+                    return mark
+    return None
+
+
+def test_line_tables():
+    """Test the number of winning lines for a few board shapes"""
+    assert len(win_lines(3, 3, 3)) == 8
+    assert len(win_lines(4, 4, 4)) == 10
+    # 5x5, 4 in a row: 2 per row and column, 4 per diagonal direction
+    assert len(win_lines(5, 5, 4)) == 10 + 10 + 4 + 4
+    assert len(win_lines(3, 5, 3)) == 3 * 3 + 5 + 3 + 3
+    print("✓ Line table test passed")
+
+
+def test_classic_defaults():
+    """Test that the default game is still the 3x3 board"""
+    game = TicTacToe()
+    assert (game.rows, game.cols, game.k) == (3, 3, 3)
+    assert game.board == [' '] * 9
+    assert not game.is_valid_move(9)
+    print("✓ Classic default test passed")
+
+
+def test_invalid_shape():
+    """Test that a win length that cannot fit is rejected"""
+    try:
+        TicTacToe(3, 3, 4)
+    except ValueError:
+        print("✓ Invalid shape test passed")
+        return
+    raise AssertionError("k larger than the board should raise")
+
+
+def test_incremental_winner_matches_full_scan():
+    """Test move-by-move winner detection against a brute-force reference"""
+    rng = random.Random(7)
+    for rows, cols, k in ((3, 3, 3), (4, 4, 3), (5, 5, 4), (4, 6, 4), (7, 7, 5)):
+        for _ in range(200):
+            game = TicTacToe(rows, cols, k)
+            while True:
+                game.make_move(rng.choice(game.get_available_positions()))
+                expected = _brute_winner(game.board, rows, cols, k)
+                assert game.check_winner() == expected, (rows, cols, k, game.board)
+                if expected or game.is_board_full():
+                    break
+                game.switch_player()
+    print("✓ Incremental winner test passed")
+
+
+def test_assigned_board_is_rescanned():
+    """Test that assigning a board after play recomputes the winner"""
+    game = TicTacToe(4, 4, 4)
+    game.make_move(0)
+    assert game.check_winner() is None
+    game.board = [' ', ' ', ' ', 'O',
+                  ' ', ' ', 'O', ' ',
+                  ' ', 'O', ' ', ' ',
+                  'O', ' ', ' ', ' ']
+    assert game.check_winner() == 'O'
+    game.reset()
+    assert game.check_winner() is None and len(game.board) == 16
+    print("✓ Board assignment test passed")
+
+
+def test_in_place_edits_are_rescanned():
+    """Test that editing the board in place never leaves a stale winner"""
+    game = TicTacToe()
+    game.board[0] = game.board[1] = game.board[2] = 'X'
+    assert game.check_winner() == 'X'
+
+    game = TicTacToe(4, 4, 3)
+    game.make_move(5)
+    assert game.check_winner() is None
+    game.board[6] = game.board[7] = 'X'
+    assert game.check_winner() == 'X'
+    game.board[7] = ' '
+    assert game.check_winner() is None
+    game.board[5] = ' '               # undo X's move, then let O play there
+    game.switch_player()
+    game.make_move(5)
+    game.board[4] = game.board[6] = 'O'
+    assert game.check_winner() == 'O'
+    print("✓ In-place edit test passed")
+
+
+def test_rectangular_symmetries():
+    """Test that non-square boards keep the 4 symmetries that preserve lines"""
+    syms = board_symmetries(3, 5)
+    assert len(syms) == 4 and syms[0] == list(range(15))
+    board = ['X', 'X', 'X'] + [' '] * 12
+    for perm in syms:
+        assert _brute_winner(transform_board(board, perm), 3, 5, 3) == 'X'
+    assert len(board_symmetries(4, 4)) == 8
+    print("✓ Rectangular symmetry test passed")
+
+
+def test_smart_move_mnk_wins_and_blocks():
+    """Test the generic smart opponent on a 5x5 board with 4 in a row"""
+    board = [' '] * 25
+    for cell in (6, 12, 18):          # O on the main diagonal
+        board[cell] = 'O'
+    for cell in (0, 1, 2):            # X three in the top row
+        board[cell] = 'X'
+    assert smart_move_mnk(board, 'X', 5, 5, 4) == 3, "X should complete its row"
+    board[3] = 'O'
+    assert smart_move_mnk(board, 'X', 5, 5, 4) == 24, "X should block the diagonal"
+    assert smart_move_mnk([' '] * 25, 'X', 5, 5, 4) == 12, "Empty board: take the center"
+    print("✓ Generic smart opponent test passed")
+
+
+def test_dqn_on_larger_board():
+    """Test that the DQN sizes its network from the board and learns on it"""
+    cfg = DQNConfig(rows=4, cols=4, k=3, verbose=False, device="cpu",
+                    batch_size=8, start_training_after=0, symmetry_augment=True)
+    agent = DQNAgent(cfg)
+    assert agent.qnet(torch.zeros(1, input_size(16))).shape == (1, 16)
+
+    board = [' '] * 16
+    board[5] = 'X'
+    assert encode_board(board, 'O').shape == (49,)
+    move = agent.pick_move(board, 'O')
+    assert 0 <= move < 16 and move != 5
+    assert agent.pick_moves([board, ['X'] * 16], ['O', 'O']) == [move, -1]
+
+    for a in range(16):
+        after = board.copy()
+        after[a] = 'O'
+        agent.remember(encode_board(board, 'O'), a, 0.0, encode_board(after, 'X'), False, legal_mask(after))
+    agent.step_count = 1
+    assert agent.learn() is not None
+    print("✓ DQN larger board test passed")
+
+
+def test_memmap_replay_on_larger_board():
+    """Test that a file-backed replay buffer stores 5x5 transitions"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cfg = DQNConfig(rows=5, cols=5, k=4, verbose=False, device="cpu", batch_size=2,
+                        start_training_after=0, replay_path=os.path.join(tmp, "replay.bin"),
+                        buffer_size=16)
+        agent = DQNAgent(cfg)
+        board = [' '] * 25
+        for a in range(4):
+            after = board.copy()
+            after[a] = 'X'
+            agent.remember(encode_board(board, 'X'), a, 1.0, encode_board(after, 'O'), True, legal_mask(after))
+        s, a, r, s_next, done, mask = agent.buffer.sample(2)
+        assert s.shape == (2, 76) and mask.shape == (2, 25)
+        agent.buffer.close()
+    print("✓ Replay larger board test passed")
+
+
+def test_rl_self_play_on_larger_board():
+    """Test that tabular self-play runs on a 4x4 board"""
+    random.seed(0)
+    agent = RLAgent(rows=4, cols=4, k=3)
+    agent.train_self_play(episodes=50)
+    assert agent.q
+    assert all(len(s.split("|")[0]) == 16 for s, _ in agent.q)
+    move = agent.pick_move([' '] * 16, 'X')
+    assert 0 <= move < 16
+    print("✓ RL larger board test passed")
+
+
+def run_all_tests():
+    """Run all m,n,k tests"""
+    print("Running m,n,k board tests...\n")
+    test_line_tables()
+    test_classic_defaults()
+    test_invalid_shape()
+    test_incremental_winner_matches_full_scan()
+    test_assigned_board_is_rescanned()
+    test_in_place_edits_are_rescanned()
+    test_rectangular_symmetries()
+    test_smart_move_mnk_wins_and_blocks()
+    test_dqn_on_larger_board()
+    test_memmap_replay_on_larger_board()
+    test_rl_self_play_on_larger_board()
+    print("\n🎉 All m,n,k tests passed!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
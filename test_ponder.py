@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for pondering in Human vs Computer games
+"""
+
+import sys
+import os
+import time
+from unittest import mock
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package import GameController
+from tictactoe_package.agents import SmartAgent
+from tictactoe_package.player import PlayerInput
+from tictactoe_package.ponder import Ponderer
+
+
+def test_ponderer_precomputes_replies():
+    """Test that replies are ready for every non-final human move"""
+    agent = SmartAgent()
+    seen = []
+
+    def pick(board, mark):
+        seen.append(tuple(board))
+        return agent.pick_move(board, mark)
+
+    ponderer = Ponderer(pick)
+    board = ['X', 'X', ' ',
+             'O', 'O', ' ',
+             ' ', ' ', ' ']
+    ponderer.start(board, 'X', 'O')
+    ponderer._thread.join()
+    assert 2 not in ponderer._replies, "a winning human move needs no reply"
+    assert len(seen) == 4, f"expected 4 pondered branches, got {len(seen)}"
+
+    child = board.copy()
+    child[8] = 'X'
+    assert ponderer.take(8) == agent.pick_move(child, 'O') == 5
+    assert ponderer._replies == {}, "other branches should be dropped"
+    assert ponderer.hits == 1 and ponderer.take(2) is None and ponderer.misses == 1
+    print("✓ Ponderer reply test passed")
+
+
+def test_take_cancels_remaining_branches():
+    """Test that committing a move does not wait for every branch"""
+    calls = []
+
+    def slow_pick(board, mark):
+        calls.append(1)
+        time.sleep(0.05)
+        return board.index(' ')
+
+    ponderer = Ponderer(slow_pick)
+    ponderer.start([' '] * 9, 'X', 'O')
+    time.sleep(0.01)
+    start = time.perf_counter()
+    ponderer.take(0)
+    assert time.perf_counter() - start < 0.2, "take should wait for one branch at most"
+    assert len(calls) < 9, "remaining branches should be cancelled"
+    print("✓ Ponder cancellation test passed")
+
+
+def test_controller_uses_pondered_reply():
+    """Test a Human vs Computer game where every AI reply was pondered"""
+    PlayerInput._ai_kind = "rl"
+    controller = GameController()
+    controller.num_human_players = 1
+    controller.human_player_symbol = 'X'
+    controller.quiet = True
+
+    def human_move(player, validator):
+        return next(i for i in range(9) if validator(i))
+
+    with mock.patch.object(PlayerInput, "get_human_move", side_effect=human_move), \
+            mock.patch("tictactoe_package.controller.GameUI"):
+        controller.play_game()
+    ai_moves = controller.latency.as_dict()["moves"]["rl"]["count"]
+    assert ai_moves >= 1
+    assert controller.ponderer.hits == ai_moves, "every AI reply should come from the ponder cache"
+    print("✓ Controller ponder test passed")
+
+
+def test_pondered_search_reports_its_own_stats():
+    """Test that pondered alpha-beta replies print their stats and record their real cost"""
+    saved = PlayerInput._ai_kind
+    PlayerInput._ai_kind = "ab"
+    try:
+        controller = GameController()
+        controller.num_human_players = 1
+        controller.human_player_symbol = 'X'
+        pick = controller._pick_ai_move
+
+        def slow_pick(board, mark, rng=None):
+            time.sleep(0.02)
+            return pick(board, mark, rng)
+
+        def human_move(player, validator):
+            return next(i for i in range(9) if validator(i))
+
+        with mock.patch.object(PlayerInput, "get_human_move", side_effect=human_move), \
+                mock.patch("tictactoe_package.controller.GameUI"), \
+                mock.patch("builtins.print") as printed:
+            controller.play_game()
+        searches = [c for c in printed.call_args_list if "[Search]" in str(c)]
+        ai_moves = controller.ponderer.hits
+        assert ai_moves >= 1 and len(searches) == ai_moves, "every pondered reply reports its search"
+
+        controller.quiet = True
+        controller._pick_ai_move = slow_pick
+        PlayerInput._ai_kind = "rl"
+        controller.latency.clear()
+        with mock.patch.object(PlayerInput, "get_human_move", side_effect=human_move), \
+                mock.patch("tictactoe_package.controller.GameUI"):
+            controller.play_game()
+        hist = controller.latency.moves["rl"]
+        assert hist.count >= 1 and hist.min >= 0.02, "a ponder hit records the time spent pondering it"
+    finally:
+        PlayerInput._ai_kind = saved
+    print("✓ Pondered search report test passed")
+
+
+def run_all_tests():
+    """Run all ponder tests"""
+    print("Running ponder tests...\n")
+    test_ponderer_precomputes_replies()
+    test_take_cancels_remaining_branches()
+    test_controller_uses_pondered_reply()
+    test_pondered_search_reports_its_own_stats()
+    print("\n✅ All ponder tests passed!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
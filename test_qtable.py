@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded-memory Q-table
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.metrics import TrainingMetrics
+from tictactoe_package.qtable import BoundedQTable
+from tictactoe_package.rl_agent import RLAgent
+
+
+def test_lru_evicts_least_recent():
+    """Test that reads refresh recency and the oldest entries go first"""
+    table = BoundedQTable(4, "lru", evict_fraction=0.5)
+    for i in range(4):
+        table[("s", i)] = float(i)
+    assert table.get(("s", 0)) == 0.0          # 0 is now the most recent
+    table[("s", 4)] = 4.0                       # evicts the 2 least recent: 1 and 2
+    assert sorted(a for _, a in table) == [0, 3, 4]
+    assert table.evictions == 2
+    print("✓ LRU eviction test passed")
+
+
+def test_lfu_evicts_rare_and_small():
+    """Test that the least visited entries go first, smallest |Q| breaking ties"""
+    table = BoundedQTable(4, "lfu", evict_fraction=0.5)
+    table[("s", 0)] = 0.9
+    table[("s", 1)] = 0.01
+    table[("s", 2)] = -0.8
+    table[("s", 3)] = 0.5
+    for _ in range(3):
+        table[("s", 0)] = 0.9
+    table[("s", 2)] = -0.8
+    table[("s", 4)] = 0.1                       # evicts 1 (|0.01|) and 3 (|0.5|), both visited once
+    assert sorted(a for _, a in table) == [0, 2, 4]
+    assert table.visits(("s", 0)) == 2, "visit counts are halved after an eviction round"
+    assert table.visits(("s", 4)) == 1
+    print("✓ LFU eviction test passed")
+
+
+def test_hit_rate_and_capacity():
+    """Test hit/miss accounting and that the cap is never exceeded"""
+    table = BoundedQTable(100)
+    rng = random.Random(0)
+    for _ in range(5000):
+        key = (rng.randrange(400), rng.randrange(9))
+        table[key] = table.get(key, 0.0) + 1.0
+        assert len(table) <= 100
+    assert table.hits + table.misses == 5000
+    assert 0.0 < table.hit_rate < 1.0 and table.evictions > 0
+    assert "hit rate" in table.summary()
+    print("✓ Hit rate and capacity test passed")
+
+
+def test_invalid_arguments():
+    """Test that a bad capacity or policy is rejected"""
+    for args in ((0,), (10, "fifo")):
+        try:
+            BoundedQTable(*args)
+        except ValueError:
+            continue
+        raise AssertionError(f"BoundedQTable{args} should raise")
+    print("✓ Invalid argument test passed")
+
+
+def test_agent_with_room_to_spare_matches_dict():
+    """Test that a cap that is never reached changes nothing"""
+    random.seed(3)
+    plain = RLAgent()
+    plain.train_self_play(episodes=300)
+    random.seed(3)
+    bounded = RLAgent(q_capacity=100_000)
+    bounded.train_self_play(episodes=300)
+    assert isinstance(bounded.q, BoundedQTable) and bounded.q.evictions == 0
+    assert bounded.fingerprint() == plain.fingerprint()
+    print("✓ Unreached cap test passed")
+
+
+def test_agent_stays_within_cap_and_reports():
+    """Test bounded self-play on a 4x4 board, metrics and a save/load round trip"""
+    random.seed(0)
+    agent = RLAgent(rows=4, cols=4, k=3, q_capacity=500, q_eviction="lru")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "metrics.jsonl")
+        with TrainingMetrics(path, log_every=50) as metrics:
+            agent.train_self_play(episodes=200, metrics=metrics)
+        with open(path, encoding="utf-8") as f:
+            last = [json.loads(line) for line in f][-1]
+        assert len(agent.q) <= 500 and agent.q.evictions > 0
+        assert last["q_evictions"] == agent.q.evictions
+        assert 0.0 <= last["q_hit_rate"] <= 1.0
+
+        q_path = os.path.join(tmp, "q.json")
+        agent.save(q_path)
+        loaded = RLAgent(q_capacity=500)
+        loaded.load(q_path)
+        assert isinstance(loaded.q, BoundedQTable) and len(loaded.q) == len(agent.q)
+    print("✓ Bounded agent test passed")
+
+
+def run_all_tests():
+    """Run all bounded Q-table tests"""
+    print("Running bounded Q-table tests...\n")
+    test_lru_evicts_least_recent()
+    test_lfu_evicts_rare_and_small()
+    test_hit_rate_and_capacity()
+    test_invalid_arguments()
+    test_agent_with_room_to_spare_matches_dict()
+    test_agent_stays_within_cap_and_reports()
+    print("\n🎉 All bounded Q-table tests passed!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-wide agent registry
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package import GameController
+from tictactoe_package.agents import load_agent
+from tictactoe_package.player import PlayerInput
+from tictactoe_package.registry import AGENTS, AgentRegistry
+from tictactoe_package.rl_agent import RLAgent
+
+
+class CountingLoader:
+    """load_agent wrapper that counts disk loads"""
+
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self, spec, deterministic=False):
+        self.calls += 1
+        time.sleep(self.delay)
+        return load_agent(spec, deterministic)
+
+
+def _save_policy(path, value):
+    agent = RLAgent()
+    agent.q = {(" " * 9 + "|X", 4): value}
+    agent.save(path)
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_loads_once_across_threads():
+    """Test that concurrent lookups share a single load"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "q.json")
+        _save_policy(path, 1.0)
+        loader = CountingLoader(delay=0.05)
+        registry = AgentRegistry(loader)
+        found = []
+        threads = [threading.Thread(target=lambda: found.append(registry.get(f"rl:{path}")))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert loader.calls == 1, f"expected one load, got {loader.calls}"
+        assert all(agent is found[0] for agent in found)
+        assert registry.get(f"rl:{path}", deterministic=True) is not found[0], \
+            "deterministic tie-breaking is a different agent"
+        assert registry.get("random") is registry.get("random")
+    print("✓ Load-once test passed")
+
+
+def test_reload_on_file_change():
+    """Test that a retrained policy is reloaded in the background"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "q.json")
+        _save_policy(path, 1.0)
+        registry = AgentRegistry(CountingLoader())
+        old = registry.get(f"rl:{path}")
+
+        _save_policy(path, 2.0)
+        _bump_mtime(path)
+        assert registry.get(f"rl:{path}") is old, "the old agent serves while reloading"
+        deadline = time.time() + 5
+        while registry.reloads == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        new = registry.get(f"rl:{path}")
+        assert new is not old and list(new.q.values()) == [2.0]
+
+        os.remove(path)
+        try:
+            registry.get(f"rl:{path}")
+            assert False, "a deleted policy should be evicted"
+        except FileNotFoundError:
+            pass
+        assert len(registry) == 0
+    print("✓ Reload-on-change test passed")
+
+
+def test_broken_file_is_not_retried_until_it_changes():
+    """Test that a policy that fails to load is retried only after another write"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "q.json")
+        _save_policy(path, 1.0)
+        loader = CountingLoader()
+        registry = AgentRegistry(loader)
+        old = registry.get(f"rl:{path}")
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{ half-written")
+        _bump_mtime(path)
+        registry.get(f"rl:{path}")
+        deadline = time.time() + 5
+        while loader.calls < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        for _ in range(20):
+            assert registry.get(f"rl:{path}") is old, "the old agent keeps serving"
+        assert registry.refresh() == 0
+        time.sleep(0.05)
+        assert loader.calls == 2, f"the broken file was loaded {loader.calls - 1} times"
+
+        _save_policy(path, 2.0)
+        _bump_mtime(path)
+        _bump_mtime(path)
+        registry.get(f"rl:{path}")
+        while registry.reloads == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        assert list(registry.get(f"rl:{path}").q.values()) == [2.0]
+    print("✓ Failed reload backoff test passed")
+
+
+def test_controllers_share_agent():
+    """Test that controllers and PlayerInput share one loaded policy"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            _save_policy("q_table.json", 1.0)
+            AGENTS.clear()
+            PlayerInput._ai_kind = "rl"
+            PlayerInput._rl_agent = None
+            PlayerInput._init_ai_if_needed()
+            loads = AGENTS.loads
+            a, b = GameController(), GameController()
+            a._load_ai()
+            b._load_ai()
+            assert a._rl_agent is b._rl_agent is PlayerInput._rl_agent
+            assert AGENTS.loads == loads, "the policy should not be read again"
+        finally:
+            PlayerInput._rl_agent = None
+            AGENTS.clear()
+            os.chdir(cwd)
+    print("✓ Shared controller agent test passed")
+
+
+def run_all_tests():
+    """Run all registry tests"""
+    print("Running registry tests...\n")
+    test_loads_once_across_threads()
+    test_reload_on_file_change()
+    test_broken_file_is_not_retried_until_it_changes()
+    test_controllers_share_agent()
+    print("\n✅ All registry tests passed!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
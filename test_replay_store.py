@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory-mapped replay buffer
+"""
+
+import sys
+import os
+import multiprocessing as mp
+import tempfile
+
+import torch
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.dqn_agent import DQNAgent, DQNConfig, encode_board, legal_mask
+from tictactoe_package.replay_store import MemmapReplay
+
+
+def _transition(i):
+    board = [' '] * 9
+    board[i % 9] = 'X'
+    return (encode_board(board, 'O'), i % 9, float(i), encode_board(board, 'X'),
+            i % 2 == 0, legal_mask(board))
+
+
+def _append_many(path, start, n):
+    with MemmapReplay(path, capacity=1000) as replay:
+        for i in range(start, start + n):
+            replay.append(_transition(i))
+
+
+def test_append_sample_and_wrap():
+    """Test that transitions round-trip and the ring buffer wraps"""
+    with tempfile.TemporaryDirectory() as tmp:
+        replay = MemmapReplay(os.path.join(tmp, "replay.bin"), capacity=10)
+        for i in range(25):
+            replay.append(_transition(i))
+        assert len(replay) == 10 and replay.count == 25
+        s, a, r, s_next, done, mask = replay.sample(10)
+        assert sorted(r.tolist()) == [float(i) for i in range(15, 25)], "oldest entries are overwritten"
+        for k in range(10):
+            i = int(r[k])
+            es, ea, _, es_next, edone, emask = _transition(i)
+            assert torch.equal(s[k], es) and a[k] == ea and torch.equal(s_next[k], es_next)
+            assert done[k] == float(edone) and torch.equal(mask[k], emask)
+        replay.append((es, 0, 0.0, es_next, True, None))
+        _, _, r, _, _, mask = replay.sample(10)
+        assert mask[r == 0.0].min() == 1.0, "a missing mask is stored as all legal"
+        replay.close()
+    print("✓ Append/sample/wrap test passed")
+
+
+def test_shared_between_processes():
+    """Test that several processes append to one file"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "replay.bin")
+        MemmapReplay(path, capacity=1000).close()
+        procs = [mp.Process(target=_append_many, args=(path, k * 100, 100)) for k in range(3)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+        replay = MemmapReplay(path, capacity=1000)
+        assert replay.count == 300 and replay.capacity == 1000
+        r = replay.sample(300)[2]
+        assert sorted(r.tolist()) == [float(i) for i in range(300)], "no append may be lost"
+        replay.close()
+    print("✓ Multi-process append test passed")
+
+
+def test_capacity_mismatch_and_close():
+    """Test that reopening with another capacity raises and that closing releases the file"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "replay.bin")
+        with MemmapReplay(path, capacity=10) as replay:
+            replay.append(_transition(0))
+            fd = replay._fd
+        assert replay._fd is None
+        try:
+            os.fstat(fd)
+            assert False, "the descriptor should be closed on exit"
+        except OSError:
+            pass
+        try:
+            MemmapReplay(path, capacity=20)
+            assert False, "a different capacity should be rejected"
+        except ValueError as e:
+            assert "10" in str(e)
+        with MemmapReplay(path, capacity=10) as replay:
+            assert replay.count == 1
+        replay.close()  # closing twice is harmless
+    print("✓ Capacity mismatch and close test passed")
+
+
+def test_agent_resumes_with_warm_buffer():
+    """Test that a new agent on an existing replay file can learn immediately"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cfg = DQNConfig(verbose=False, device="cpu", replay_path=os.path.join(tmp, "replay.bin"),
+                        buffer_size=2000)
+        first = DQNAgent(cfg)
+        for i in range(cfg.start_training_after):
+            first.remember(*_transition(i))
+        first.buffer.close()
+
+        resumed = DQNAgent(cfg)
+        assert len(resumed.buffer) == cfg.start_training_after
+        resumed.step_count = 1
+        assert resumed.learn() is not None, "a warm buffer should skip the warm-up"
+        resumed.close()
+    print("✓ Warm resume test passed")
+
+
+def run_all_tests():
+    """Run all replay store tests"""
+    print("Running replay store tests...\n")
+    test_append_sample_and_wrap()
+    test_shared_between_processes()
+    test_capacity_mismatch_and_close()
+    test_agent_resumes_with_warm_buffer()
+    print("\n✅ All replay store tests passed!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
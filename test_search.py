@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the iterative-deepening alpha-beta agent
+"""
+
+import sys
+import os
+import time
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package import GameController
+from tictactoe_package.agents import load_agent
+from tictactoe_package.exact_eval import Solver, exploitability
+from tictactoe_package.player import PlayerInput
+from tictactoe_package.search import AlphaBetaAgent, TranspositionTable, EXACT, WIN_BOUND
+
+
+def test_optimal_on_classic_board():
+    """Test that a full-depth search plays a solver-optimal move everywhere"""
+    agent = AlphaBetaAgent(time_limit=None)
+    solver = Solver()
+    for board, mark, values in solver.positions():
+        move = agent.pick_move(list(board), mark)
+        assert values[move] == max(values.values()), f"Suboptimal move {move} in {board}"
+    assert exploitability(agent, 'X').result == "draw"
+    assert exploitability(agent, 'O').result == "draw"
+    print("✓ Classic board optimality test passed")
+
+
+def test_solves_small_boards():
+    """Test that the search reports a solved draw from the empty 3x3 board"""
+    stats = AlphaBetaAgent().search([' '] * 9, 'X')
+    assert stats.solved and stats.score == 0 and stats.depth == 9
+    assert stats.nodes > 0 and stats.nodes_per_sec > 0
+    print("✓ Solved search test passed")
+
+
+def test_finds_wins_and_blocks_on_large_board():
+    """Test tactics on a 7x7 board with 5 in a row"""
+    agent = AlphaBetaAgent(7, 7, 5, time_limit=0.5)
+    board = [' '] * 49
+    for cell in (8, 9, 10, 11):       # X four in row 1, closed on the right
+        board[cell] = 'X'
+    for cell in (12, 30, 31):
+        board[cell] = 'O'
+    stats = agent.search(board, 'X')
+    assert stats.move == 7 and stats.score > WIN_BOUND, "X should win at once"
+    assert agent.pick_move(board, 'O') == 7, "O must block the four"
+    print("✓ Large board tactics test passed")
+
+
+def test_time_budget_and_depth():
+    """Test that a large board search stops near its budget and reports its depth"""
+    agent = AlphaBetaAgent(15, 15, 5, time_limit=0.2)
+    start = time.perf_counter()
+    stats = agent.search([' '] * 225, 'X')
+    elapsed = time.perf_counter() - start
+    assert elapsed < 1.0, f"search ran {elapsed:.2f}s on a 0.2s budget"
+    assert stats.depth >= 1 and not stats.solved
+    assert 0 <= stats.move < 225
+    assert agent.last_stats is stats and "nodes/s" in stats.summary()
+    print("✓ Time budget test passed")
+
+
+def test_transposition_table_replacement():
+    """Test depth-preferred replacement within a search and aging across searches"""
+    tt = TranspositionTable(size_log2=2)
+    tt.new_search()
+    tt.store(1, 5, EXACT, 10, 0)
+    tt.store(5, 2, EXACT, 20, 1)      # same slot, shallower: rejected
+    assert tt.probe(1) is not None and tt.probe(5) is None
+    tt.store(5, 7, EXACT, 20, 1)      # deeper: replaces
+    assert tt.probe(5)[3] == 20 and tt.probe(1) is None
+    tt.new_search()
+    tt.store(9, 1, EXACT, 30, 2)      # entry from an older search: replaced
+    assert tt.probe(9) is not None
+    assert tt.used == 1 and tt.replaced == 2
+    print("✓ Transposition table test passed")
+
+
+def test_controller_plays_search_agent():
+    """Test the "ab" kind in auto mode through the controller"""
+    saved = PlayerInput._ai_kind
+    try:
+        PlayerInput._ai_kind = "ab"
+        controller = GameController()
+        controller.quiet = True
+        for _ in range(4):
+            assert controller.play_game_auto() is None, "perfect play should draw"
+        assert controller._ab_agent.last_stats is not None
+    finally:
+        PlayerInput._ai_kind = saved
+    assert isinstance(load_agent("ab"), AlphaBetaAgent)
+    print("✓ Controller search agent test passed")
+
+
+def run_all_tests():
+    """Run all search tests"""
+    print("Running alpha-beta search tests...\n")
+    test_optimal_on_classic_board()
+    test_solves_small_boards()
+    test_finds_wins_and_blocks_on_large_board()
+    test_time_budget_and_depth()
+    test_transposition_table_replacement()
+    test_controller_plays_search_agent()
+    print("\n🎉 All search tests passed!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
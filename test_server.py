@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests for the asyncio game server and load generator
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package.agents import SmartAgent
+from tictactoe_package.batching import BatchedInference
+from tictactoe_package.loadgen import run_load
+from tictactoe_package.server import GameServer
+
+
+def test_protocol_requests():
+    """Test a game played through handle_request"""
+    async def scenario():
+        server = GameServer({"smart": SmartAgent()})
+        state = await server.handle_request({"cmd": "new", "ai": "smart", "human": "O"})
+        assert state["ok"] and state["ai_move"] == 4, "smart AI should open in the center"
+        assert state["board"][4] == "X" and state["turn"] == "O"
+        game = state["game"]
+
+        bad = await server.handle_request({"cmd": "move", "game": game, "pos": 4})
+        assert not bad["ok"], "occupied cell should be rejected"
+        while state["result"] is None:
+            pos = state["board"].index(" ")
+            state = await server.handle_request({"cmd": "move", "game": game, "pos": pos})
+            assert state["ok"]
+        assert state["result"] in ("X", "O", "draw")
+
+        over = await server.handle_request({"cmd": "move", "game": game, "pos": 0})
+        assert not over["ok"]
+        assert (await server.handle_request({"cmd": "close", "game": game}))["ok"]
+        assert not (await server.handle_request({"cmd": "state", "game": game}))["ok"]
+        assert not (await server.handle_request({"cmd": "new", "ai": "nope"}))["ok"]
+    asyncio.run(scenario())
+    print("✓ Protocol request test passed")
+
+
+def test_sessions_are_private_to_their_connection():
+    """Test that one connection cannot play in or close another's game"""
+    async def scenario():
+        server = GameServer({"smart": SmartAgent()})
+        mine, theirs = set(), set()
+        state = await server.handle_request({"cmd": "new", "ai": "smart", "human": "X"}, mine)
+        game = state["game"]
+        for cmd in ({"cmd": "move", "game": game, "pos": 0}, {"cmd": "close", "game": game},
+                    {"cmd": "state", "game": game}):
+            assert not (await server.handle_request(cmd, theirs))["ok"], cmd["cmd"]
+        assert game in server.sessions
+        for bad_id in ([game], {"id": game}, "x", True):
+            reply = await server.handle_request({"cmd": "state", "game": bad_id}, mine)
+            assert reply == {"ok": False, "error": f"unknown game {bad_id}"}, reply
+        for pos in (True, False):
+            bad = await server.handle_request({"cmd": "move", "game": game, "pos": pos}, mine)
+            assert not bad["ok"], "JSON booleans are not cells"
+        assert (await server.handle_request({"cmd": "move", "game": game, "pos": 0}, mine))["ok"]
+    asyncio.run(scenario())
+    print("✓ Session ownership test passed")
+
+
+def test_slow_agent_does_not_block_other_sessions():
+    """Test that an unbatched agent's move runs off the event loop"""
+    class SlowAgent(SmartAgent):
+        def pick_move(self, board, current_player):
+            time.sleep(0.3)
+            return super().pick_move(board, current_player)
+
+    async def scenario():
+        server = GameServer({"smart": SmartAgent(), "ab": SlowAgent()})
+        slow = asyncio.ensure_future(server.handle_request({"cmd": "new", "ai": "ab", "human": "O"}))
+        await asyncio.sleep(0.05)
+        start = time.perf_counter()
+        fast = await server.handle_request({"cmd": "new", "ai": "smart", "human": "O"})
+        waited = time.perf_counter() - start
+        assert fast["ok"] and (await slow)["ok"]
+        return waited
+    waited = asyncio.run(scenario())
+    assert waited < 0.2, f"fast session waited {waited:.2f}s behind the slow agent"
+    print("✓ Non-blocking agent test passed")
+
+
+def test_concurrent_load():
+    """Test many concurrent clients sharing one agent over TCP"""
+    async def scenario():
+        smart = SmartAgent()
+        server = GameServer({"smart": smart})
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            result = await run_load("127.0.0.1", port, clients=50, games_per_client=3,
+                                    ai="smart", seed=1)
+        return server, result, smart
+    server, result, smart = asyncio.run(scenario())
+    assert result.games == 150, f"expected 150 games, got {result.games}"
+    assert result.errors == 0
+    assert result.latency.count == result.requests
+    assert server.games_started == 150
+    assert not server.sessions, "closed games should be removed"
+    assert server.agents["smart"] is smart, "agent should be shared, not reloaded"
+    print(f"✓ Concurrent load test passed ({result.requests_per_sec:,.0f} req/s)")
+
+
+def test_batched_inference():
+    """Test that batched DQN moves match per-request moves"""
+    import random
+    from tictactoe_package.dqn_agent import DQNAgent, DQNConfig
+    cfg = DQNConfig(verbose=False, device="cpu")
+    agent = DQNAgent(cfg)
+    rng = random.Random(0)
+    positions = []
+    for _ in range(100):
+        board = [rng.choice(" XO") for _ in range(9)]
+        positions.append((board, rng.choice("XO")))
+    positions.append((["X"] * 9, "O"))
+
+    async def scenario():
+        batcher = BatchedInference(agent, max_batch=32, max_delay=0.001)
+        moves = await asyncio.gather(*(batcher.pick_move(b, p) for b, p in positions))
+        return batcher, moves
+    batcher, moves = asyncio.run(scenario())
+    assert moves == [agent.pick_move(b, p) for b, p in positions]
+    assert moves[-1] == -1, "full board should have no move"
+    assert batcher.batches == 4 and batcher.requests == 101, \
+        f"expected 3 full batches and one timed flush, got {batcher.batches}"
+    print("✓ Batched inference test passed")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("Running server tests...\n")
+    test_protocol_requests()
+    test_sessions_are_private_to_their_connection()
+    test_slow_agent_does_not_block_other_sessions()
+    test_concurrent_load()
+    test_batched_inference()
+    print("\n✅ All server tests passed!")
+
+
+if __name__ == "__main__":
+    run_all_tests()
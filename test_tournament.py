@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for auto-mode tournaments
+"""
+
+import sys
+import os
+import random
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tictactoe_package import GameController
+from tictactoe_package.player import PlayerInput
+from tictactoe_package.tournament import game_seed, run_tournament
+
+
+def test_tournament_totals_independent_of_jobs():
+    """Test that a seeded tournament gives the same totals for any worker count"""
+    print("\n✓ Testing seeded tournaments across worker counts...")
+
+    PlayerInput._ai_kind = "random"
+    controller = GameController()
+    controller.num_human_players = 0
+
+    sequential = run_tournament(controller, 200, jobs=1, seed=123)
+    parallel = run_tournament(controller, 200, jobs=3, seed=123)
+    other_seed = run_tournament(controller, 200, jobs=1, seed=124)
+
+    assert sum(sequential.values()) == 200, "All games should be counted"
+    assert sequential == parallel, f"Totals differ: {sequential} vs {parallel}"
+    assert sequential != other_seed, "A different seed should give different games"
+
+    print("  ✓ Seeded totals do not depend on the number of workers")
+
+
+def test_tournament_reports_progress():
+    """Test that progress is reported up to the total"""
+    PlayerInput._ai_kind = "random"
+    controller = GameController()
+    seen = []
+    run_tournament(controller, 30, seed=1, progress=lambda done, total: seen.append((done, total)))
+    assert seen[-1] == (30, 30), f"Last progress should be (30, 30), got {seen[-1]}"
+    print("✓ Tournament progress test passed")
+
+
+def test_tournament_leaves_global_random_alone():
+    """Test that seeding the games does not reseed the global RNG"""
+    PlayerInput._ai_kind = "rl"
+    controller = GameController()
+    controller.num_human_players = 0
+    controller.quiet = True
+    random.seed(99)
+    expected = random.random()
+    random.seed(99)
+    first = run_tournament(controller, 50, seed=7)
+    assert random.random() == expected, "the caller's random sequence should be untouched"
+    assert run_tournament(controller, 50, seed=7) == first
+    print("✓ Global random state test passed")
+
+
+def test_game_seeds_do_not_collide():
+    """Test that large game indices do not reuse another tournament's seeds"""
+    assert game_seed(0, 1_000_003) != game_seed(1, 0)
+    seeds = {game_seed(s, i) for s in range(3) for i in range(0, 3_000_000, 1_000_003)}
+    assert len(seeds) == 9
+    assert game_seed(5, 7) == game_seed(5, 7), "seeds must be stable across processes"
+    print("✓ Game seed collision test passed")
+
+
+def run_all_tests():
+    """Run all tournament tests"""
+    print("\nRunning Tournament Tests...")
+    print("=" * 60)
+
+    test_tournament_totals_independent_of_jobs()
+    test_tournament_reports_progress()
+    test_tournament_leaves_global_random_alone()
+    test_game_seeds_do_not_collide()
+
+    print("=" * 60)
+    print("All tournament tests passed! ✓")
+    print()
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -8,36 +8,78 @@ Main entry point for the game.
 
 import sys
 from tictactoe_package import GameController
+from tictactoe_package.profiling import run_profiled
 
 # Keep the old imports for backward compatibility
 from tictactoe_package import TicTacToe
 
 
+def _parse_int(raw, what, allow_zero=False):
+    """Parse a positive integer command line value or exit with an error"""
+    try:
+        value = int(raw)
+    except ValueError:
+        print(f"Error: Invalid {what}: {raw}")
+        sys.exit(1)
+    if value < 0 or (value == 0 and not allow_zero):
+        print(f"Error: {what[0].upper() + what[1:]} must be positive")
+        sys.exit(1)
+    return value
+
+
 def main():
     """Main entry point"""
     try:
         # Parse command line arguments
         auto_mode = False
         num_games = 50  # Default number of games
+        jobs = 1        # Worker processes for auto mode
+        seed = None     # Tournament seed for auto mode
+        deterministic = False  # Fixed tie-breaking so repeated games can be cached
+        profile_out = None     # Write a cProfile .prof file for the run
+        game_log = None        # Append every auto game to this binary game log
         
-        if len(sys.argv) > 1:
-            if sys.argv[1] == '-auto':
-                auto_mode = True
-                # Check if a number is provided after -auto
-                if len(sys.argv) > 2:
-                    try:
-                        num_games = int(sys.argv[2])
-                        if num_games <= 0:
-                            print("Error: Number of games must be positive")
-                            sys.exit(1)
-                    except ValueError:
-                        print(f"Error: Invalid number of games: {sys.argv[2]}")
-                        sys.exit(1)
+        args = sys.argv[1:]
+        if args and args[0] == '-auto':
+            auto_mode = True
+            args = args[1:]
+            # Check if a number is provided after -auto
+            if args and (not args[0].startswith('-') or args[0][1:].isdigit()):
+                num_games = _parse_int(args[0], "number of games")
+                args = args[1:]
+            while args:
+                flag = args[0]
+                if flag == '--deterministic':
+                    deterministic = True
+                    args = args[1:]
+                    continue
+                if flag == '--profile':
+                    profile_out = profile_out or 'tictactoe.prof'
+                    args = args[1:]
+                    continue
+                if flag == '--profile-out' and len(args) > 1:
+                    profile_out = args[1]
+                    args = args[2:]
+                    continue
+                if flag in ('-j', '--jobs') and len(args) > 1:
+                    jobs = _parse_int(args[1], "number of jobs")
+                elif flag == '--seed' and len(args) > 1:
+                    seed = _parse_int(args[1], "seed", allow_zero=True)
+                elif flag == '--log' and len(args) > 1:
+                    game_log = args[1]
+                else:
+                    print(f"Error: Unknown option: {flag}")
+                    sys.exit(1)
+                args = args[2:]
         
         controller = GameController()
+        controller.deterministic = deterministic
         
-        if auto_mode:
-            controller.run_auto(num_games)
+        if auto_mode and profile_out:
+            run_profiled(lambda: controller.run_auto(num_games, jobs=jobs, seed=seed, game_log=game_log),
+                         profile_out)
+        elif auto_mode:
+            controller.run_auto(num_games, jobs=jobs, seed=seed, game_log=game_log)
         else:
             controller.run()
             
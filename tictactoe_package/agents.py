@@ -0,0 +1,65 @@
+"""
+Agent factory for TicTacToe
+Builds independent agent instances from short specs such as "rl:q_table.json"
+"""
+
+import random
+from typing import List
+
+from .heuristic import smart_opponent_move
+from .rl_agent import RLAgent
+
+AGENT_KINDS = ("random", "smart", "rl", "dq", "ab")
+DEFAULT_POLICY = {"rl": "q_table.json", "dq": "dqn_policy.pt"}
+
+
+class RandomAgent:
+    """Plays a uniformly random legal move"""
+
+    def pick_move(self, board: List[str], current_player: str, rng=random) -> int:
+        legal = [i for i, v in enumerate(board) if v == ' ']
+        return rng.choice(legal) if legal else -1
+
+
+class SmartAgent:
+    """Win, block, center, corner, else random (see heuristic.smart_opponent_move)"""
+
+    def pick_move(self, board: List[str], current_player: str, rng=random) -> int:
+        move = smart_opponent_move(board, current_player, rng)
+        return -1 if move is None else move
+
+
+def parse_spec(spec: str):
+    """Split "kind[:policy path]" into (kind, path or None)"""
+    kind, _, path = spec.partition(":")
+    kind = kind.strip().lower()
+    if kind not in AGENT_KINDS:
+        raise ValueError(f"Unknown agent kind '{kind}' (expected one of {', '.join(AGENT_KINDS)})")
+    return kind, (path or DEFAULT_POLICY.get(kind))
+
+
+def load_agent(spec: str, deterministic: bool = False):
+    """Create a fresh agent from a spec: random, smart, rl[:path], dq[:path] or ab.
+
+    Policies are loaded eagerly, so a missing or broken file raises instead of
+    silently falling back to random play. ``deterministic`` fixes the
+    Q-learning agent's tie-breaking so its games can be cached.
+    """
+    kind, path = parse_spec(spec)
+    if kind == "random":
+        return RandomAgent()
+    if kind == "smart":
+        return SmartAgent()
+    if kind == "ab":
+        from .search import AlphaBetaAgent
+        return AlphaBetaAgent()
+    if kind == "rl":
+        agent = RLAgent(deterministic=deterministic)
+        agent.load(path)
+        return agent
+    from .dqn_agent import DQNAgent, DQNConfig
+    cfg = DQNConfig()
+    cfg.verbose = False
+    agent = DQNAgent(cfg)
+    agent.load(path)
+    return agent
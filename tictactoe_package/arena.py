@@ -0,0 +1,196 @@
+"""
+Head-to-head arena for TicTacToe agents
+Plays two independent agents against each other with alternating colours.
+
+Agents implement ``pick_move(board, current_player, rng=random)`` and draw
+any randomness they need from ``rng``, so a seeded match uses its own
+random.Random and leaves the global ``random`` state alone.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .game import TicTacToe
+from .gamelog import GameRecord, RecordSink
+
+Z_95 = 1.96
+
+
+def wilson_interval(k: int, n: int, z: float = Z_95) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion k/n"""
+    if n == 0:
+        return 0.0, 1.0
+    p = k / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+@dataclass
+class MatchResult:
+    """Results of a match from agent A's point of view"""
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    @property
+    def score(self) -> float:
+        """Mean score per game: 1 for a win, 0.5 for a draw"""
+        return (self.wins + 0.5 * self.draws) / self.games if self.games else 0.5
+
+    def score_interval(self, z: float = Z_95) -> Tuple[float, float]:
+        """Normal-approximation confidence interval for the mean score"""
+        n = self.games
+        if n < 2:
+            return 0.0, 1.0
+        mean = self.score
+        var = (self.wins * (1 - mean) ** 2 + self.draws * (0.5 - mean) ** 2
+               + self.losses * mean ** 2) / (n - 1)
+        half = z * math.sqrt(var / n)
+        return max(0.0, mean - half), min(1.0, mean + half)
+
+    def elo_difference(self) -> float:
+        """Elo difference implied by the score (clamped for 0% / 100%)"""
+        s = min(max(self.score, 1e-3), 1 - 1e-3)
+        return 400 * math.log10(s / (1 - s))
+
+    def add(self, other: "MatchResult") -> None:
+        self.wins += other.wins
+        self.draws += other.draws
+        self.losses += other.losses
+
+    def summary(self, name_a: str = "A", name_b: str = "B") -> str:
+        n = self.games
+        lines = [f"  {name_a} vs {name_b}: {n} games"]
+        for label, k in (("wins", self.wins), ("draws", self.draws), ("losses", self.losses)):
+            lo, hi = wilson_interval(k, n)
+            lines.append(f"    {label:<7} {k:6d}  ({k / n * 100:5.1f}%, 95% CI {lo * 100:5.1f}-{hi * 100:5.1f}%)")
+        lo, hi = self.score_interval()
+        lines.append(f"    score   {self.score:.3f}  (95% CI {lo:.3f}-{hi:.3f}, Elo {self.elo_difference():+.0f})")
+        return "\n".join(lines)
+
+
+def agent_fingerprint(agent) -> Optional[str]:
+    """Fingerprint of an agent whose play is fully deterministic, else None"""
+    if getattr(agent, "deterministic", False) and hasattr(agent, "fingerprint"):
+        return agent.fingerprint()
+    return None
+
+
+class ResultCache:
+    """Outcomes of deterministic games keyed by
+    (X fingerprint, O fingerprint, starting player, opening moves)."""
+
+    def __init__(self):
+        self.results: Dict[Tuple, Optional[str]] = {}
+        self.moves: Dict[Tuple, Tuple[int, ...]] = {}  # the game behind each result
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+def play_game(x_agent, o_agent, opening: Sequence[int] = (), starting: str = 'X',
+              cache: Optional[ResultCache] = None, rng=random) -> Optional[str]:
+    """Play one game. Returns 'X', 'O' or None for a draw.
+
+    ``opening`` moves are played first, alternating from ``starting``. With a
+    ``cache``, games between two deterministic agents are only played once.
+    """
+    if cache is None:
+        return _play(x_agent, o_agent, opening, starting, rng=rng)
+    return _play_cached(x_agent, o_agent, agent_fingerprint(x_agent), agent_fingerprint(o_agent),
+                        opening, starting, cache, rng=rng)
+
+
+def _play_cached(x_agent, o_agent, fp_x, fp_o, opening, starting, cache,
+                 moves: Optional[List[int]] = None, rng=random) -> Optional[str]:
+    if fp_x is None or fp_o is None:
+        return _play(x_agent, o_agent, opening, starting, moves, rng)
+    key = (fp_x, fp_o, starting, tuple(opening))
+    if key in cache.results:
+        cache.hits += 1
+        if moves is not None:
+            moves.extend(cache.moves.get(key, ()))
+        return cache.results[key]
+    cache.misses += 1
+    played: List[int] = []
+    winner = _play(x_agent, o_agent, opening, starting, played, rng)
+    cache.results[key] = winner
+    cache.moves[key] = tuple(played)
+    if moves is not None:
+        moves.extend(played)
+    return winner
+
+
+def _play(x_agent, o_agent, opening: Sequence[int], starting: str,
+          moves: Optional[List[int]] = None, rng=random) -> Optional[str]:
+    """Play out a game; every move, opening included, is appended to ``moves``"""
+    env = TicTacToe()
+    env.current_player = starting
+    for position in opening:
+        env.make_move(position)
+        if moves is not None:
+            moves.append(position)
+        winner = env.check_winner()
+        if winner:
+            return winner
+        if env.is_board_full():
+            return None
+        env.switch_player()
+    while True:
+        agent = x_agent if env.current_player == 'X' else o_agent
+        position = agent.pick_move(env.board, env.current_player, rng=rng)
+        if not env.is_valid_move(position):
+            position = rng.choice(env.get_available_positions())
+        env.make_move(position)
+        if moves is not None:
+            moves.append(position)
+        winner = env.check_winner()
+        if winner:
+            return winner
+        if env.is_board_full():
+            return None
+        env.switch_player()
+
+
+def play_match(agent_a, agent_b, games: int, seed: Optional[int] = None,
+               cache: Optional[ResultCache] = None, record: Optional[RecordSink] = None,
+               names: Tuple[str, str] = ("A", "B"), rng=None) -> MatchResult:
+    """Play ``games`` games, A taking X in even-numbered games and O in odd ones.
+
+    Pass a ``cache`` to replay deterministic matchups from memory. ``record``
+    receives a GameRecord for every game, with the agents called ``names``.
+    Randomness comes from ``rng`` if given, else from a random.Random seeded
+    with ``seed``, else from the global ``random`` module.
+    """
+    if rng is None:
+        rng = random.Random(seed) if seed is not None else random
+    cache = cache if cache is not None else ResultCache()
+    fp_a, fp_b = agent_fingerprint(agent_a), agent_fingerprint(agent_b)
+    result = MatchResult()
+    for i in range(games):
+        a_is_x = (i % 2 == 0)
+        moves: Optional[List[int]] = [] if record is not None else None
+        if a_is_x:
+            winner = _play_cached(agent_a, agent_b, fp_a, fp_b, (), 'X', cache, moves, rng)
+        else:
+            winner = _play_cached(agent_b, agent_a, fp_b, fp_a, (), 'X', cache, moves, rng)
+        if record is not None:
+            x_name, o_name = names if a_is_x else names[::-1]
+            record(GameRecord(tuple(moves), winner, 'X', x_name, o_name, seed, i))
+        if winner is None:
+            result.draws += 1
+        elif (winner == 'X') == a_is_x:
+            result.wins += 1
+        else:
+            result.losses += 1
+    return result
@@ -0,0 +1,63 @@
+"""
+Micro-batching inference for the DQN agent
+Concurrent move requests are collected for up to ``max_delay`` seconds or
+``max_batch`` requests, then answered with a single batched forward pass.
+"""
+
+import asyncio
+from typing import List, Optional, Tuple
+
+
+class BatchedInference:
+    """Asyncio front end that batches ``pick_move`` calls to a DQNAgent.
+
+    ``await batcher.pick_move(board, player)`` behaves like
+    ``agent.pick_move`` but shares the forward pass with every other request
+    pending at the same time. Larger ``max_batch`` / ``max_delay`` raise
+    throughput at the cost of per-request latency.
+    """
+
+    def __init__(self, agent, max_batch: int = 64, max_delay: float = 0.002):
+        self.agent = agent
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._pending: List[Tuple[List[str], str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.requests = 0
+        self.batches = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.requests / self.batches if self.batches else 0.0
+
+    def pick_move(self, board: List[str], current_player: str) -> "asyncio.Future[int]":
+        """Queue a position; the returned future resolves to the chosen move"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((list(board), current_player, future))
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self.flush)
+        return future
+
+    def flush(self) -> None:
+        """Answer every pending request now"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self.requests += len(batch)
+        self.batches += 1
+        try:
+            moves = self.agent.pick_moves([b for b, _, _ in batch], [p for _, p, _ in batch])
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), move in zip(batch, moves):
+            if not future.done():
+                future.set_result(move)
@@ -8,11 +8,20 @@ from .game import TicTacToe
 from .ui import GameUI
 from .player import PlayerInput
 from .rl_agent import RLAgent
+from .tournament import run_tournament
+from .arena import ResultCache, agent_fingerprint
+from .gamelog import GameLogWriter
+from .latency import LatencyRecorder
+from .registry import AGENTS
+from .ponder import Ponderer
+from .search import SearchStats
 try:
-    from .dqn_agent import DQNAgent
+    from .dqn_agent import DQNAgent, print_explanation
 except ImportError:
     DQNAgent = None
+    print_explanation = None
 import random
+import time
 
 
 class GameController:
@@ -26,67 +35,156 @@ class GameController:
         self._rl_agent: Optional[RLAgent] = None
         # Note: Can't use Optional[DQNAgent] since DQNAgent may be None (module not available)
         self._dq_agent = None  # DQNAgent instance or None
+        self._ab_agent = None  # AlphaBetaAgent for the "ab" kind
+        self.quiet = False  # suppress per-move AI explanations (auto mode)
+        self.deterministic = False  # fixed tie-breaking for the Q-learning agent
+        self.result_cache = ResultCache()  # outcomes of deterministic auto games
+        self.latency = LatencyRecorder()  # per-kind AI move latency and policy load times
+        self._auto_fingerprint = (None, None)  # (agent, fingerprint) memo for auto mode
+        self._shared_agents = False  # agents came from the process-wide registry
+        self.ponder = True  # precompute AI replies while the human is thinking
+        self.ponderer = Ponderer(self._timed_ai_reply)
+        self._ponder_reply = None  # (move, report, seconds) replying to the human's last move, if pondered
+        self.last_moves = ()  # moves of the last auto game, for game logs
+        self.last_start = 'X'  # side that moved first in the last auto game
+        self._cached_moves = {}  # moves of the games in result_cache
     
-    def _get_ai_move(self):
-        """Get computer move based on current AI type
-        
-        Returns:
-            int or None: Position to move (0-8) or None if no valid move
-        """
+    def _load_ai(self):
+        """Load the agent for the current AI type once, timing the load"""
+        kind = PlayerInput._ai_kind
+        if (kind == "rl" and self._rl_agent is None) or (kind == "dq" and self._dq_agent is None) \
+                or (kind == "ab" and self._ab_agent is None):
+            start = time.perf_counter()
+            self._create_agent()
+            self.latency.record_load(kind, time.perf_counter() - start)
+
+    def _create_agent(self):
+        """Fetch the shared agent for the current AI type; falls back to random if unavailable"""
         if PlayerInput._ai_kind == "rl":
             # Init once if chosen
             if self._rl_agent is None:
-                self._rl_agent = RLAgent()
                 try:
-                    self._rl_agent.load("q_table.json")
+                    self._rl_agent = AGENTS.get("rl:q_table.json", deterministic=self.deterministic)
+                    self._shared_agents = True
                     print("  [AI] RL policy loaded.")
                 except Exception:
+                    self._rl_agent = RLAgent(deterministic=self.deterministic)
                     print("  [AI] No policy loaded; using random fallback.")
-            # Let RL pick based on the actual board
-            if self._rl_agent:
-                position = self._rl_agent.pick_move(self.game.board, self.game.current_player)
-                if position not in self.game.get_available_positions():
-                    # Safety: fallback
-                    position = PlayerInput.get_computer_move(
-                        self.game.current_player,
-                        self.game.get_available_positions()
-                    )
-            else:
-                position = PlayerInput.get_computer_move(
-                    self.game.current_player,
-                    self.game.get_available_positions()
-                )
         elif PlayerInput._ai_kind == "dq":
-            # Use DQN agent to pick move
             if self._dq_agent is None:
                 if DQNAgent is None:
                     print("  [AI] DQN not available (torch not installed); using random fallback.")
                     PlayerInput._ai_kind = "random"
                 else:
-                    self._dq_agent = DQNAgent()
                     try:
-                        self._dq_agent.load("dqn_policy.pt")
+                        self._dq_agent = AGENTS.get("dq:dqn_policy.pt")
+                        self._shared_agents = True
                         print("  [AI] DQN policy loaded.")
                     except Exception:
                         print("  [AI] No DQN policy loaded; using random fallback.")
                         PlayerInput._ai_kind = "random"  # fallback
                         self._dq_agent = None
+        elif PlayerInput._ai_kind == "ab":
+            if self._ab_agent is None:
+                self._ab_agent = AGENTS.get("ab")
+
+    def _refresh_ai(self):
+        """Between games, switch to a retrained policy if the registry has reloaded it"""
+        if not self._shared_agents:
+            return
+        try:
+            if PlayerInput._ai_kind == "rl" and self._rl_agent is not None:
+                self._rl_agent = AGENTS.get("rl:q_table.json", deterministic=self.deterministic)
+            elif PlayerInput._ai_kind == "dq" and self._dq_agent is not None:
+                self._dq_agent = AGENTS.get("dq:dqn_policy.pt")
+        except Exception:
+            pass  # policy file removed: keep playing with the agent we have
+
+    def _get_ai_move(self, rng=random):
+        """Get computer move based on current AI type
+
+        Args:
+            rng: Source of randomness for tie-breaking and random play
+
+        Returns:
+            int or None: Position to move (0-8) or None if no valid move
+        """
+        self._load_ai()
+        if self._ponder_reply is not None:
+            # computed while the human was thinking: record what it cost then,
+            # not the near-zero wait for it now
+            (position, report, seconds), self._ponder_reply = self._ponder_reply, None
+        else:
+            position, report, seconds = self._timed_ai_reply(self.game.board, self.game.current_player, rng)
+        if isinstance(report, SearchStats):
+            print(f"  [Search] {report.summary()}")
+        elif report is not None:
+            print_explanation(report)
+        self.latency.record_move(PlayerInput._ai_kind, seconds)
+        return position
+
+    def _timed_ai_reply(self, board, current_player, rng=random):
+        """(move, report, seconds to choose it) of the current AI type for any position.
+
+        In interactive play the report is the alpha-beta agent's SearchStats or
+        the Explanation from the DQN agent's explain hook, both taken from the
+        move's own computation; otherwise (and for other kinds) it is None.
+        """
+        start = time.perf_counter()
+        kind = PlayerInput._ai_kind
+        if self.quiet or kind not in ("ab", "dq") or (kind == "dq" and self._dq_agent is None):
+            position, report = self._pick_ai_move(board, current_player, rng), None
+        elif kind == "ab":
+            # stats from this search, not last_stats, which pondering may overwrite
+            report = self._ab_agent.search(board, current_player) if ' ' in board else None
+            position = report.move if report is not None else None
+        else:
+            seen = []
+            self._dq_agent.subscribe_explain(seen.append)
+            try:
+                position = self._pick_ai_move(board, current_player, rng)
+            finally:
+                self._dq_agent.unsubscribe_explain(seen.append)
+            report = seen[-1] if seen else None
+        return position, report, time.perf_counter() - start
+
+    def _pick_ai_move(self, board, current_player, rng=random):
+        """Move of the current AI type for any position; reads nothing but its arguments"""
+        available = [i for i, v in enumerate(board) if v == ' ']
+        if not available:
+            return None
+        if PlayerInput._ai_kind == "rl":
+            # Let RL pick based on the actual board
+            if self._rl_agent:
+                position = self._rl_agent.pick_move(board, current_player, rng)
+                if position not in available:
+                    # Safety: fallback
+                    position = PlayerInput.get_computer_move(current_player, available, rng)
+            else:
+                position = PlayerInput.get_computer_move(current_player, available, rng)
+        elif PlayerInput._ai_kind == "dq":
+            # Use DQN agent to pick move
             if self._dq_agent is not None:
-                position = self._dq_agent.pick_move(self.game.board, self.game.current_player)
-                if position not in self.game.get_available_positions():
-                    position = random.choice(self.game.get_available_positions())
+                position = self._dq_agent.pick_move(board, current_player)
+                if position not in available:
+                    position = rng.choice(available)
             else:
-                position = random.choice(self.game.get_available_positions())
+                position = rng.choice(available)
+        elif PlayerInput._ai_kind == "ab":
+            position = self._ab_agent.pick_move(board, current_player)
         else:
-            position = PlayerInput.get_computer_move(
-                self.game.current_player,
-                self.game.get_available_positions()
-            )
+            position = PlayerInput.get_computer_move(current_player, available, rng)
         return position
+
+    def _should_ponder(self):
+        """Ponder only against an AI whose reply is worth precomputing"""
+        return self.ponder and self.num_human_players == 1 and PlayerInput._ai_kind != "random"
     
     def play_game(self):
         """Main game loop"""
         self.game.reset()
+        self._refresh_ai()
+        self._ponder_reply = None
         GameUI.display_positions()
         
         # Prepare the board area once at the start
@@ -108,10 +206,17 @@ class GameController:
             
             # Get and make move
             if is_human:
+                pondering = self._should_ponder()
+                if pondering:
+                    self._load_ai()
+                    ai_mark = 'O' if self.game.current_player == 'X' else 'X'
+                    self.ponderer.start(self.game.board, self.game.current_player, ai_mark)
                 position = PlayerInput.get_human_move(
                     self.game.current_player,
                     self.game.is_valid_move
                 )
+                if pondering:
+                    self._ponder_reply = self.ponderer.take(position)
                 self.game.make_move(position)
             else:
                 # computer move
@@ -172,72 +277,128 @@ class GameController:
         
         GameUI.display_goodbye()
     
-    def play_game_auto(self):
+    def play_game_auto(self, rng=random):
         """Play a single game in auto mode (computer vs computer, no UI)
-        
+
+        Args:
+            rng: Source of randomness for the starting player and the agents'
+                random choices (the global ``random`` module by default)
+
         Returns:
             str or None: Winner ('X', 'O') or None for draw
         """
         self.game.reset()
+        self._refresh_ai()
         
-        if random.random() < 0.5:
+        if rng.random() < 0.5:
             self.game.current_player = 'O'
-            
+        self.last_start = self.game.current_player
+
+        # With --deterministic, an agent playing itself always produces the same
+        # game for a given starting player, so replay the outcome from the cache.
+        # Replayed games make no moves and so add nothing to the latency stats.
+        fp = self._current_agent_fingerprint()
+        if fp is not None:
+            key = (fp, fp, self.game.current_player, ())
+            if key in self.result_cache.results:
+                self.result_cache.hits += 1
+                self.last_moves = self._cached_moves.get(key, ())
+                return self.result_cache.results[key]
+            self.result_cache.misses += 1
+            winner = self._play_auto_moves(rng)
+            self.result_cache.results[key] = winner
+            self._cached_moves[key] = self.last_moves
+            return winner
+        return self._play_auto_moves(rng)
+
+    def _current_agent_fingerprint(self):
+        """Fingerprint of the loaded agent if deterministic play was requested
+        and the agent's play is deterministic, else None"""
+        if not self.deterministic:
+            return None
+        self._load_ai()
+        if PlayerInput._ai_kind == "rl":
+            agent = self._rl_agent
+        elif PlayerInput._ai_kind == "dq":
+            agent = self._dq_agent
+        else:
+            return None
+        if agent is None:
+            return None
+        if self._auto_fingerprint[0] is not agent:
+            self._auto_fingerprint = (agent, agent_fingerprint(agent))
+        return self._auto_fingerprint[1]
+
+    def _play_auto_moves(self, rng=random):
+        """Play the current auto game to the end and return the winner"""
+        moves = []
         while True:
             # Get computer move using shared helper
-            position = self._get_ai_move()
+            position = self._get_ai_move(rng)
             
             if position is not None:
                 self.game.make_move(position)
+                moves.append(position)
             
             # Check for winner
             winner = self.game.check_winner()
             if winner:
+                self.last_moves = tuple(moves)
                 return winner
             
             # Check for draw
             if self.game.is_board_full():
+                self.last_moves = tuple(moves)
                 return None  # Draw
             
             # Switch to next player
             self.game.switch_player()
     
-    def run_auto(self, num_games):
+    def run_auto(self, num_games, jobs=1, seed=None, game_log=None):
         """Run multiple games in auto mode (computer vs computer)
         
         Args:
             num_games: Number of games to play
+            jobs: Number of worker processes (1 plays in this process)
+            seed: Tournament seed; the same seed gives the same totals for any jobs
+            game_log: Path of a binary game log to append every game to
         """
         print("\n==================================================")
         print("           TIC TAC TOE - AUTO MODE")
         print("==================================================")
         print(f"\n  Running {num_games} games (Computer vs Computer)...")
+        if jobs > 1:
+            print(f"  Using {jobs} worker processes")
         print("  Please wait...\n")
         
         # Set to computer vs computer mode
         self.num_human_players = 0
+        self.quiet = True
         
         # Ask which AI type to use
         PlayerInput._ai_kind = PlayerInput._ask_ai_kind()
         
-        # Statistics
-        wins_x = 0
-        wins_o = 0
-        draws = 0
-        
+        # Show progress roughly every 10% (and at least every 10 games)
+        report_every = max(10, num_games // 10)
+        next_report = [report_every]
+
+        def progress(done, total):
+            if done >= next_report[0]:
+                print(f"  Completed {done} / {total} games...")
+                while next_report[0] <= done:
+                    next_report[0] += report_every
+
         # Play all games
-        for i in range(num_games):
-            winner = self.play_game_auto()
-            if winner == 'X':
-                wins_x += 1
-            elif winner == 'O':
-                wins_o += 1
-            else:
-                draws += 1
-            
-            # Show progress every 10 games
-            if (i + 1) % 10 == 0:
-                print(f"  Completed {i + 1} / {num_games} games...")
+        if game_log:
+            with GameLogWriter(game_log) as writer:
+                results = run_tournament(self, num_games, jobs=jobs, seed=seed,
+                                         progress=progress, record=writer.write)
+            print(f"  Logged {writer.games} games -> {game_log}")
+        else:
+            results = run_tournament(self, num_games, jobs=jobs, seed=seed, progress=progress)
+        if self.result_cache.hits:
+            print(f"  Replayed {self.result_cache.hits} deterministic games from the result cache")
+        wins_x, wins_o, draws = results['X'], results['O'], results['Draw']
         
         # Display results
         print("\n==================================================")
@@ -247,4 +408,10 @@ class GameController:
         print(f"\n  Player X wins:      {wins_x:4d}  ({wins_x / num_games * 100:5.1f}%)")
         print(f"  Player O wins:      {wins_o:4d}  ({wins_o / num_games * 100:5.1f}%)")
         print(f"  Draws:              {draws:4d}  ({draws / num_games * 100:5.1f}%)")
+        if self.latency.moves:
+            print("\n  AI move latency:")
+            print(self.latency.report())
+            if self.result_cache.hits:
+                print(f"  ({self.result_cache.hits} replayed games are not included)")
         print("\n==================================================\n")
+        return results
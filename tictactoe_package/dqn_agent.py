@@ -1,13 +1,15 @@
 # dqn_agent.py
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Deque
+from typing import Callable, ClassVar, List, Tuple, Optional, Deque
 from collections import deque
+import hashlib
 import random
 import math
 import torch
 import torch.nn as nn
 import torch.optim as optim
+from .symmetry import board_symmetries, inverse_permutation
 
 # ----- Constants -----
 
@@ -19,6 +21,7 @@ def encode_board(board: List[str], current_player: str) -> torch.Tensor:
     """
     One-hot encode each cell: [empty, X, O] => 3 * 9 = 27
     Append current_player scalar (+1 for X, -1 for O) => 28 total inputs.
+    Larger boards give 3 * cells + 1 inputs (see input_size).
     """
     mapping = {' ': [1, 0, 0], 'X': [0, 1, 0], 'O': [0, 0, 1]}
     vec = []
@@ -27,10 +30,54 @@ def encode_board(board: List[str], current_player: str) -> torch.Tensor:
     vec.append(1.0 if current_player == 'X' else -1.0)
     return torch.tensor(vec, dtype=torch.float32)
 
+def input_size(cells: int) -> int:
+    """Length of encode_board's output for a board of ``cells`` cells."""
+    return 3 * cells + 1
+
+_CELL_CODE = {' ': 0, 'X': 1, 'O': 2}
+
+def encode_batch(boards: List[List[str]], players: List[str]) -> torch.Tensor:
+    """Encode many positions at once; row i equals encode_board(boards[i], players[i])."""
+    cells = torch.tensor([[_CELL_CODE[v] for v in b] for b in boards], dtype=torch.long)
+    onehot = torch.nn.functional.one_hot(cells, 3).to(torch.float32).view(len(boards), -1)
+    side = torch.tensor([[1.0 if p == 'X' else -1.0] for p in players])
+    return torch.cat([onehot, side], dim=1)
+
 def legal_mask(board: List[str]) -> torch.Tensor:
     """1 for legal actions, 0 for illegal."""
     return torch.tensor([1.0 if v == ' ' else 0.0 for v in board], dtype=torch.float32)
 
+# ----- Explanations -----
+
+@dataclass
+class Explanation:
+    """Why the agent picked a move: the top-k legal candidates by Q-value."""
+    board: Tuple[str, ...]
+    current_player: str
+    action: int
+    candidates: List[Tuple[int, float]]   # (position from 0, Q-value), best first
+
+ExplainCallback = Callable[[Explanation], None]
+
+def print_explanation(expl: Explanation) -> None:
+    """Subscriber that reproduces the classic console output."""
+    print("  [Why] Top candidates:", ", ".join([f"{i+1}: {v:.3f}" for i, v in expl.candidates]))
+
+class ExplainLog:
+    """Ring buffer subscriber that keeps the last ``maxlen`` explanations."""
+
+    def __init__(self, maxlen: int = 1000):
+        self.records: Deque[Explanation] = deque(maxlen=maxlen)
+
+    def __call__(self, expl: Explanation) -> None:
+        self.records.append(expl)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def clear(self) -> None:
+        self.records.clear()
+
 # ----- Network -----
 
 class QNet(nn.Module):
@@ -54,6 +101,8 @@ class DQNConfig:
     gamma: float = 0.99
     lr: float = 1e-3
     batch_size: int = 64
+    learn_every: int = 1                  # run a learning round every K env steps
+    gradient_steps: int = 1               # optimizer steps per learning round
     buffer_size: int = 50_000
     start_training_after: int = 500       # warm-up transitions
     target_sync_every: int = 200          # steps (changed from 500)
@@ -62,6 +111,16 @@ class DQNConfig:
     epsilon_decay_steps: int = 20_000     # changed from 5_000
     device: str = "cuda" if torch.cuda.is_available() else "cpu"
     verbose: bool = True                  # print Q-value explanations during action selection
+    explain_top_k: int = 3                # candidates reported to explain subscribers
+    symmetry_augment: bool = False        # expand each sampled transition into its symmetric variants
+    replay_path: Optional[str] = None     # keep the replay buffer in this file (see replay_store.py)
+    rows: int = 3                         # board shape; the network has one output per cell
+    cols: int = 3
+    k: int = 3                            # marks in a row to win (used by the training loop)
+
+    @property
+    def cells(self) -> int:
+        return self.rows * self.cols
 
 @dataclass
 class DQNAgent:
@@ -70,14 +129,67 @@ class DQNAgent:
     target: QNet = field(init=False)
     opt: optim.Optimizer = field(init=False)
     step_count: int = 0
+    grad_steps: int = 0                   # total optimizer steps taken so far
+    last_loss: float = 0.0                # loss of the most recent gradient step
+    last_td_error: float = 0.0            # mean |TD error| of the most recent gradient step
+    round_loss: float = 0.0               # mean loss over the steps of the last maybe_learn round
+    round_td_error: float = 0.0           # mean |TD error| over the same steps
     buffer: Deque = field(default_factory=lambda: deque(maxlen=DQNConfig().buffer_size))
+    explain_subscribers: List[ExplainCallback] = field(default_factory=list)
+    deterministic: ClassVar[bool] = True  # greedy pick_move has no randomness
 
     def __post_init__(self):
-        self.qnet = QNet().to(self.cfg.device)
-        self.target = QNet().to(self.cfg.device)
+        cells = self.cfg.cells
+        self.qnet = QNet(input_size(cells), out_dim=cells).to(self.cfg.device)
+        self.target = QNet(input_size(cells), out_dim=cells).to(self.cfg.device)
         self.target.load_state_dict(self.qnet.state_dict())
         self.opt = optim.Adam(self.qnet.parameters(), lr=self.cfg.lr)
         self.loss_fn = nn.MSELoss()
+        self._last_sync_step = 0
+        # Index tables for symmetry augmentation: state features, cells and actions
+        symmetries = board_symmetries(self.cfg.rows, self.cfg.cols)
+        self._sym_cells = torch.tensor(symmetries, dtype=torch.long, device=self.cfg.device)  # (G, cells)
+        self._sym_states = torch.tensor(
+            [[3 * src + j for src in p for j in range(3)] + [3 * cells] for p in symmetries],
+            dtype=torch.long, device=self.cfg.device)                                              # (G, inputs)
+        self._sym_actions = torch.tensor(
+            [inverse_permutation(p) for p in symmetries], dtype=torch.long, device=self.cfg.device)  # (G, cells)
+        if self.cfg.replay_path:
+            from .replay_store import MemmapReplay
+            self.buffer = MemmapReplay(self.cfg.replay_path, self.cfg.buffer_size, cells)
+        # transitions already stored (a file-backed buffer from an earlier run) count as warm-up
+        self._warm_transitions = len(self.buffer)
+        if self.cfg.verbose:
+            self.subscribe_explain(print_explanation)
+
+    # ---------- Explanations ----------
+
+    def subscribe_explain(self, callback: ExplainCallback) -> None:
+        """Call ``callback`` with an Explanation for every greedy decision."""
+        self.explain_subscribers.append(callback)
+
+    def unsubscribe_explain(self, callback: ExplainCallback) -> None:
+        if callback in self.explain_subscribers:
+            self.explain_subscribers.remove(callback)
+
+    def _make_explanation(self, board: List[str], current_player: str, q: torch.Tensor,
+                          action: int) -> Explanation:
+        vals = q.cpu().tolist()
+        pairs = [(i, vals[i]) for i in range(len(board)) if board[i] == ' ']
+        pairs.sort(key=lambda x: x[1], reverse=True)
+        return Explanation(tuple(board), current_player, action, pairs[:self.cfg.explain_top_k])
+
+    def _explain(self, board: List[str], current_player: str, q: torch.Tensor, action: int) -> None:
+        expl = self._make_explanation(board, current_player, q, action)
+        for callback in list(self.explain_subscribers):
+            callback(expl)
+
+    @torch.no_grad()
+    def explain(self, board: List[str], current_player: str) -> Explanation:
+        """Explanation of the greedy move, without notifying subscribers (safe on shared agents)."""
+        q = self.qnet(encode_board(board, current_player).to(self.cfg.device).unsqueeze(0)).squeeze(0)
+        q_masked = q.masked_fill(legal_mask(board).to(self.cfg.device) < 0.5, ILLEGAL_ACTION_VALUE)
+        return self._make_explanation(board, current_player, q, int(torch.argmax(q_masked).item()))
 
     # ---------- Policy ----------
 
@@ -89,7 +201,7 @@ class DQNAgent:
 
     @torch.no_grad()
     def select_action(self, board: List[str], current_player: str, explore: bool) -> int:
-        mask = legal_mask(board).to(self.cfg.device)   # (9,)
+        mask = legal_mask(board).to(self.cfg.device)   # (cells,)
         legal_indices = [i for i, m in enumerate(mask.tolist()) if m > 0.5]
         if not legal_indices:
             return -1
@@ -97,18 +209,16 @@ class DQNAgent:
         if explore and random.random() < self.epsilon():
             return random.choice(legal_indices)
 
-        s = encode_board(board, current_player).to(self.cfg.device).unsqueeze(0)  # (1,28)
-        q = self.qnet(s).squeeze(0)  # (9,)
-        # explain why (only if verbose mode is enabled)
-        if self.cfg.verbose:
-            vals = q.cpu().numpy().tolist()
-            pairs = [(i, vals[i]) for i in range(9) if board[i] == ' ']
-            pairs.sort(key=lambda x: x[1], reverse=True)
-            print("  [Why] Top candidates:", ", ".join([f"{i+1}: {v:.3f}" for i, v in pairs[:3]]))
+        s = encode_board(board, current_player).to(self.cfg.device).unsqueeze(0)  # (1,inputs)
+        q = self.qnet(s).squeeze(0)  # (cells,)
         # mask illegal moves by setting them to very low value
         q_masked = q.clone()
         q_masked[mask < 0.5] = -1e9
-        return int(torch.argmax(q_masked).item())
+        action = int(torch.argmax(q_masked).item())
+        # explain why; nothing is synced to the CPU unless someone is listening
+        if self.explain_subscribers:
+            self._explain(board, current_player, q, action)
+        return action
 
     # ---------- Replay memory ----------
 
@@ -119,19 +229,42 @@ class DQNAgent:
     # ---------- Learning ----------
 
     def can_learn(self) -> bool:
-        return len(self.buffer) >= self.cfg.batch_size and self.step_count >= self.cfg.start_training_after
-
-    def learn(self):
+        return (len(self.buffer) >= self.cfg.batch_size
+                and self.step_count + self._warm_transitions >= self.cfg.start_training_after)
+
+    def maybe_learn(self) -> int:
+        """Run a learning round if this env step is due for one.
+
+        Every ``cfg.learn_every`` env steps this performs ``cfg.gradient_steps``
+        optimizer steps on batches of ``cfg.batch_size``. Returns the number of
+        gradient steps actually taken; ``round_loss`` and ``round_td_error``
+        hold their means.
+        """
+        if self.step_count % max(1, self.cfg.learn_every) != 0:
+            return 0
+        taken = 0
+        loss_sum = td_sum = 0.0
+        for _ in range(max(1, self.cfg.gradient_steps)):
+            loss = self.learn()
+            if loss is None:
+                break
+            taken += 1
+            loss_sum += loss
+            td_sum += self.last_td_error
+        if taken:
+            self.round_loss = loss_sum / taken
+            self.round_td_error = td_sum / taken
+        return taken
+
+    def learn(self) -> Optional[float]:
+        """Take one gradient step on a sampled batch; returns the loss or None."""
         if not self.can_learn():
-            return
+            return None
 
-        batch = random.sample(self.buffer, self.cfg.batch_size)
-        s, a, r, s_next, done, mask_next = zip(*batch)
-        s = torch.stack(s).to(self.cfg.device)             # (B, 28)
-        a = torch.tensor(a, dtype=torch.long, device=self.cfg.device)  # (B,)
-        r = torch.tensor(r, dtype=torch.float32, device=self.cfg.device)  # (B,)
-        s_next = torch.stack(s_next).to(self.cfg.device)   # (B, 28)
-        done = torch.tensor(done, dtype=torch.float32, device=self.cfg.device)  # (B,)
+        s, a, r, s_next, done, mask_next = self._sample_batch()
+
+        if self.cfg.symmetry_augment:
+            s, a, r, s_next, done, mask_next = self._augment(s, a, r, s_next, done, mask_next)
 
         # Q(s,a)
         q = self.qnet(s).gather(1, a.view(-1, 1)).squeeze(1)  # (B,)
@@ -139,10 +272,9 @@ class DQNAgent:
         # Target: r + gamma * max_a' Q_target(s',a') * (1 - done)
         # Mask illegal actions in next state before taking max
         with torch.no_grad():
-            q_next_all = self.target(s_next)  # (B, 9)
+            q_next_all = self.target(s_next)  # (B, cells)
             # Apply mask_next if available to prevent illegal move bootstrapping
-            if mask_next[0] is not None:
-                mask_next = torch.stack(mask_next).to(self.cfg.device)  # (B, 9)
+            if mask_next is not None:
                 q_next_all = q_next_all.masked_fill(mask_next < 0.5, ILLEGAL_ACTION_VALUE)
             q_next = q_next_all.max(1).values
             target = r + self.cfg.gamma * q_next * (1.0 - done)
@@ -151,15 +283,68 @@ class DQNAgent:
         self.opt.zero_grad()
         loss.backward()
         self.opt.step()
+        self.grad_steps += 1
+        self.last_loss = loss.item()
+        self.last_td_error = (target - q).detach().abs().mean().item()
 
-        # Periodically sync target network
-        if self.step_count % self.cfg.target_sync_every == 0:
+        # Periodically sync target network. Compare against the last sync so a
+        # sync is not skipped when learning only runs every K env steps.
+        if self.step_count - self._last_sync_step >= self.cfg.target_sync_every:
             self.target.load_state_dict(self.qnet.state_dict())
+            self._last_sync_step = self.step_count
+
+        return self.last_loss
+
+    def _sample_batch(self):
+        """Uniformly sampled batch of transition tensors from the replay buffer."""
+        if not isinstance(self.buffer, deque):
+            return self.buffer.sample(self.cfg.batch_size, self.cfg.device)
+        batch = random.sample(self.buffer, self.cfg.batch_size)
+        s, a, r, s_next, done, mask_next = zip(*batch)
+        s = torch.stack(s).to(self.cfg.device)             # (B, inputs)
+        a = torch.tensor(a, dtype=torch.long, device=self.cfg.device)  # (B,)
+        r = torch.tensor(r, dtype=torch.float32, device=self.cfg.device)  # (B,)
+        s_next = torch.stack(s_next).to(self.cfg.device)   # (B, inputs)
+        done = torch.tensor(done, dtype=torch.float32, device=self.cfg.device)  # (B,)
+        mask_next = None if mask_next[0] is None else torch.stack(mask_next).to(self.cfg.device)  # (B, cells)
+        return s, a, r, s_next, done, mask_next
+
+    def _augment(self, s, a, r, s_next, done, mask_next):
+        """Expand a batch of B transitions into G*B by applying every board symmetry.
+
+        G is 8 on square boards and 4 otherwise. Pure index permutations on
+        the batch tensors; row ``b * G + g`` holds
+        transition ``b`` under symmetry ``g``.
+        """
+        n_sym = self._sym_states.shape[0]
+        s = s[:, self._sym_states].reshape(-1, s.shape[1])
+        s_next = s_next[:, self._sym_states].reshape(-1, s_next.shape[1])
+        a = self._sym_actions[:, a].t().reshape(-1)
+        r = r.repeat_interleave(n_sym)
+        done = done.repeat_interleave(n_sym)
+        if mask_next is not None:
+            mask_next = mask_next[:, self._sym_cells].reshape(-1, mask_next.shape[1])
+        return s, a, r, s_next, done, mask_next
 
     # ---------- Persistence ----------
 
+    def fingerprint(self) -> str:
+        """Hash of the Q-network weights; equal weights give equal fingerprints."""
+        h = hashlib.sha1()
+        for name, tensor in self.qnet.state_dict().items():
+            h.update(name.encode("utf-8"))
+            h.update(tensor.detach().cpu().contiguous().numpy().tobytes())
+        return h.hexdigest()
+
     def save(self, path="dqn_policy.pt"):
         torch.save(self.qnet.state_dict(), path)
+        if not isinstance(self.buffer, deque):
+            self.buffer.flush()  # a file-backed replay buffer is kept with the policy
+
+    def close(self):
+        """Release a file-backed replay buffer; the policy stays usable for play"""
+        if not isinstance(self.buffer, deque):
+            self.buffer.close()
 
     def load(self, path="dqn_policy.pt"):
         self.qnet.load_state_dict(torch.load(path, map_location=self.cfg.device))
@@ -168,5 +353,15 @@ class DQNAgent:
     # ---------- Inference helper for the controller (no exploration) ----------
 
     @torch.no_grad()
-    def pick_move(self, board: List[str], current_player: str) -> int:
+    def pick_move(self, board: List[str], current_player: str, rng=random) -> int:
+        # greedy, so ``rng`` is never drawn from
         return self.select_action(board, current_player, explore=False)
+
+    @torch.no_grad()
+    def pick_moves(self, boards: List[List[str]], players: List[str]) -> List[int]:
+        """Greedy moves for many positions with a single forward pass (-1 if no legal move)."""
+        s = encode_batch(boards, players).to(self.cfg.device)               # (B,inputs)
+        empty = s[:, 0:-1:3] > 0.5                                          # (B,cells) legal cells
+        q = self.qnet(s).masked_fill(~empty, ILLEGAL_ACTION_VALUE)
+        actions = q.argmax(dim=1).tolist()
+        return [a if any(row) else -1 for a, row in zip(actions, empty.tolist())]
@@ -0,0 +1,231 @@
+"""
+Exact evaluation of TicTacToe policies
+The game tree is small enough to walk completely, so an agent's strength
+can be computed exactly instead of sampled.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .heuristic import LINES
+
+Board = Tuple[str, ...]
+
+RESULT_NAMES = {1: "win", 0: "draw", -1: "loss"}
+
+
+def winner_of(board: Board) -> Optional[str]:
+    """Winner of a board tuple, or None"""
+    for a, b, c in LINES:
+        if board[a] != ' ' and board[a] == board[b] == board[c]:
+            return board[a]
+    return None
+
+
+def other(mark: str) -> str:
+    return 'O' if mark == 'X' else 'X'
+
+
+class PolicyCache:
+    """Memoizes an agent's greedy move per (board, player to move)"""
+
+    def __init__(self, agent):
+        self.agent = agent
+        self.moves: Dict[Tuple[Board, str], int] = {}
+
+    def move(self, board: Board, mark: str) -> int:
+        key = (board, mark)
+        if key not in self.moves:
+            self.moves[key] = self.agent.pick_move(list(board), mark)
+        return self.moves[key]
+
+
+@dataclass
+class ExploitReport:
+    """Worst-case result of a policy against a perfect adversary"""
+    mark: str                       # side the agent plays
+    worst_case: int                 # +1 win, 0 draw, -1 loss (agent's point of view)
+    losing_lines: List[Tuple[int, ...]] = field(default_factory=list)  # move sequences from the start
+    positions: int = 0              # distinct agent decisions evaluated
+
+    @property
+    def result(self) -> str:
+        return RESULT_NAMES[self.worst_case]
+
+
+def exploitability(agent, mark: str, starting: str = 'X',
+                   policy: Optional[PolicyCache] = None) -> ExploitReport:
+    """Walk every game the agent's greedy policy can reach as ``mark``.
+
+    The adversary tries every legal move, so the minimum over the tree is the
+    agent's exact result against a perfect opponent. Every line that ends in
+    an agent loss is collected during the same walk. An illegal move by the
+    agent counts as a loss. The agent's ``pick_move`` must be deterministic
+    (e.g. RLAgent(deterministic=True) or a DQNAgent).
+    """
+    policy = policy or PolicyCache(agent)
+    report = ExploitReport(mark, 1)
+    seen_before = len(policy.moves)
+    board = [' '] * 9
+    line: List[int] = []
+
+    def walk(to_move: str) -> int:
+        if to_move == mark:
+            move = policy.move(tuple(board), to_move)
+            if not (0 <= move < 9) or board[move] != ' ':
+                report.losing_lines.append(tuple(line) + (move,))
+                return -1
+            moves = [move]
+        else:
+            moves = [i for i in range(9) if board[i] == ' ']
+        worst = 1
+        for move in moves:
+            board[move] = to_move
+            line.append(move)
+            winner = winner_of(tuple(board))
+            if winner is not None:
+                value = 1 if winner == mark else -1
+                if value < 0:
+                    report.losing_lines.append(tuple(line))
+            elif ' ' not in board:
+                value = 0
+            else:
+                value = walk(other(to_move))
+            line.pop()
+            board[move] = ' '
+            worst = min(worst, value)
+        return worst
+
+    report.worst_case = walk(starting)
+    report.positions = len(policy.moves) - seen_before
+    return report
+
+
+@dataclass
+class ResultDistribution:
+    """Exact probabilities of each result from the agent's point of view"""
+    win: float
+    draw: float
+    loss: float
+
+    @property
+    def score(self) -> float:
+        """Expected score: 1 for a win, 0.5 for a draw"""
+        return self.win + 0.5 * self.draw
+
+
+OpponentPolicy = Callable[[List[str], str], Dict[int, float]]
+
+
+def uniform_random_distribution(board: List[str], mark: str) -> Dict[int, float]:
+    """Move probabilities of an opponent playing uniformly at random"""
+    legal = [i for i, v in enumerate(board) if v == ' ']
+    return {i: 1.0 / len(legal) for i in legal}
+
+
+def expected_result(agent, mark: str, opponent: OpponentPolicy = uniform_random_distribution,
+                    starting: str = 'X', policy: Optional[PolicyCache] = None) -> ResultDistribution:
+    """Exact win/draw/loss probabilities of a greedy agent against a stochastic opponent.
+
+    ``opponent(board, mark)`` returns the probability of each of its moves.
+    Probabilities are propagated through the reachable positions with
+    memoization, so each position is evaluated once. An illegal move by the
+    agent counts as a loss.
+    """
+    policy = policy or PolicyCache(agent)
+    memo: Dict[Tuple[Board, str], Tuple[float, float, float]] = {}
+
+    def value(board: Board, to_move: str) -> Tuple[float, float, float]:
+        key = (board, to_move)
+        if key in memo:
+            return memo[key]
+        if to_move == mark:
+            move = policy.move(board, to_move)
+            if not (0 <= move < 9) or board[move] != ' ':
+                memo[key] = (0.0, 0.0, 1.0)
+                return memo[key]
+            choices = {move: 1.0}
+        else:
+            choices = opponent(list(board), to_move)
+        w = d = l = 0.0
+        for move, p in choices.items():
+            child = board[:move] + (to_move,) + board[move + 1:]
+            winner = winner_of(child)
+            if winner is not None:
+                if winner == mark:
+                    w += p
+                else:
+                    l += p
+            elif ' ' not in child:
+                d += p
+            else:
+                cw, cd, cl = value(child, other(to_move))
+                w += p * cw
+                d += p * cd
+                l += p * cl
+        memo[key] = (w, d, l)
+        return memo[key]
+
+    return ResultDistribution(*value((' ',) * 9, starting))
+
+
+class Solver:
+    """Negamax values of positions, memoized across calls.
+
+    Values are from the point of view of the side to move: +1 for a win, 0
+    for a draw, -1 for a loss. With ``discount`` < 1 a result ``k`` moves
+    away is worth ``discount ** (k - 1)``, so quicker wins score higher.
+    """
+
+    def __init__(self, discount: float = 1.0):
+        self.discount = discount
+        self.memo: Dict[Tuple[Board, str], float] = {}
+
+    def value(self, board: Board, to_move: str) -> float:
+        """Value of a non-terminal position for ``to_move``"""
+        key = (board, to_move)
+        if key not in self.memo:
+            self.memo[key] = max(self.action_values(board, to_move).values())
+        return self.memo[key]
+
+    def action_values(self, board: Board, to_move: str) -> Dict[int, float]:
+        """Value of each legal move for ``to_move``"""
+        values = {}
+        for move in range(9):
+            if board[move] != ' ':
+                continue
+            child = board[:move] + (to_move,) + board[move + 1:]
+            if winner_of(child) is not None:
+                values[move] = 1.0
+            elif ' ' not in child:
+                values[move] = 0.0
+            else:
+                values[move] = -self.discount * self.value(child, other(to_move))
+        return values
+
+    def positions(self, starting: Tuple[str, ...] = ('X', 'O')):
+        """Yield (board, to_move, action values) for every reachable non-terminal position"""
+        for first in starting:
+            seen = set()
+            stack = [((' ',) * 9, first)]
+            while stack:
+                board, to_move = stack.pop()
+                if (board, to_move) in seen:
+                    continue
+                seen.add((board, to_move))
+                yield board, to_move, self.action_values(board, to_move)
+                for move in range(9):
+                    if board[move] == ' ':
+                        child = board[:move] + (to_move,) + board[move + 1:]
+                        if winner_of(child) is None and ' ' in child:
+                            stack.append((child, other(to_move)))
+
+
+def format_line(line: Tuple[int, ...], starting: str = 'X') -> str:
+    """Human-readable move sequence using positions 1-9"""
+    mark = starting
+    parts = []
+    for move in line:
+        parts.append(f"{mark}{move + 1}")
+        mark = other(mark)
+    return " ".join(parts)
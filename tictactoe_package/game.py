@@ -1,56 +1,142 @@
 """
 Core game logic for TicTacToe
 Handles board state, move validation, and winner detection
+
+The engine plays any m,n,k-game: a ``rows`` x ``cols`` board where ``k`` in a
+row wins. Classic TicTacToe is the default 3,3,3. Line tables are built once
+per board shape, so checking the last move only walks the k-1 cells on
+either side of it in each of the 4 directions, whatever the board size.
 """
 
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+Ray = Tuple[int, ...]                        # cells stepping away from a cell, nearest first
+Rays = Tuple[Tuple[Tuple[Ray, Ray], ...], ...]  # per cell, per direction: (backward, forward)
+
+_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))  # row, column, diagonal, anti-diagonal
+
+
+@lru_cache(maxsize=None)
+def win_lines(rows: int = 3, cols: int = 3, k: int = 3) -> Tuple[Tuple[int, ...], ...]:
+    """Every run of ``k`` cells in a row, column or diagonal"""
+    lines = []
+    for dr, dc in _DIRECTIONS:
+        for r in range(rows):
+            for c in range(cols):
+                end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                if 0 <= end_r < rows and 0 <= end_c < cols:
+                    lines.append(tuple((r + dr * i) * cols + c + dc * i for i in range(k)))
+    return tuple(lines)
+
+
+@lru_cache(maxsize=None)
+def line_rays(rows: int = 3, cols: int = 3, k: int = 3) -> Rays:
+    """For each cell and direction, the up to k-1 cells behind and ahead of it"""
+    def ray(r, c, dr, dc):
+        cells = []
+        for i in range(1, k):
+            rr, cc = r + dr * i, c + dc * i
+            if not (0 <= rr < rows and 0 <= cc < cols):
+                break
+            cells.append(rr * cols + cc)
+        return tuple(cells)
+
+    return tuple(
+        tuple((ray(r, c, -dr, -dc), ray(r, c, dr, dc)) for dr, dc in _DIRECTIONS)
+        for r in range(rows) for c in range(cols))
+
+
+def makes_line(board: List[str], position: int, mark: str, rays: Rays, k: int) -> bool:
+    """Whether ``mark`` on ``position`` would be part of k in a row"""
+    for back, ahead in rays[position]:
+        run = 1
+        for i in back:
+            if board[i] != mark:
+                break
+            run += 1
+        for i in ahead:
+            if board[i] != mark:
+                break
+            run += 1
+        if run >= k:
+            return True
+    return False
+
 
 class TicTacToe:
     """Main TicTacToe game class"""
-    
-    def __init__(self):
+
+    def __init__(self, rows: int = 3, cols: int = 3, k: int = 3):
         """Initialize the game board"""
-        self.board = [' ' for _ in range(9)]
-        self.current_player = 'X'
-        
+        if rows < 1 or cols < 1 or not 1 <= k <= max(rows, cols):
+            raise ValueError(f"no {k}-in-a-row fits on a {rows}x{cols} board")
+        self.rows, self.cols, self.k = rows, cols, k
+        self.size = rows * cols
+        self.lines = win_lines(rows, cols, k)
+        self._rays = line_rays(rows, cols, k)
+        self.reset()
+
     def is_valid_move(self, position):
         """Check if a move is valid"""
-        return 0 <= position < 9 and self.board[position] == ' '
-    
+        return 0 <= position < self.size and self.board[position] == ' '
+
     def make_move(self, position):
         """Make a move on the board"""
         if self.is_valid_move(position):
             self.board[position] = self.current_player
+            self.last_move = position
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot[position] == ' ':
+                snapshot[position] = self.current_player
+                if self._winner is None and self.wins_at(position):
+                    self._winner = self.current_player
+            else:
+                self._snapshot = None  # the cached winner no longer applies
             return True
         return False
-    
+
     def get_available_positions(self):
         """Get list of available positions"""
-        return [i for i in range(9) if self.board[i] == ' ']
-    
-    def check_winner(self):
-        """Check if there's a winner"""
-        # Winning combinations
-        winning_combinations = [
-            [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
-            [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
-            [0, 4, 8], [2, 4, 6]              # Diagonals
-        ]
-        
-        for combo in winning_combinations:
-            if (self.board[combo[0]] == self.board[combo[1]] == self.board[combo[2]] 
-                and self.board[combo[0]] != ' '):
-                return self.board[combo[0]]
+        return [i for i, v in enumerate(self.board) if v == ' ']
+
+    def wins_at(self, position: int) -> bool:
+        """Whether the mark on ``position`` is part of k in a row"""
+        mark = self.board[position]
+        return mark != ' ' and makes_line(self.board, position, mark, self._rays, self.k)
+
+    def check_winner(self) -> Optional[str]:
+        """Check if there's a winner.
+
+        Moves made with ``make_move`` are checked as they are played. If the
+        board was changed any other way (assigned or edited in place), it no
+        longer matches the snapshot of the last check and is scanned in full.
+        """
+        if self._snapshot != self.board:
+            self._winner = self._scan()
+            self._snapshot = self.board.copy()
+        return self._winner
+
+    def _scan(self) -> Optional[str]:
+        board = self.board
+        for line in self.lines:
+            first = board[line[0]]
+            if first != ' ' and all(board[i] == first for i in line[1:]):
+                return first
         return None
-    
+
     def is_board_full(self):
         """Check if the board is full"""
         return ' ' not in self.board
-    
+
     def switch_player(self):
         """Switch to the other player"""
         self.current_player = 'O' if self.current_player == 'X' else 'X'
-    
+
     def reset(self):
         """Reset the game board"""
-        self.board = [' ' for _ in range(9)]
+        self.board: List[str] = [' '] * self.size
         self.current_player = 'X'
+        self.last_move: Optional[int] = None
+        self._snapshot: Optional[List[str]] = self.board.copy()  # the board _winner is for
+        self._winner: Optional[str] = None
@@ -0,0 +1,215 @@
+"""
+Compact binary game records
+Append-only log of complete games: who played, how it was seeded, every move
+and the result, in about 6-7 bytes per game.
+
+File layout: the magic ``TTTG`` once, then a stream of entries. The first
+byte of an entry holds the move count in its low nibble (0-9 for a game);
+the values 13-15 mark control entries instead:
+
+    game     [n | result << 4 | starting O << 6] [flags] [varint agent_x varint agent_o]
+             [varint index] [n moves, 4 bits each, low nibble first]
+    session  0x0D version          -- each writer starts one; agent ids reset
+    seed     0x0E varint seed      -- seed of the games that follow (flags bit 0)
+    agent    0x0F varint id varint length utf-8 name
+
+Results are 0 for a draw, 1 for an X win and 2 for an O win. Flags: bit 1,
+the game has an index (game number or episode), stored unless bit 2 says it
+is the previous index + 1; bit 3, same agents as the previous game.
+"""
+
+import mmap
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+MAGIC = b"TTTG"
+VERSION = 1
+
+_SESSION, _SEED, _AGENT = 0x0D, 0x0E, 0x0F
+_HAS_SEED, _HAS_INDEX, _NEXT_INDEX, _SAME_AGENTS = 0x01, 0x02, 0x04, 0x08
+_RESULT_CODE = {None: 0, 'X': 1, 'O': 2}
+_RESULT_MARK = {0: None, 1: 'X', 2: 'O'}
+
+
+@dataclass(frozen=True)
+class GameRecord:
+    """One finished game"""
+    moves: Tuple[int, ...]          # positions 0-8 in order of play
+    result: Optional[str]           # 'X', 'O' or None for a draw
+    starting: str = 'X'             # side that moved first
+    agent_x: str = ""
+    agent_o: str = ""
+    seed: Optional[int] = None      # seed of the run the game belongs to
+    index: Optional[int] = None     # game number or episode within that run
+
+
+RecordSink = Callable[[GameRecord], None]  # e.g. GameLogWriter.write or list.append
+
+
+def _varint(n: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _read_varint(buf, pos: int) -> Tuple[int, int]:
+    n = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+def encode_moves(moves: Sequence[int]) -> bytes:
+    """Pack moves two per byte, first move in the low nibble"""
+    out = bytearray((len(moves) + 1) // 2)
+    for i, move in enumerate(moves):
+        out[i >> 1] |= move << (4 * (i & 1))
+    return bytes(out)
+
+
+def decode_moves(data, n: int) -> Tuple[int, ...]:
+    return tuple((data[i >> 1] >> (4 * (i & 1))) & 0x0F for i in range(n))
+
+
+class GameLogWriter:
+    """Buffered append-only writer; use as a context manager or call ``close``"""
+
+    def __init__(self, path: str, buffer_bytes: int = 1 << 16):
+        self.path = path
+        self._file = open(path, "ab", buffering=buffer_bytes)
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        self._file.write(bytes((_SESSION, VERSION)))
+        self._agents: Dict[str, int] = {}
+        self._seed: Optional[int] = None
+        self._index: Optional[int] = None
+        self._pair: Optional[Tuple[int, int]] = None
+        self.games = 0
+
+    def _agent_id(self, name: str) -> int:
+        agent_id = self._agents.get(name)
+        if agent_id is None:
+            agent_id = self._agents[name] = len(self._agents)
+            raw = name.encode("utf-8")
+            self._file.write(bytes((_AGENT,)) + _varint(agent_id) + _varint(len(raw)) + raw)
+        return agent_id
+
+    def write(self, record: GameRecord) -> None:
+        n = len(record.moves)
+        if n > 9:
+            raise ValueError(f"a game has at most 9 moves, got {n}")
+        flags = 0
+        if record.seed is not None:
+            flags |= _HAS_SEED
+            if record.seed != self._seed:
+                self._file.write(bytes((_SEED,)) + _varint(record.seed))
+                self._seed = record.seed
+        pair = (self._agent_id(record.agent_x), self._agent_id(record.agent_o))
+        if pair == self._pair:
+            flags |= _SAME_AGENTS
+        index = record.index
+        if index is not None:
+            flags |= _HAS_INDEX
+            if self._index is not None and index == self._index + 1:
+                flags |= _NEXT_INDEX
+        head = n | _RESULT_CODE[record.result] << 4 | (record.starting == 'O') << 6
+        out = bytearray((head, flags))
+        if not flags & _SAME_AGENTS:
+            out += _varint(pair[0]) + _varint(pair[1])
+            self._pair = pair
+        if index is not None and not flags & _NEXT_INDEX:
+            out += _varint(index)
+        self._index = index
+        out += encode_moves(record.moves)
+        self._file.write(out)
+        self.games += 1
+
+    def log(self, moves: Sequence[int], result: Optional[str], starting: str = 'X',
+            agent_x: str = "", agent_o: str = "", seed: Optional[int] = None,
+            index: Optional[int] = None) -> None:
+        self.write(GameRecord(tuple(moves), result, starting, agent_x, agent_o, seed, index))
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "GameLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_games(path: str) -> Iterator[GameRecord]:
+    """Yield the records of a game log one at a time.
+
+    The file is memory-mapped, so only the pages being decoded are read.
+    A truncated final entry (e.g. from a killed writer) is ignored.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            if buf[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a game log")
+            end = len(buf)
+            pos = len(MAGIC)
+            agents: List[str] = []
+            seed: Optional[int] = None
+            x = o = 0
+            last_index: Optional[int] = None
+            try:
+                while pos < end:
+                    head = buf[pos]
+                    kind = head & 0x0F
+                    if kind == _SESSION:
+                        if buf[pos + 1] != VERSION:
+                            raise ValueError(f"unsupported game log version {buf[pos + 1]}")
+                        agents, seed, last_index = [], None, None
+                        pos += 2
+                    elif kind == _SEED:
+                        seed, pos = _read_varint(buf, pos + 1)
+                    elif kind == _AGENT:
+                        agent_id, pos = _read_varint(buf, pos + 1)
+                        length, pos = _read_varint(buf, pos)
+                        if pos + length > end:
+                            return
+                        name = bytes(buf[pos:pos + length]).decode("utf-8")
+                        pos += length
+                        agents[agent_id:agent_id + 1] = [name]
+                    else:
+                        flags = buf[pos + 1]
+                        pos += 2
+                        if not flags & _SAME_AGENTS:
+                            x, pos = _read_varint(buf, pos)
+                            o, pos = _read_varint(buf, pos)
+                        index = None
+                        if flags & _NEXT_INDEX:
+                            index = last_index + 1
+                        elif flags & _HAS_INDEX:
+                            index, pos = _read_varint(buf, pos)
+                        last_index = index
+                        size = (kind + 1) // 2
+                        if pos + size > end:
+                            return
+                        moves = decode_moves(buf[pos:pos + size], kind)
+                        pos += size
+                        yield GameRecord(moves, _RESULT_MARK[(head >> 4) & 0x03],
+                                         'O' if head & 0x40 else 'X', agents[x], agents[o],
+                                         seed if flags & _HAS_SEED else None, index)
+            except IndexError:
+                return  # truncated final entry
+
@@ -0,0 +1,148 @@
+"""
+Heuristic "smart" opponent for TicTacToe
+Win if possible, block, take the center, take a corner, else random.
+
+Boards are reduced to two 9-bit masks (own marks, opponent marks). The
+win/block cell for every legal pair of masks is precomputed once, so each
+tactical check is a single table lookup. Larger m,n,k boards use
+``smart_move_mnk``, which checks each free cell against the engine's line
+tables instead.
+"""
+
+import random
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+from .game import line_rays, makes_line
+
+LINES = [
+    [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
+    [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
+    [0, 4, 8], [2, 4, 6]              # Diagonals
+]
+LINE_MASKS = [sum(1 << i for i in line) for line in LINES]
+
+CENTER = 4
+CORNERS = [0, 2, 6, 8]
+NO_CELL = 255
+
+
+def _build_win_table() -> bytearray:
+    """Map ``own | opp << 9`` to the cell that completes a line for ``own``"""
+    table = bytearray([NO_CELL]) * (1 << 18)
+    for cells in product((0, 1, 2), repeat=9):
+        own = opp = 0
+        for i, v in enumerate(cells):
+            if v == 1:
+                own |= 1 << i
+            elif v == 2:
+                opp |= 1 << i
+        for line in LINE_MASKS:
+            if opp & line == 0 and bin(own & line).count("1") == 2:
+                table[own | opp << 9] = (line & ~own).bit_length() - 1
+                break
+    return table
+
+
+WIN_CELL = _build_win_table()
+
+
+def board_to_masks(board: List[str], mark: str) -> Tuple[int, int]:
+    """Return (own, opponent) bitmasks for ``mark``"""
+    own = opp = 0
+    for i, v in enumerate(board):
+        if v == mark:
+            own |= 1 << i
+        elif v != ' ':
+            opp |= 1 << i
+    return own, opp
+
+
+def winning_cell(own: int, opp: int) -> Optional[int]:
+    """Cell that wins immediately for the ``own`` side, or None"""
+    cell = WIN_CELL[own | opp << 9]
+    return None if cell == NO_CELL else cell
+
+
+def check_winning_move(board: List[str], player: str) -> Optional[int]:
+    """Check if there's a winning move for the player.
+
+    Returns position index if winning move exists, None otherwise.
+    """
+    own, opp = board_to_masks(board, player)
+    return winning_cell(own, opp)
+
+
+def smart_candidates(own: int, opp: int) -> List[int]:
+    """Cells the smart strategy chooses between uniformly; empty on a full board.
+
+    This is the single statement of the strategy's priorities:
+    win, block, center, a corner, else any free cell.
+    """
+    # 1. Win if possible
+    cell = WIN_CELL[own | opp << 9]
+    if cell != NO_CELL:
+        return [cell]
+    # 2. Block opponent from winning
+    cell = WIN_CELL[opp | own << 9]
+    if cell != NO_CELL:
+        return [cell]
+    occupied = own | opp
+    # 3. Take center if available
+    if not occupied & (1 << CENTER):
+        return [CENTER]
+    # 4. Take a corner
+    corners = [c for c in CORNERS if not occupied & (1 << c)]
+    if corners:
+        return corners
+    # 5. Take any available space
+    return [i for i in range(9) if not occupied & (1 << i)]
+
+
+def smart_move_from_masks(own: int, opp: int, rng=random) -> Optional[int]:
+    """Smart opponent strategy on bitmasks (see ``smart_opponent_move``)"""
+    cells = smart_candidates(own, opp)
+    if len(cells) > 1:
+        return rng.choice(cells)
+    return cells[0] if cells else None
+
+
+def smart_opponent_move(board: List[str], opponent_mark: str, rng=random) -> Optional[int]:
+    """
+    Smart opponent strategy:
+    1. Win if possible
+    2. Block opponent from winning
+    3. Take center if available
+    4. Take corner
+    5. Random
+    """
+    own, opp = board_to_masks(board, opponent_mark)
+    return smart_move_from_masks(own, opp, rng)
+
+
+def smart_move_mnk(board: List[str], mark: str, rows: int = 3, cols: int = 3, k: int = 3,
+                   rng=random) -> Optional[int]:
+    """Smart opponent on any m,n,k board: win, block, else a free cell nearest the center.
+
+    The classic 3x3 game uses ``smart_opponent_move``.
+    """
+    if rows == cols == k == 3:
+        return smart_opponent_move(board, mark, rng)
+    empty = [i for i, v in enumerate(board) if v == ' ']
+    if not empty:
+        return None
+    rays = line_rays(rows, cols, k)
+    for side in (mark, 'O' if mark == 'X' else 'X'):
+        for cell in empty:
+            if makes_line(board, cell, side, rays, k):
+                return cell
+    mid_r, mid_c = (rows - 1) / 2, (cols - 1) / 2
+    dist = {c: abs(c // cols - mid_r) + abs(c % cols - mid_c) for c in empty}
+    nearest = min(dist.values())
+    return rng.choice([c for c in empty if dist[c] == nearest])
+
+
+def smart_move_distribution(board: List[str], mark: str) -> Dict[int, float]:
+    """Probability of each move ``smart_opponent_move`` would make"""
+    cells = smart_candidates(*board_to_masks(board, mark))
+    return {c: 1.0 / len(cells) for c in cells}
@@ -0,0 +1,119 @@
+"""
+Latency instrumentation for AI moves
+Fixed-bucket histograms per agent kind, with policy load time kept separately.
+"""
+
+from bisect import bisect_left
+from typing import Dict, List
+
+# Bucket upper bounds in seconds: 1 us doubling every two buckets up to ~12 s
+BUCKET_BOUNDS: List[float] = [1e-6 * 2 ** (i / 2) for i in range(48)]
+
+
+class LatencyHistogram:
+    """Counts of observed durations in fixed, logarithmically spaced buckets"""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)  # last bucket: overflow
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for i, c in enumerate(other.counts):
+            self.counts[i] += c
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, p: float) -> float:
+        """Upper bound of the bucket holding the p-th percentile (p in 0-100)"""
+        if self.count == 0:
+            return 0.0
+        target = p / 100.0 * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if c and seen >= target:
+                bound = BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class LatencyRecorder:
+    """Move latency histograms and policy load times, keyed by agent kind"""
+
+    def __init__(self):
+        self.moves: Dict[str, LatencyHistogram] = {}
+        self.loads: Dict[str, List[float]] = {}
+
+    def record_move(self, kind: str, seconds: float) -> None:
+        hist = self.moves.get(kind)
+        if hist is None:
+            hist = self.moves[kind] = LatencyHistogram()
+        hist.record(seconds)
+
+    def record_load(self, kind: str, seconds: float) -> None:
+        self.loads.setdefault(kind, []).append(seconds)
+
+    def merge(self, other: "LatencyRecorder") -> None:
+        for kind, hist in other.moves.items():
+            self.moves.setdefault(kind, LatencyHistogram()).merge(hist)
+        for kind, times in other.loads.items():
+            self.loads.setdefault(kind, []).extend(times)
+
+    def clear(self) -> None:
+        self.moves.clear()
+        self.loads.clear()
+
+    def as_dict(self) -> Dict:
+        return {
+            "moves": {kind: hist.summary() for kind, hist in self.moves.items()},
+            "loads": {kind: list(times) for kind, times in self.loads.items()},
+        }
+
+    def report(self) -> str:
+        """Plain-text table of p50/p95/p99 move latency per agent kind"""
+        lines = [f"  {'Agent':<8} {'moves':>8} {'p50':>10} {'p95':>10} {'p99':>10}"]
+        for kind, hist in sorted(self.moves.items()):
+            s = hist.summary()
+            lines.append(f"  {kind:<8} {s['count']:8d} {format_latency(s['p50']):>10} "
+                         f"{format_latency(s['p95']):>10} {format_latency(s['p99']):>10}")
+        for kind, times in sorted(self.loads.items()):
+            lines.append(f"  {kind} policy load: {format_latency(max(times))}"
+                         + (f" (x{len(times)})" if len(times) > 1 else ""))
+        return "\n".join(lines)
+
+
+def format_latency(seconds: float) -> str:
+    """Human-readable duration in us, ms or s"""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
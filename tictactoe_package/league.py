@@ -0,0 +1,222 @@
+"""
+Round-robin league over saved policies
+Plays every pairing of the policies in a directory, caches each pairing's
+result on disk by policy checksum and fits Elo ratings to all results.
+"""
+
+import hashlib
+import json
+import math
+import multiprocessing as mp
+import os
+import warnings
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Dict, List, Optional, Tuple
+
+from .agents import load_agent
+from .arena import MatchResult, ResultCache, play_match
+
+POLICY_KINDS = {".pt": "dq", ".json": "rl"}
+CELLS = 9  # matches are played on the classic 3x3 board
+ELO_BASE = 1500.0
+ELO_SCALE = 400.0 / math.log(10)  # Elo points per natural-log unit of strength
+
+
+@dataclass
+class Entrant:
+    """One policy file taking part in the league"""
+    name: str
+    spec: str
+    checksum: str
+
+
+def file_checksum(path: str) -> str:
+    """SHA-256 of a file's contents"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def is_q_table(path: str, cells: int = CELLS) -> bool:
+    """Whether a JSON file has the layout RLAgent.save writes for a board of
+    ``cells`` cells: {"<board>|<player>|<action>": value, ...}
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(raw, dict):
+        return False
+    for key, value in raw.items():
+        parts = key.split("|")
+        if (len(parts) != 3 or not parts[2].isdigit() or parts[1] not in ("X", "O")
+                or len(parts[0]) != cells or set(parts[0]) - set(" XO")
+                or not isinstance(value, (int, float)) or isinstance(value, bool)):
+            return False
+    return True
+
+
+def discover_entrants(directory: str) -> List[Entrant]:
+    """Find 3x3 DQN (*.pt) and Q-table (*.json) policies in ``directory``.
+
+    JSON files that are not 3x3 Q-tables (e.g. a league cache kept alongside
+    the policies, or a table for another board) and networks that fail to
+    load are skipped with a warning.
+    """
+    entrants = []
+    for name in sorted(os.listdir(directory)):
+        kind = POLICY_KINDS.get(os.path.splitext(name)[1].lower())
+        path = os.path.join(directory, name)
+        if kind is None or not os.path.isfile(path):
+            continue
+        if kind == "rl" and not is_q_table(path):
+            warnings.warn(f"skipping {path}: not a 3x3 Q-table")
+            continue
+        entrant = Entrant(name, f"{kind}:{path}", file_checksum(path))
+        if kind == "dq":
+            try:
+                _worker_agent(entrant)  # e.g. a network for another board size
+            except Exception as e:
+                warnings.warn(f"skipping {path}: {e}")
+                continue
+        entrants.append(entrant)
+    return entrants
+
+
+class PairingCache:
+    """On-disk results per pairing, keyed by the two checksums and game count.
+
+    Results are stored for the checksum that sorts first, so a pairing is
+    found whichever way round it is asked for.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.results: Dict[str, List[int]] = {}
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.results = json.load(f)
+
+    @staticmethod
+    def _key(chk_a: str, chk_b: str, games: int) -> Tuple[str, bool]:
+        swapped = chk_b < chk_a
+        lo, hi = (chk_b, chk_a) if swapped else (chk_a, chk_b)
+        return f"{lo}:{hi}:{games}", swapped
+
+    def get(self, chk_a: str, chk_b: str, games: int) -> Optional[MatchResult]:
+        key, swapped = self._key(chk_a, chk_b, games)
+        if key not in self.results:
+            return None
+        w, d, l = self.results[key]
+        return MatchResult(l, d, w) if swapped else MatchResult(w, d, l)
+
+    def put(self, chk_a: str, chk_b: str, games: int, result: MatchResult) -> None:
+        key, swapped = self._key(chk_a, chk_b, games)
+        w, d, l = result.wins, result.draws, result.losses
+        self.results[key] = [l, d, w] if swapped else [w, d, l]
+
+    def save(self) -> None:
+        if self.path:
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.results, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+
+
+_worker_agents: Dict[Tuple[str, str], object] = {}  # (spec, checksum) -> agent, per process
+
+
+def _worker_agent(entrant: Entrant):
+    key = (entrant.spec, entrant.checksum)
+    if key not in _worker_agents:
+        _worker_agents[key] = load_agent(entrant.spec, deterministic=True)
+    return _worker_agents[key]
+
+
+def _play_pairing(job: Tuple[Entrant, Entrant, int]) -> Tuple[Entrant, Entrant, MatchResult]:
+    a, b, games = job
+    seed = int(hashlib.sha256((a.checksum + b.checksum).encode()).hexdigest()[:8], 16)
+    result = play_match(_worker_agent(a), _worker_agent(b), games, seed=seed, cache=ResultCache())
+    return a, b, result
+
+
+def fit_elo(names: List[str], results: Dict[Tuple[str, str], MatchResult],
+            iterations: int = 500) -> Dict[str, Tuple[float, float]]:
+    """Fit Elo ratings to all pairwise results (Bradley-Terry, draws count half).
+
+    The fit is order independent, unlike incremental Elo updates. Each player
+    gets one virtual draw against a 1500-rated anchor so unbeaten or winless
+    players stay finite. Returns name -> (rating, standard error).
+    """
+    score = {n: 0.5 for n in names}   # includes the virtual draw
+    games: Dict[Tuple[str, str], int] = {}
+    for (a, b), r in results.items():
+        score[a] += r.wins + 0.5 * r.draws
+        score[b] += r.losses + 0.5 * r.draws
+        games[(a, b)] = games.get((a, b), 0) + r.games
+    opponents: Dict[str, List[Tuple[str, int]]] = {n: [] for n in names}
+    for (a, b), n in games.items():
+        opponents[a].append((b, n))
+        opponents[b].append((a, n))
+
+    # Minorization-maximization updates on strengths gamma = exp(rating)
+    gamma = {n: 1.0 for n in names}
+    for _ in range(iterations):
+        new = {}
+        for n in names:
+            denom = 1.0 / (gamma[n] + 1.0)   # virtual game against the anchor
+            for m, k in opponents[n]:
+                denom += k / (gamma[n] + gamma[m])
+            new[n] = score[n] / denom
+        gamma = new
+
+    ratings = {}
+    for n in names:
+        # Fisher information of the log-strength gives the standard error
+        info = gamma[n] / (gamma[n] + 1.0) ** 2
+        for m, k in opponents[n]:
+            p = gamma[n] / (gamma[n] + gamma[m])
+            info += k * p * (1 - p)
+        ratings[n] = (ELO_BASE + ELO_SCALE * math.log(gamma[n]), ELO_SCALE / math.sqrt(info))
+    return ratings
+
+
+def run_league(directory: str, games_per_pair: int = 200, jobs: int = 1,
+               cache_path: Optional[str] = None, progress=None):
+    """Play all uncached pairings in ``directory`` and rate every policy.
+
+    Returns (ratings, results) where ratings maps name -> (Elo, std error)
+    and results maps (name A, name B) -> MatchResult from A's point of view.
+    """
+    entrants = discover_entrants(directory)
+    cache = PairingCache(cache_path)
+    results: Dict[Tuple[str, str], MatchResult] = {}
+    todo = []
+    for a, b in combinations(entrants, 2):
+        cached = cache.get(a.checksum, b.checksum, games_per_pair)
+        if cached is not None:
+            results[(a.name, b.name)] = cached
+        else:
+            todo.append((a, b, games_per_pair))
+
+    def record(a: Entrant, b: Entrant, result: MatchResult) -> None:
+        results[(a.name, b.name)] = result
+        cache.put(a.checksum, b.checksum, games_per_pair, result)
+        if progress is not None:
+            progress(a.name, b.name, result)
+
+    if jobs <= 1 or len(todo) <= 1:
+        for job in todo:
+            record(*_play_pairing(job))
+    else:
+        with mp.Pool(jobs) as pool:
+            for a, b, result in pool.imap_unordered(_play_pairing, todo):
+                record(a, b, result)
+    cache.save()
+
+    ratings = fit_elo([e.name for e in entrants], results)
+    return ratings, results
@@ -0,0 +1,82 @@
+"""
+Load generator for the game server
+Many concurrent clients each play full games with random moves while every
+request's round-trip latency is recorded.
+"""
+
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .latency import LatencyHistogram
+
+
+@dataclass
+class LoadResult:
+    """Aggregate numbers from one load run"""
+    clients: int
+    games: int = 0
+    requests: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def requests_per_sec(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+
+async def _request(reader, writer, msg, result: LoadResult):
+    start = time.perf_counter()
+    writer.write(json.dumps(msg).encode("utf-8") + b"\n")
+    await writer.drain()
+    line = await reader.readline()
+    result.latency.record(time.perf_counter() - start)
+    result.requests += 1
+    if not line:
+        raise ConnectionError("server closed the connection")
+    response = json.loads(line)
+    if not response.get("ok"):
+        result.errors += 1
+    return response
+
+
+async def _client(host, port, games, ai, rng: random.Random, result: LoadResult):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(games):
+            human = rng.choice("XO")
+            state = await _request(reader, writer, {"cmd": "new", "ai": ai, "human": human}, result)
+            if not state.get("ok"):
+                continue
+            while state.get("ok") and state["result"] is None:
+                legal = [i for i, v in enumerate(state["board"]) if v == ' ']
+                state = await _request(reader, writer, {"cmd": "move", "game": state["game"],
+                                                        "pos": rng.choice(legal)}, result)
+            if state.get("ok"):
+                await _request(reader, writer, {"cmd": "close", "game": state["game"]}, result)
+                result.games += 1
+    finally:
+        writer.close()
+
+
+async def run_load(host: str = "127.0.0.1", port: int = 8765, clients: int = 100,
+                   games_per_client: int = 10, ai: str = "random",
+                   seed: Optional[int] = None) -> LoadResult:
+    """Run ``clients`` concurrent connections, each playing ``games_per_client`` games"""
+    result = LoadResult(clients)
+    master = random.Random(seed)
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, games_per_client, ai, random.Random(master.random()), result)
+        for _ in range(clients)
+    ))
+    result.elapsed = time.perf_counter() - start
+    return result
@@ -0,0 +1,103 @@
+"""
+Streaming training metrics
+Appends one JSON object per reporting interval to a JSONL file.
+"""
+
+import json
+import time
+from typing import Dict, Optional
+
+PHASES = ("env", "inference", "learn")
+
+
+class TrainingMetrics:
+    """Collects throughput counters during training and streams them as JSONL.
+
+    The trainer calls ``add_time``/``add_steps``/``add_learn`` from its loop and
+    ``end_episode`` once per episode. Every ``log_every`` episodes a record with
+    rates over the last interval is written. The file is opened with a large
+    buffer, so the loop never waits on disk; call ``close`` when done.
+    """
+
+    def __init__(self, path: str, log_every: int = 100, buffer_bytes: int = 1 << 16):
+        self.path = path
+        self.log_every = max(1, log_every)
+        self._file = open(path, "a", encoding="utf-8", buffering=buffer_bytes)
+        self._start = time.perf_counter()
+        self.episodes = 0
+        self.env_steps = 0
+        self.grad_steps = 0
+        self._gauges: Dict = {}
+        self._reset_interval()
+
+    def _reset_interval(self) -> None:
+        self._t0 = time.perf_counter()
+        self._episodes = 0
+        self._env_steps = 0
+        self._grad_steps = 0
+        self._loss_sum = 0.0
+        self._td_sum = 0.0
+        self._learn_count = 0
+        self._times: Dict[str, float] = {phase: 0.0 for phase in PHASES}
+
+    # ---------- Counters ----------
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        self._times[phase] += seconds
+
+    def add_steps(self, n: int = 1) -> None:
+        self.env_steps += n
+        self._env_steps += n
+
+    def add_learn(self, loss: float, td_error: float, grad_steps: int = 1) -> None:
+        self.grad_steps += grad_steps
+        self._grad_steps += grad_steps
+        self._loss_sum += loss
+        self._td_sum += td_error
+        self._learn_count += 1
+
+    def end_episode(self, epsilon: Optional[float] = None, buffer_fill: Optional[int] = None,
+                    q_size: Optional[int] = None, q_stats: Optional[Dict[str, float]] = None) -> None:
+        self.episodes += 1
+        self._episodes += 1
+        self._gauges = {"epsilon": epsilon, "buffer_fill": buffer_fill, "q_size": q_size}
+        if q_stats:
+            self._gauges.update(q_stats)  # e.g. hit rate and evictions of a bounded Q-table
+        if self._episodes >= self.log_every:
+            self.write()
+
+    # ---------- Output ----------
+
+    def write(self) -> Dict:
+        """Write one record for the current interval and start a new one"""
+        now = time.perf_counter()
+        dt = max(now - self._t0, 1e-9)
+        n = self._learn_count
+        record = {
+            "elapsed": round(now - self._start, 4),
+            "episode": self.episodes,
+            "env_steps": self.env_steps,
+            "grad_steps": self.grad_steps,
+            "episodes_per_sec": self._episodes / dt,
+            "env_steps_per_sec": self._env_steps / dt,
+            "grad_steps_per_sec": self._grad_steps / dt,
+            "mean_loss": self._loss_sum / n if n else None,
+            "mean_td_error": self._td_sum / n if n else None,
+        }
+        record.update(self._gauges)
+        for phase in PHASES:
+            record[f"time_{phase}"] = self._times[phase]
+        self._file.write(json.dumps(record) + "\n")
+        self._reset_interval()
+        return record
+
+    def close(self) -> None:
+        if self._episodes:
+            self.write()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
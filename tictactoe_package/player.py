@@ -3,6 +3,7 @@ import os
 import random
 from typing import Callable, List, Optional
 from .rl_agent import RLAgent
+from .registry import AGENTS
 
 class PlayerInput:
     _rl_agent: Optional[RLAgent] = None
@@ -27,28 +28,32 @@ class PlayerInput:
 
     @staticmethod
     def _ask_ai_kind() -> str:
-        raw = input("  Computer type: [R]andom or [L]earning (Q-Learning) or [D]eep Q-Learning? ").strip().lower()
+        raw = input("  Computer type: [R]andom, [L]earning (Q-Learning), [D]eep Q-Learning "
+                    "or [S]earch (alpha-beta)? ").strip().lower()
         if raw.startswith("r"):
             return "random"
         if raw.startswith("l"):
             return "rl"
         if raw.startswith("d"):
             return "dq"
+        if raw.startswith("s"):
+            return "ab"
         return "random"
 
     @staticmethod
     def _init_ai_if_needed():
         if PlayerInput._ai_kind == "rl" and PlayerInput._rl_agent is None:
-            agent = RLAgent()
             if os.path.exists("q_table.json"):
                 try:
-                    agent.load("q_table.json")
+                    # shared with the controller through the registry, so it is read only once
+                    PlayerInput._rl_agent = AGENTS.get("rl:q_table.json")
                     print("  Loaded RL policy from q_table.json")
+                    return
                 except Exception:
                     print("  Could not load q_table.json; the AI will still play, but may be weak.")
             else:
                 print("  No q_table.json found; the AI will still play, but may be weak.")
-            PlayerInput._rl_agent = agent
+            PlayerInput._rl_agent = RLAgent()
 
     @staticmethod
     def get_human_move(current_player: str, validator: Callable[[int], bool]) -> int:
@@ -61,7 +66,8 @@ class PlayerInput:
             print("  Invalid move. Choose an empty square 1–9 (see reference).")
 
     @staticmethod
-    def get_computer_move(current_player: str, available_positions: List[int]) -> Optional[int]:
+    def get_computer_move(current_player: str, available_positions: List[int],
+                          rng=random) -> Optional[int]:
         if not available_positions:
             return None
         if PlayerInput._ai_kind == "rl" and PlayerInput._rl_agent is not None:
@@ -87,7 +93,7 @@ class PlayerInput:
             # For backwards compatibility here, we just fall back to random.
             pass  # see note below
         # Fallback: random for now
-        return random.choice(available_positions)
+        return rng.choice(available_positions)
     
     @staticmethod
     def get_starting_player() -> str:
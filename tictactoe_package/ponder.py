@@ -0,0 +1,67 @@
+"""
+Pondering for Human vs Computer games
+While the human is thinking, the AI's reply to each of their legal moves is
+computed on a background thread, so the reply is ready when they commit.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from .exact_eval import winner_of
+
+PickMove = Callable[[List[str], str], Any]  # the reply: a move, or a move with what it cost
+
+
+class Ponderer:
+    """Precomputes ``pick(board, ai_mark)`` for every legal human move"""
+
+    def __init__(self, pick: PickMove):
+        self.pick = pick
+        self._replies: Dict[int, Any] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._cancel = threading.Event()
+        self.hits = 0
+        self.misses = 0
+
+    def start(self, board: List[str], human: str, ai: str) -> None:
+        """Begin pondering the position where ``human`` is to move"""
+        self.stop()
+        self._replies = {}
+        self._cancel.clear()
+        board = list(board)
+        self._thread = threading.Thread(target=self._run, args=(board, human, ai), daemon=True)
+        self._thread.start()
+
+    def _run(self, board: List[str], human: str, ai: str) -> None:
+        legal = [i for i, v in enumerate(board) if v == ' ']
+        if len(legal) <= 1:
+            return  # the human's move ends the game
+        for move in legal:
+            if self._cancel.is_set():
+                return
+            child = board.copy()
+            child[move] = human
+            if winner_of(tuple(child)) is not None:
+                continue  # the human wins: no reply needed
+            self._replies[move] = self.pick(child, ai)
+
+    def take(self, move: int) -> Optional[Any]:
+        """The pondered reply to ``move`` (None if not computed); drops all other branches.
+
+        Waits for the branch being computed right now, if any, but no others.
+        """
+        self.stop()
+        reply = self._replies.pop(move, None)
+        self._replies = {}
+        if reply is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return reply
+
+    def stop(self) -> None:
+        """Cancel pondering and wait for the background thread"""
+        self._cancel.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
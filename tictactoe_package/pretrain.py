@@ -0,0 +1,124 @@
+"""
+Offline (supervised) pretraining for the DQN
+Labeled positions are written to a flat file of float32 records, read back
+through ``np.memmap`` and fitted in large shuffled mini-batches.
+
+Each record is 46 float32 values: the 28 encode_board inputs, 9 target
+Q-values and a 9-value mask that is 1 where a target is known. Labels come
+from the exact solver (every action of every position) or from game logs
+(the action actually played, valued by the discounted final result).
+"""
+
+import os
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import torch
+
+from .dqn_agent import encode_board
+from .exact_eval import Solver, other
+from .gamelog import read_games
+
+INPUTS = 28
+RECORD_FLOATS = INPUTS + 9 + 9
+HEADER = b"TTTQDS01" + bytes(8)  # 16 bytes keeps records 4-byte aligned
+
+
+class DatasetWriter:
+    """Appends labeled positions to a dataset file through a large buffer"""
+
+    def __init__(self, path: str, buffer_bytes: int = 1 << 20):
+        self.path = path
+        self._file = open(path, "ab", buffering=buffer_bytes)
+        if self._file.tell() == 0:
+            self._file.write(HEADER)
+        self.rows = 0
+
+    def add(self, board, to_move: str, targets: Dict[int, float]) -> None:
+        row = np.zeros(RECORD_FLOATS, dtype=np.float32)
+        row[:INPUTS] = encode_board(list(board), to_move).numpy()
+        for move, value in targets.items():
+            row[INPUTS + move] = value
+            row[INPUTS + 9 + move] = 1.0
+        self._file.write(row.tobytes())
+        self.rows += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "DatasetWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def open_dataset(path: str) -> np.memmap:
+    """Read-only (rows, 46) view of a dataset file; pages are loaded on demand"""
+    with open(path, "rb") as f:
+        if f.read(len(HEADER)) != HEADER:
+            raise ValueError(f"{path} is not a pretraining dataset")
+    rows = (os.path.getsize(path) - len(HEADER)) // (4 * RECORD_FLOATS)
+    return np.memmap(path, dtype=np.float32, mode="r", offset=len(HEADER), shape=(rows, RECORD_FLOATS))
+
+
+def write_solver_dataset(path: str, discount: float = 0.95) -> int:
+    """Label every reachable position with the solver's value of each move"""
+    solver = Solver(discount)
+    with DatasetWriter(path) as writer:
+        for board, to_move, values in solver.positions():
+            writer.add(board, to_move, values)
+        return writer.rows
+
+
+def write_game_log_dataset(path: str, logs: Iterable[str], discount: float = 0.95,
+                           draw: float = 0.0) -> int:
+    """Label each move of each logged game with its discounted result for the mover"""
+    with DatasetWriter(path) as writer:
+        for log in logs:
+            for game in read_games(log):
+                board = [' '] * 9
+                mark = game.starting
+                n = len(game.moves)
+                for i, move in enumerate(game.moves):
+                    if game.result is None:
+                        outcome = draw
+                    else:
+                        outcome = 1.0 if game.result == mark else -1.0
+                    writer.add(board, mark, {move: outcome * discount ** (n - 1 - i)})
+                    board[move] = mark
+                    mark = other(mark)
+        return writer.rows
+
+
+def pretrain(agent, data: np.ndarray, epochs: int = 300, batch_size: int = 1024,
+             lr: float = 1e-2, seed: Optional[int] = None,
+             progress: Optional[Callable[[int, float], None]] = None) -> List[float]:
+    """Fit ``agent.qnet`` to the dataset's targets with a masked MSE loss.
+
+    Rows are visited in a new random order each epoch; within a batch they
+    are read in file order, which keeps memory-mapped reads sequential. The
+    target network is synced at the end. Returns the mean loss per epoch.
+    """
+    rng = np.random.default_rng(seed)
+    device = agent.cfg.device
+    opt = torch.optim.Adam(agent.qnet.parameters(), lr=lr)
+    n = len(data)
+    losses = []
+    for epoch in range(1, epochs + 1):
+        order = rng.permutation(n)
+        total = 0.0
+        for start in range(0, n, batch_size):
+            rows = torch.from_numpy(np.asarray(data[np.sort(order[start:start + batch_size])])).to(device)
+            s, target, mask = rows[:, :INPUTS], rows[:, INPUTS:INPUTS + 9], rows[:, INPUTS + 9:]
+            q = agent.qnet(s)
+            loss = ((q - target) ** 2 * mask).sum() / mask.sum().clamp(min=1.0)
+            opt.zero_grad()
+            loss.backward()
+            opt.step()
+            total += loss.item() * len(rows)
+        losses.append(total / max(n, 1))
+        if progress is not None:
+            progress(epoch, losses[-1])
+    agent.target.load_state_dict(agent.qnet.state_dict())
+    return losses
@@ -0,0 +1,39 @@
+"""
+Profiling helpers for the command line scripts
+Runs a workload under cProfile, writes a .prof file and a top-N summary.
+"""
+
+import cProfile
+import io
+import pstats
+from typing import Callable
+
+
+def run_profiled(fn: Callable, out_path: str, top_n: int = 25, sort: str = "cumulative"):
+    """Call ``fn()`` under cProfile and return its result.
+
+    Writes the raw stats to ``out_path`` (open with ``python -m pstats`` or
+    snakeviz) and a summary of the ``top_n`` hottest functions to
+    ``out_path + '.txt'``, which is also printed. Only the current process
+    is profiled; worker processes (e.g. ``-j``) are not.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return fn()
+    finally:
+        profiler.disable()
+        profiler.dump_stats(out_path)
+        summary = profile_summary(out_path, top_n, sort)
+        with open(out_path + ".txt", "w", encoding="utf-8") as f:
+            f.write(summary)
+        print(f"\n  Profile written to {out_path} (top {top_n} by {sort} time in {out_path}.txt)\n")
+        print(summary)
+
+
+def profile_summary(prof_path: str, top_n: int = 25, sort: str = "cumulative") -> str:
+    """Top-N table from a .prof file, sorted by ``sort`` (cumulative, tottime, ...)"""
+    out = io.StringIO()
+    stats = pstats.Stats(prof_path, stream=out)
+    stats.strip_dirs().sort_stats(sort).print_stats(top_n)
+    return out.getvalue()
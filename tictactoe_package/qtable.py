@@ -0,0 +1,129 @@
+"""
+Bounded-memory Q-table
+A drop-in for RLAgent's Q dict that holds at most ``capacity`` entries.
+
+When an insert takes the table over capacity, a batch of entries is evicted
+at once, so the cost of choosing victims is spread over many inserts:
+
+    lfu  fewest visits (updates) first, then smallest |Q|; visit counts are
+         halved after each batch so entries that were popular long ago age out
+    lru  least recently read or written first
+"""
+
+import heapq
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterator, MutableMapping, Optional, Tuple
+
+EVICTION_POLICIES = ("lfu", "lru")
+
+
+class BoundedQTable(MutableMapping):
+    """Mapping of (state, action) to Q-value with a fixed entry budget.
+
+    ``get`` counts a hit or a miss; ``table[key] = value`` counts a visit.
+    Iterating and ``items()`` neither count nor change recency.
+    """
+
+    def __init__(self, capacity: int, policy: str = "lfu", evict_fraction: float = 0.1):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"unknown eviction policy '{policy}' "
+                             f"(expected one of {', '.join(EVICTION_POLICIES)})")
+        self.capacity = capacity
+        self.policy = policy
+        self.batch = max(1, int(capacity * evict_fraction))
+        self._values: Dict[Hashable, float] = OrderedDict() if policy == "lru" else {}
+        self._visits: Dict[Hashable, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ---------- Mapping ----------
+
+    def get(self, key: Hashable, default: Optional[float] = None) -> Optional[float]:
+        value = self._values.get(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        if self.policy == "lru":
+            self._values.move_to_end(key)
+        return value
+
+    def __getitem__(self, key: Hashable) -> float:
+        return self._values[key]
+
+    def __setitem__(self, key: Hashable, value: float) -> None:
+        if key in self._values:
+            if self.policy == "lru":
+                self._values.move_to_end(key)
+        elif len(self._values) >= self.capacity:
+            self._evict()
+        self._values[key] = value
+        self._visits[key] = self._visits.get(key, 0) + 1
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._values[key]
+        del self._visits[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def items(self):
+        return self._values.items()
+
+    def values(self):
+        return self._values.values()
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._visits.clear()
+
+    # ---------- Eviction ----------
+
+    def _evict(self) -> None:
+        """Drop a batch of entries to make room for new ones"""
+        n = min(self.batch, len(self._values))
+        if self.policy == "lru":
+            for _ in range(n):
+                key, _ = self._values.popitem(last=False)
+                del self._visits[key]
+        else:
+            values, visits = self._values, self._visits
+            for key in heapq.nsmallest(n, values, key=lambda k: (visits[k], abs(values[k]))):
+                del values[key]
+                del visits[key]
+            for key in visits:
+                visits[key] >>= 1
+        self.evictions += n
+
+    def visits(self, key: Hashable) -> int:
+        """Updates to ``key`` since it was inserted (halved at each LFU eviction)"""
+        return self._visits.get(key, 0)
+
+    # ---------- Reporting ----------
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """Gauges for training metrics"""
+        return {"q_hit_rate": self.hit_rate, "q_evictions": self.evictions}
+
+    def summary(self) -> str:
+        return (f"{len(self):,}/{self.capacity:,} entries ({self.policy}), "
+                f"hit rate {self.hit_rate:.1%}, {self.evictions:,} evicted")
+
+
+def q_table(capacity: Optional[int] = None, policy: str = "lfu") -> MutableMapping[Tuple, float]:
+    """Plain dict when ``capacity`` is None, else a BoundedQTable"""
+    return {} if capacity is None else BoundedQTable(capacity, policy)
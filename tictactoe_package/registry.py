@@ -0,0 +1,159 @@
+"""
+Process-wide agent registry
+Each (kind, policy path, file mtime) is loaded once and the agent is shared
+by every controller, player and server session in the process.
+
+Shared agents are read-only: callers may ``pick_move`` from any thread but
+must not train or reconfigure them. When a policy file changes on disk, the
+next ``get`` keeps returning the old agent while the new one loads in a
+background thread, then switches over. A file that fails to load is not
+retried until its mtime changes again.
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from .agents import load_agent, parse_spec
+
+Key = Tuple[str, Optional[str], bool]  # (kind, absolute policy path, deterministic)
+
+
+@dataclass
+class _Entry:
+    agent: object
+    mtime: Optional[int]
+    reloading: bool = False
+    failed_mtime: Optional[int] = None  # last on-disk version that failed to load
+
+
+def _mtime(path: Optional[str]) -> Optional[int]:
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class AgentRegistry:
+    """Loads agents on first use and keeps them in sync with their policy files"""
+
+    def __init__(self, loader: Callable = load_agent, background: bool = True):
+        self.loader = loader
+        self.background = background
+        self._entries: Dict[Key, _Entry] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[Key, threading.Lock] = {}
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.hits = 0
+        self.loads = 0
+        self.reloads = 0
+
+    @staticmethod
+    def _key(spec: str, deterministic: bool) -> Tuple[Key, str]:
+        kind, path = parse_spec(spec)
+        path = os.path.abspath(path) if path else None
+        # only the Q-learning agent's play depends on the deterministic flag
+        key = (kind, path, deterministic and kind == "rl")
+        return key, (f"{kind}:{path}" if path else kind)
+
+    def get(self, spec: str, deterministic: bool = False):
+        """Shared agent for a spec (see agents.load_agent); loads it if needed.
+
+        Raises like ``load_agent`` if the policy cannot be loaded and no
+        earlier version of it is cached.
+        """
+        key, spec = self._key(spec, deterministic)
+        mtime = _mtime(key[1])
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.mtime == mtime or (mtime is not None and mtime == entry.failed_mtime):
+                self.hits += 1
+                return entry.agent
+            if self.background and mtime is not None:
+                self._schedule_reload(key, spec, entry)
+                self.hits += 1
+                return entry.agent
+            self.evict(key)
+
+        with self._load_lock(key):
+            entry = self._entries.get(key)
+            if entry is not None and entry.mtime == mtime:
+                self.hits += 1
+                return entry.agent
+            agent = self.loader(spec, deterministic=key[2])
+            self._entries[key] = _Entry(agent, mtime)
+            self.loads += 1
+            return agent
+
+    def _load_lock(self, key: Key) -> threading.Lock:
+        with self._lock:
+            return self._load_locks.setdefault(key, threading.Lock())
+
+    def _schedule_reload(self, key: Key, spec: str, entry: _Entry) -> None:
+        with self._lock:
+            if entry.reloading:
+                return
+            entry.reloading = True
+        threading.Thread(target=self._reload, args=(key, spec, entry), daemon=True).start()
+
+    def _reload(self, key: Key, spec: str, old: _Entry) -> None:
+        with self._load_lock(key):
+            mtime = _mtime(key[1])
+            try:
+                agent = self.loader(spec, deterministic=key[2])
+            except Exception:
+                # e.g. a half-written checkpoint: keep serving the old agent and
+                # retry once the file changes again
+                old.failed_mtime = mtime
+                old.reloading = False
+                return
+            if self._entries.get(key) is old:
+                self._entries[key] = _Entry(agent, mtime)
+                self.reloads += 1
+
+    def refresh(self) -> int:
+        """Start background reloads for every cached policy changed on disk"""
+        changed = 0
+        for key, entry in list(self._entries.items()):
+            mtime = _mtime(key[1])
+            if mtime not in (entry.mtime, entry.failed_mtime, None):
+                self._schedule_reload(key, f"{key[0]}:{key[1]}", entry)
+                changed += 1
+        return changed
+
+    def watch(self, interval: float = 2.0) -> None:
+        """Poll the cached policy files every ``interval`` seconds in a daemon thread"""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.wait(interval):
+                self.refresh()
+
+        self._watcher = threading.Thread(target=loop, daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        self._stop.set()
+
+    def evict(self, key: Key) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+AGENTS = AgentRegistry()
+
+
+def get_agent(spec: str, deterministic: bool = False):
+    """Shared agent from the process-wide registry"""
+    return AGENTS.get(spec, deterministic)
@@ -0,0 +1,133 @@
+"""
+File-backed replay buffer for the DQN
+Transitions are fixed-size records in a ring buffer mapped with ``np.memmap``.
+The file outlives the process: a resumed run starts with a warm buffer, and
+several processes can append to and sample from the same file without
+pickling anything. Appends take an exclusive lock on the file and samples a
+shared one.
+"""
+
+import os
+import random
+import weakref
+from contextlib import contextmanager
+from typing import Tuple
+
+import numpy as np
+import torch
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends from several processes are not serialized
+    fcntl = None
+
+MAGIC = 0x54545452504C4159  # "TTTRPLAY"
+VERSION = 1
+HEADER_WORDS = 8            # int64: magic, version, capacity, count, record bytes, unused...
+
+
+def transition_dtype(cells: int = 9) -> np.dtype:
+    """Record layout for a board of ``cells`` cells (3 * cells + 1 state features)"""
+    return np.dtype([
+        ("s", np.float32, (3 * cells + 1,)),
+        ("a", np.int64),
+        ("r", np.float32),
+        ("s_next", np.float32, (3 * cells + 1,)),
+        ("done", np.float32),
+        ("mask_next", np.float32, (cells,)),   # all ones when no mask was given
+    ])
+
+
+TRANSITION = transition_dtype(9)
+
+
+class MemmapReplay:
+    """Ring buffer of DQN transitions stored in a file.
+
+    Drop-in for the agent's deque: ``append((s, a, r, s_next, done,
+    mask_next))`` and ``len()``; ``sample`` returns a batch of tensors.
+    ``count`` in the file header is the total number of transitions ever
+    appended, so every process sees the same fill level and write position.
+    An existing file keeps its capacity; asking for a different one raises.
+    Use as a context manager or call ``close`` when done.
+    """
+
+    def __init__(self, path: str, capacity: int = 50_000, cells: int = 9):
+        self.path = path
+        self.dtype = transition_dtype(cells)
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, "wb") as f:
+                header = np.zeros(HEADER_WORDS, dtype=np.int64)
+                header[:5] = (MAGIC, VERSION, capacity, 0, self.dtype.itemsize)
+                f.write(header.tobytes())
+                f.truncate(header.nbytes + capacity * self.dtype.itemsize)
+        self._header = np.memmap(path, dtype=np.int64, mode="r+", shape=(HEADER_WORDS,))
+        magic, version, file_capacity, _, itemsize = self._header[:5]
+        if magic != MAGIC or version != VERSION or itemsize != self.dtype.itemsize:
+            raise ValueError(f"{path} is not a compatible replay file")
+        if file_capacity != capacity:
+            raise ValueError(f"{path} holds {int(file_capacity):,} transitions, "
+                             f"not {capacity:,}; use the same buffer size or a new file")
+        self.capacity = capacity
+        self._data = np.memmap(path, dtype=self.dtype, mode="r+",
+                               offset=HEADER_WORDS * 8, shape=(self.capacity,))
+        self._fd = os.open(path, os.O_RDWR)
+        # release the descriptor even if close() is never called
+        self._finalizer = weakref.finalize(self, os.close, self._fd)
+
+    @property
+    def count(self) -> int:
+        """Transitions appended over the file's lifetime, by every writer"""
+        return int(self._header[3])
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    @contextmanager
+    def _locked(self, shared: bool = False):
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def append(self, transition: Tuple) -> None:
+        s, a, r, s_next, done, mask_next = transition
+        with self._locked():
+            count = int(self._header[3])
+            i = count % self.capacity
+            rec = self._data
+            rec["s"][i] = s.cpu().numpy()
+            rec["a"][i] = a
+            rec["r"][i] = r
+            rec["s_next"][i] = s_next.cpu().numpy()
+            rec["done"][i] = float(done)
+            rec["mask_next"][i] = 1.0 if mask_next is None else mask_next.cpu().numpy()
+            self._header[3] = count + 1
+
+    def sample(self, batch_size: int, device: str = "cpu") -> Tuple[torch.Tensor, ...]:
+        """Uniform batch of (s, a, r, s_next, done, mask_next) tensors"""
+        with self._locked(shared=True):  # no append may land between the pick and the read
+            idx = np.sort(np.fromiter(random.sample(range(len(self)), batch_size), dtype=np.int64))
+            rows = self._data[idx]
+        to = lambda name: torch.from_numpy(np.ascontiguousarray(rows[name])).to(device)
+        return to("s"), to("a"), to("r"), to("s_next"), to("done"), to("mask_next")
+
+    def flush(self) -> None:
+        self._data.flush()
+        self._header.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._fd is not None:
+            self._finalizer()
+            self._fd = None
+
+    def __enter__(self) -> "MemmapReplay":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
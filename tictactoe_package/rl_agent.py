@@ -1,13 +1,17 @@
 # tictactoe_package/rl_agent.py
 from __future__ import annotations
 from dataclasses import dataclass, field
+import hashlib
 import json
 import random
+import time
 from typing import Dict, List, Tuple, Optional
 from .game import TicTacToe  # uses your clean environment API
+from .gamelog import GameRecord, RecordSink
+from .qtable import BoundedQTable, q_table
 
 State = str     # e.g., "X O  X   "
-Action = int    # 0..8 index
+Action = int    # cell index, 0..8 on the classic board
 
 def board_to_state(board: List[str], current_player: str) -> State:
     # Turn ['X',' ','O', ...] into a string; simple and readable
@@ -19,46 +23,79 @@ class RLAgent:
     alpha: float = 0.2       # learning rate
     gamma: float = 0.95      # discount
     epsilon: float = 0.10    # exploration during training
+    deterministic: bool = False  # break ties by lowest position instead of randomly
+    rows: int = 3            # board played in self-play training (any m,n,k-game)
+    cols: int = 3
+    k: int = 3
     q: Dict[Tuple[State, Action], float] = field(default_factory=dict)
+    q_capacity: Optional[int] = None  # keep at most this many Q entries (see qtable.py)
+    q_eviction: str = "lfu"           # which entries go first when the cap is hit: lfu or lru
+
+    def __post_init__(self):
+        if self.q_capacity is not None and not isinstance(self.q, BoundedQTable):
+            table = q_table(self.q_capacity, self.q_eviction)
+            table.update(self.q)
+            self.q = table
 
     def value(self, s: State, a: Action) -> float:
         return self.q.get((s, a), 0.0)
 
-    def best_action(self, s: State, legal: List[int]) -> Action:
+    def best_action(self, s: State, legal: List[int], rng=random) -> Action:
         # Pick the legal action with highest Q, break ties randomly for clarity
-        best_q = max(self.value(s,a) for a in legal)
-        best_moves = [a for a in legal if self.value(s,a) == best_q]
-        return random.choice(best_moves)
-        
-
-    def choose_action(self, s: State, legal: List[int], explore: bool) -> Action:
-        if explore and random.random() < self.epsilon:
-            return random.choice(legal)
-        return self.best_action(s, legal)
-
-    def update(self, s: State, a: Action, r: float, s_next: Optional[State], legal_next: List[int]):
+        values = [self.value(s, a) for a in legal]
+        best_q = max(values)
+        best_moves = [a for a, v in zip(legal, values) if v == best_q]
+        if self.deterministic:
+            return min(best_moves)
+        return rng.choice(best_moves)
+
+    def fingerprint(self) -> str:
+        """Stable hash of the Q-table; equal tables give equal fingerprints."""
+        h = hashlib.sha1()
+        for (s, a), v in sorted(self.q.items()):
+            h.update(f"{s}|{a}={v!r};".encode("utf-8"))
+        return h.hexdigest()
+
+    def choose_action(self, s: State, legal: List[int], explore: bool, rng=random) -> Action:
+        if explore and rng.random() < self.epsilon:
+            return rng.choice(legal)
+        return self.best_action(s, legal, rng)
+
+    def update(self, s: State, a: Action, r: float, s_next: Optional[State], legal_next: List[int]) -> float:
+        """One Q-learning update; returns the TD error."""
         old = self.value(s, a)
         future = 0.0 if s_next is None or not legal_next else max(self.value(s_next, a2) for a2 in legal_next)
-        self.q[(s, a)] = old + self.alpha * (r + self.gamma * future - old)
+        td = r + self.gamma * future - old
+        self.q[(s, a)] = old + self.alpha * td
+        return td
 
     # ---------- Training by self-play ----------
 
-    def train_self_play(self, episodes: int = 5000, verbose_every: int = 0) -> None:
+    def train_self_play(self, episodes: int = 5000, verbose_every: int = 0, metrics=None,
+                        record: Optional[RecordSink] = None) -> None:
         """
         Train by having the agent play both X and O.
         Reward shaping:
           +1 for a win, -1 for a loss, 0.2 for a draw, small -0.01 per move to encourage faster wins.          
+        If ``metrics`` (a TrainingMetrics) is given, throughput counters are streamed to it.
+        If ``record`` is given, it receives a GameRecord for every episode.
         """
         for ep in range(1, episodes + 1):
-            env = TicTacToe()
+            env = TicTacToe(self.rows, self.cols, self.k)
             trajectory: List[Tuple[State, Action, str]] = []  # (state, action, playerWhoMoved)
+            ep_start = time.perf_counter()
+            t_inference = t_learn = 0.0
+            td_abs = td_sq = 0.0
+            n_updates = 0
 
             # Play an episode
             while True:
                 mover = env.current_player  # The player who is about to move
                 s = board_to_state(env.board, mover)
                 legal = env.get_available_positions()
+                t = time.perf_counter()
                 a = self.choose_action(s, legal, explore=True)
+                t_inference += time.perf_counter() - t
                 env.make_move(a)
                 trajectory.append((s, a, mover))  # Save state with player who moved
 
@@ -68,13 +105,21 @@ class RLAgent:
                     # Assign results from the perspective of each mover:
                     # If the mover's symbol == winner -> +1, else if opponent won -> -1, else 0.
                     # Also add a tiny step penalty to encourage faster endings.
+                    t = time.perf_counter()
                     for (s_t, a_t, mover) in reversed(trajectory):
                         if winner is None:
                             r = 0.2  # make draw slightly positive to encourage avoiding losses
                         else:
                             r = +1.0 if mover == winner else -1.0
                         r -= 0.01  # small time penalty
-                        self.update(s_t, a_t, r, None, [])
+                        td = self.update(s_t, a_t, r, None, [])
+                        td_abs += abs(td)
+                        td_sq += td * td
+                        n_updates += 1
+                    t_learn += time.perf_counter() - t
+                    if record is not None:
+                        record(GameRecord(tuple(a_t for _, a_t, _ in trajectory), winner, 'X',
+                                          "rl-selfplay", "rl-selfplay", index=ep))
                     break
 
                 # Switch player for next turn
@@ -83,20 +128,37 @@ class RLAgent:
                 # Next step update (temporal difference) with step reward ~0 except tiny time penalty
                 s_next = board_to_state(env.board, env.current_player)
                 legal_next = env.get_available_positions()
-                self.update(s, a, -0.01, s_next, legal_next)
+                t = time.perf_counter()
+                td = self.update(s, a, -0.01, s_next, legal_next)
+                t_learn += time.perf_counter() - t
+                td_abs += abs(td)
+                td_sq += td * td
+                n_updates += 1
+
+            if metrics is not None:
+                ep_time = time.perf_counter() - ep_start
+                metrics.add_steps(len(trajectory))
+                metrics.add_learn(td_sq / n_updates, td_abs / n_updates, n_updates)
+                metrics.add_time("inference", t_inference)
+                metrics.add_time("learn", t_learn)
+                metrics.add_time("env", ep_time - t_inference - t_learn)
+                metrics.end_episode(epsilon=self.epsilon, q_size=len(self.q),
+                                    q_stats=self.q.stats() if isinstance(self.q, BoundedQTable) else None)
 
         if verbose_every:
             print(f"Training finished for {episodes} episodes. Q-size: {len(self.q)}")
+            if isinstance(self.q, BoundedQTable):
+                print(f"Q-table: {self.q.summary()}")
 
     # ---------- Inference ----------
 
-    def pick_move(self, board: List[str], current_player: str) -> int:
+    def pick_move(self, board: List[str], current_player: str, rng=random) -> int:
         s = board_to_state(board, current_player)
         legal = [i for i, v in enumerate(board) if v == ' ']
         if not legal:
             return -1
         # During actual play we do NOT explore (deterministic, explainable)
-        return self.choose_action(s, legal, explore=False)
+        return self.choose_action(s, legal, explore=False, rng=rng)
 
     # ---------- Persistence ----------
 
@@ -107,7 +169,7 @@ class RLAgent:
     def load(self, path: str = "q_table.json"):
         with open(path, "r", encoding="utf-8") as f:
             raw = json.load(f)
-        self.q = {}
+        self.q = q_table(self.q_capacity, self.q_eviction)
         for key, v in raw.items():
             s, a = key.rsplit("|", 1)
             self.q[(s, int(a))] = float(v)
@@ -0,0 +1,314 @@
+"""
+Alpha-beta search for m,n,k boards
+Iterative-deepening negamax under a time budget, with a Zobrist-keyed
+transposition table and moves ordered by the threats they make and block.
+
+Leaves are scored from line counts: a k-cell line that only one side
+occupies is worth THREAT_WEIGHT[marks in it] to that side. The counts and
+the score are updated as moves are made and unmade, so a leaf costs nothing
+beyond the move that reached it.
+"""
+
+import hashlib
+import random
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from .game import win_lines
+
+WIN = 1_000_000
+WIN_BOUND = WIN - 1000          # beyond this a score is a forced win, less the plies to reach it
+EXACT, LOWER, UPPER = 0, 1, 2   # transposition table bound types
+
+Entry = Tuple[int, int, int, int, int, int]  # (key, depth, bound, score, best move, generation)
+
+
+class _Timeout(Exception):
+    pass
+
+
+@dataclass
+class SearchStats:
+    """Outcome of one ``AlphaBetaAgent.search``"""
+    move: int
+    score: int          # from the side to move; beyond WIN_BOUND means a forced win
+    depth: int          # deepest iteration that finished
+    nodes: int
+    seconds: float
+    tt_hits: int
+    solved: bool        # the result is exact: a forced win or loss, or the full tree was searched
+
+    @property
+    def nodes_per_sec(self) -> float:
+        return self.nodes / max(self.seconds, 1e-9)
+
+    def summary(self) -> str:
+        result = "solved, " if self.solved else ""
+        return (f"depth {self.depth} ({result}score {self.score}), {self.nodes:,} nodes "
+                f"in {self.seconds * 1000:.0f} ms = {self.nodes_per_sec:,.0f} nodes/s")
+
+
+class TranspositionTable:
+    """Fixed number of slots indexed by the low bits of the Zobrist key.
+
+    A slot holding another position is overwritten unless that entry comes
+    from the current search (generation) and was searched deeper; entries
+    left over from earlier moves are always replaceable.
+    """
+
+    def __init__(self, size_log2: int = 18):
+        self.mask = (1 << size_log2) - 1
+        self.slots: List[Optional[Entry]] = [None] * (self.mask + 1)
+        self.generation = 0
+        self.used = 0
+        self.replaced = 0
+
+    def probe(self, key: int) -> Optional[Entry]:
+        entry = self.slots[key & self.mask]
+        return entry if entry is not None and entry[0] == key else None
+
+    def store(self, key: int, depth: int, bound: int, score: int, move: int) -> None:
+        i = key & self.mask
+        old = self.slots[i]
+        if old is None:
+            self.used += 1
+        elif old[0] != key:
+            if old[5] == self.generation and old[1] > depth:
+                return  # keep the deeper result from this search
+            self.replaced += 1
+        self.slots[i] = (key, depth, bound, score, move, self.generation)
+
+    def new_search(self) -> None:
+        self.generation += 1
+
+    def clear(self) -> None:
+        self.slots = [None] * (self.mask + 1)
+        self.used = self.replaced = 0
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+
+@lru_cache(maxsize=None)
+def _tables(rows: int, cols: int, k: int):
+    """Lines through each cell and Zobrist keys for a board shape"""
+    lines = win_lines(rows, cols, k)
+    through = [[] for _ in range(rows * cols)]
+    for li, line in enumerate(lines):
+        for cell in line:
+            through[cell].append(li)
+    rng = random.Random(rows * 10_007 + cols * 101 + k)
+    zobrist = {'X': [rng.getrandbits(64) for _ in range(rows * cols)],
+               'O': [rng.getrandbits(64) for _ in range(rows * cols)]}
+    side_key = rng.getrandbits(64)
+    return len(lines), tuple(map(tuple, through)), zobrist, side_key
+
+
+def threat_weights(k: int) -> List[int]:
+    """Value of a line holding 0..k marks of one side only"""
+    return [0] + [8 ** (c - 1) for c in range(1, k + 1)]
+
+
+class AlphaBetaAgent:
+    """Searches as deep as ``time_limit`` seconds allow (or to ``max_depth`` plies).
+
+    With ``time_limit=None`` the search stops only at ``max_depth`` or the
+    end of the game, and its play is deterministic. ``last_stats`` holds
+    the SearchStats of the latest move.
+    """
+
+    def __init__(self, rows: int = 3, cols: int = 3, k: int = 3,
+                 time_limit: Optional[float] = 1.0, max_depth: Optional[int] = None,
+                 tt_size_log2: int = 18):
+        self.rows, self.cols, self.k = rows, cols, k
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.deterministic = time_limit is None
+        self.tt = TranspositionTable(tt_size_log2)
+        n_lines, self._through, self._zobrist, self._side_key = _tables(rows, cols, k)
+        weights = threat_weights(k)
+        # contribution of a line with x X marks and o O marks, from X's side
+        self._contrib = [[weights[x] if o == 0 else -weights[o] if x == 0 else 0
+                          for o in range(k + 1)] for x in range(k + 1)]
+        # move ordering: gain from extending an own line / from blocking an opponent line
+        self._extend = [weights[c + 1] - weights[c] for c in range(k)]
+        self._block = [weights[c] for c in range(k)]
+        self._extend[k - 1] = 1 << 50  # wins now
+        self._block[k - 1] = 1 << 40   # stops a win next move
+        self._n_lines = n_lines
+        self._lock = threading.Lock()
+        self.last_stats: Optional[SearchStats] = None
+
+    def fingerprint(self) -> str:
+        """Equal for agents that play the same moves (only meaningful when deterministic)"""
+        return hashlib.sha1(f"ab|{self.rows}|{self.cols}|{self.k}|{self.max_depth}".encode()).hexdigest()
+
+    def pick_move(self, board: List[str], current_player: str, rng=None) -> int:
+        # the search breaks ties by move order, so ``rng`` is never drawn from
+        return self.search(board, current_player).move
+
+    def search(self, board: List[str], current_player: str) -> SearchStats:
+        """Best move for ``current_player`` (-1 if the board is full); safe from any thread"""
+        if len(board) != self.rows * self.cols:
+            raise ValueError(f"expected a {self.rows}x{self.cols} board, got {len(board)} cells")
+        with self._lock:
+            stats = self._search(list(board), current_player)
+            self.last_stats = stats
+            return stats
+
+    # ---------- Search ----------
+
+    def _search(self, board: List[str], player: str) -> SearchStats:
+        start = time.perf_counter()
+        self._deadline = None if self.time_limit is None else start + self.time_limit
+        self._board = board
+        self._x = [0] * self._n_lines
+        self._o = [0] * self._n_lines
+        self._score = 0
+        self._key = self._side_key if player == 'O' else 0
+        self._empty = 0
+        for cell, v in enumerate(board):
+            if v == ' ':
+                self._empty += 1
+            else:
+                self._key ^= self._zobrist[v][cell]
+                for li in self._through[cell]:
+                    self._add(li, v, 1)
+        self.nodes = self.tt_hits = 0
+        self.tt.new_search()
+
+        side = 1 if player == 'X' else -1
+        moves = self._ordered_moves(side, -1)
+        best = SearchStats(moves[0] if moves else -1, 0, 0, 0, 0.0, 0, not moves)
+        limit = self._empty if self.max_depth is None else min(self.max_depth, self._empty)
+        for depth in range(1, limit + 1):
+            try:
+                score = self._negamax(depth, -WIN - 1, WIN + 1, 0, side)
+            except _Timeout:
+                break
+            solved = abs(score) > WIN_BOUND or depth == self._empty
+            best = SearchStats(self._root_move, score, depth, 0, 0.0, 0, solved)
+            if solved:
+                break
+        best.nodes, best.tt_hits = self.nodes, self.tt_hits
+        best.seconds = time.perf_counter() - start
+        return best
+
+    def _add(self, li: int, mark: str, delta: int) -> bool:
+        """Add or remove a mark on line ``li``; True if the line is now complete"""
+        x, o = self._x[li], self._o[li]
+        before = self._contrib[x][o]
+        if mark == 'X':
+            x += delta
+            self._x[li] = x
+        else:
+            o += delta
+            self._o[li] = o
+        self._score += self._contrib[x][o] - before
+        return x == self.k or o == self.k
+
+    def _play(self, cell: int, mark: str) -> bool:
+        """Place a mark; True if it wins"""
+        self._board[cell] = mark
+        self._key ^= self._zobrist[mark][cell] ^ self._side_key
+        self._empty -= 1
+        won = False
+        for li in self._through[cell]:
+            won = self._add(li, mark, 1) or won
+        return won
+
+    def _undo(self, cell: int, mark: str) -> None:
+        self._board[cell] = ' '
+        self._key ^= self._zobrist[mark][cell] ^ self._side_key
+        self._empty += 1
+        for li in self._through[cell]:
+            self._add(li, mark, -1)
+
+    def _ordered_moves(self, side: int, first: int) -> List[int]:
+        """Free cells, the table's best move first, then by threats made and blocked"""
+        own_lines, opp_lines = (self._x, self._o) if side == 1 else (self._o, self._x)
+        extend, block = self._extend, self._block
+        scored = []
+        for cell, v in enumerate(self._board):
+            if v != ' ':
+                continue
+            s = 0
+            for li in self._through[cell]:
+                own, opp = own_lines[li], opp_lines[li]
+                if opp == 0:
+                    s += extend[own]
+                if own == 0:
+                    s += block[opp]
+            scored.append((-s, cell))
+        scored.sort()
+        moves = [cell for _, cell in scored]
+        if first >= 0 and first in moves:
+            moves.remove(first)
+            moves.insert(0, first)
+        return moves
+
+    def _negamax(self, depth: int, alpha: int, beta: int, ply: int, side: int) -> int:
+        self.nodes += 1
+        if self._deadline is not None and self.nodes & 1023 == 0 \
+                and time.perf_counter() > self._deadline:
+            raise _Timeout
+        alpha0 = alpha
+        tt_move = -1
+        entry = self.tt.probe(self._key)
+        if entry is not None:
+            self.tt_hits += 1
+            tt_move = entry[4]
+            if entry[1] >= depth and ply > 0:
+                score = _from_tt(entry[3], ply)
+                if entry[2] == EXACT:
+                    return score
+                if entry[2] == LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+        if depth == 0:
+            return side * self._score
+
+        mark = 'X' if side == 1 else 'O'
+        best, best_move = -WIN - 1, -1
+        for move in self._ordered_moves(side, tt_move):
+            if self._play(move, mark):
+                score = WIN - (ply + 1)
+            elif self._empty == 0:
+                score = 0
+            else:
+                score = -self._negamax(depth - 1, -beta, -alpha, ply + 1, -side)
+            self._undo(move, mark)
+            if score > best:
+                best, best_move = score, move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        bound = UPPER if best <= alpha0 else LOWER if best >= beta else EXACT
+        self.tt.store(self._key, depth, bound, _to_tt(best, ply), best_move)
+        if ply == 0:
+            self._root_move = best_move
+        return best
+
+
+def _to_tt(score: int, ply: int) -> int:
+    """Win scores are stored relative to the node, not the root"""
+    if score > WIN_BOUND:
+        return score + ply
+    if score < -WIN_BOUND:
+        return score - ply
+    return score
+
+
+def _from_tt(score: int, ply: int) -> int:
+    if score > WIN_BOUND:
+        return score - ply
+    if score < -WIN_BOUND:
+        return score + ply
+    return score
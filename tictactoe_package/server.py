@@ -0,0 +1,219 @@
+"""
+Asyncio game server for TicTacToe
+Hosts many concurrent human-vs-computer sessions over a TCP line protocol.
+
+Each request and response is one JSON object per line:
+
+    {"cmd": "new", "ai": "rl", "human": "X"}   -> start a game (AI moves first if human is O)
+    {"cmd": "move", "game": 1, "pos": 4}       -> play a move (0-8); the AI replies
+    {"cmd": "state", "game": 1}                -> current board
+    {"cmd": "close", "game": 1}                -> end a session
+    {"cmd": "stats"}                           -> server counters
+
+Responses carry "ok", and for games "game", "board" (9 characters), "turn",
+"ai_move" and "result" ('X', 'O', 'draw' or null). A game can only be used
+from the connection that created it. Agents are loaded once
+per kind through the agent registry and shared by all sessions. With ``batch_size`` > 1, DQN moves
+from concurrent sessions are answered together (see batching.py).
+"""
+
+import asyncio
+import json
+import random
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+
+from .agents import AGENT_KINDS
+from .batching import BatchedInference
+from .game import TicTacToe
+from .registry import AGENTS, AgentRegistry
+
+
+@dataclass
+class Session:
+    """One game in progress"""
+    game: TicTacToe
+    ai_kind: str
+    human: str
+    agent: object = None
+    batcher: Optional[BatchedInference] = None
+    result: Optional[str] = None
+
+
+class GameServer:
+    """Manages sessions and shared agents; serves the line protocol"""
+
+    def __init__(self, agents: Optional[Dict[str, object]] = None,
+                 batch_size: int = 1, batch_delay: float = 0.002,
+                 registry: Optional[AgentRegistry] = None):
+        self.registry = registry or AGENTS
+        self._pinned: Dict[str, object] = dict(agents or {})  # fixed agents, bypassing the registry
+        self.agents: Dict[str, object] = {}
+        self.batchers: Dict[str, BatchedInference] = {}
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.sessions: Dict[int, Session] = {}
+        self._next_id = 1
+        self.requests = 0
+        self.games_started = 0
+        self.connections = 0
+
+    # ---------- Agents ----------
+
+    def agent_for(self, kind: str):
+        """Current shared agent for ``kind``; new games pick up retrained policies"""
+        agent = self._pinned.get(kind)
+        if agent is None:
+            agent = self.registry.get(kind)
+        if self.agents.get(kind) is not agent:
+            self._add_agent(kind, agent)
+        return agent
+
+    def _add_agent(self, kind: str, agent) -> None:
+        self.agents[kind] = agent
+        if self.batch_size > 1 and hasattr(agent, "pick_moves"):
+            self.batchers[kind] = BatchedInference(agent, self.batch_size, self.batch_delay)
+
+    async def ai_move(self, session: Session) -> int:
+        """Pick the AI's move for the session's current position"""
+        game = session.game
+        if session.batcher is not None:
+            position = await session.batcher.pick_move(game.board, game.current_player)
+        else:
+            # a slow agent (e.g. a timed search) must not stall every other connection
+            loop = asyncio.get_running_loop()
+            position = await loop.run_in_executor(
+                None, session.agent.pick_move, list(game.board), game.current_player)
+        if not game.is_valid_move(position):
+            position = random.choice(game.get_available_positions())
+        return position
+
+    # ---------- Game flow ----------
+
+    def _finish_turn(self, session: Session) -> bool:
+        """Check for the end of the game, else switch player; True if over"""
+        game = session.game
+        winner = game.check_winner()
+        if winner:
+            session.result = winner
+        elif game.is_board_full():
+            session.result = "draw"
+        else:
+            game.switch_player()
+        return session.result is not None
+
+    async def _play_ai(self, session: Session) -> int:
+        position = await self.ai_move(session)
+        session.game.make_move(position)
+        self._finish_turn(session)
+        return position
+
+    def _view(self, game_id: int, session: Session, ai_move: Optional[int] = None) -> Dict:
+        return {
+            "ok": True,
+            "game": game_id,
+            "board": "".join(session.game.board),
+            "turn": session.game.current_player,
+            "ai_move": ai_move,
+            "result": session.result,
+        }
+
+    async def handle_request(self, msg: Dict, owned: Optional[Set[int]] = None) -> Dict:
+        """Execute one protocol request and return the response"""
+        self.requests += 1
+        cmd = msg.get("cmd")
+        if cmd == "new":
+            kind = msg.get("ai", "random")
+            human = msg.get("human", "X")
+            if kind not in AGENT_KINDS or human not in ("X", "O"):
+                return {"ok": False, "error": "ai must be one of "
+                        f"{', '.join(AGENT_KINDS)} and human must be X or O"}
+            try:
+                agent = self.agent_for(kind)
+            except Exception as e:
+                return {"ok": False, "error": f"could not load {kind} agent: {e}"}
+            game_id = self._next_id
+            self._next_id += 1
+            session = Session(TicTacToe(), kind, human, agent, self.batchers.get(kind))
+            self.sessions[game_id] = session
+            self.games_started += 1
+            if owned is not None:
+                owned.add(game_id)
+            ai_move = await self._play_ai(session) if human == "O" else None
+            return self._view(game_id, session, ai_move)
+
+        if cmd == "stats":
+            return {"ok": True, "sessions": len(self.sessions), "games_started": self.games_started,
+                    "requests": self.requests, "connections": self.connections,
+                    "mean_batch": {kind: b.mean_batch_size for kind, b in self.batchers.items()}}
+
+        game_id = msg.get("game")
+        # ids are ints; anything else (even an unhashable list) is just unknown
+        valid_id = isinstance(game_id, int) and not isinstance(game_id, bool)
+        session = self.sessions.get(game_id) if valid_id else None
+        if session is None or (owned is not None and game_id not in owned):
+            # other connections' games look the same as games that do not exist
+            return {"ok": False, "error": f"unknown game {game_id}"}
+        if cmd == "state":
+            return self._view(game_id, session)
+        if cmd == "close":
+            del self.sessions[game_id]
+            if owned is not None:
+                owned.discard(game_id)
+            return {"ok": True, "game": game_id}
+        if cmd == "move":
+            pos = msg.get("pos")
+            game = session.game
+            if session.result is not None:
+                return {"ok": False, "error": "game is over"}
+            if game.current_player != session.human:
+                return {"ok": False, "error": "not your turn"}
+            if not isinstance(pos, int) or isinstance(pos, bool) or not game.is_valid_move(pos):
+                return {"ok": False, "error": f"invalid move {pos}"}
+            game.make_move(pos)
+            ai_move = None
+            if not self._finish_turn(session):
+                ai_move = await self._play_ai(session)
+            return self._view(game_id, session, ai_move)
+        return {"ok": False, "error": f"unknown command {cmd}"}
+
+    # ---------- Networking ----------
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one connection; its sessions are dropped when it disconnects"""
+        self.connections += 1
+        owned: Set[int] = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    msg = json.loads(line)
+                    response = await self.handle_request(msg, owned)
+                except (ValueError, AttributeError):
+                    response = {"ok": False, "error": "requests must be JSON objects"}
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for game_id in owned:
+                self.sessions.pop(game_id, None)
+            self.connections -= 1
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        """Start listening; use ``server.sockets[0].getsockname()`` for the bound port"""
+        return await asyncio.start_server(self.handle_client, host, port, backlog=4096)
+
+
+async def serve_forever(host: str = "127.0.0.1", port: int = 8765, preload=(),
+                        batch_size: int = 1, batch_delay: float = 0.002) -> None:
+    """Run a GameServer until cancelled, preloading the given agent kinds"""
+    server = GameServer(batch_size=batch_size, batch_delay=batch_delay)
+    for kind in preload:
+        server.agent_for(kind)
+    listener = await server.start(host, port)
+    async with listener:
+        await listener.serve_forever()
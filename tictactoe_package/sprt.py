@@ -0,0 +1,77 @@
+"""
+Sequential probability ratio test for agent comparisons
+Plays games in batches and stops as soon as the evidence is decisive.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+from .arena import MatchResult, ResultCache, play_match
+
+
+def elo_to_score(elo: float) -> float:
+    """Expected score for an Elo advantage"""
+    return 1.0 / (1.0 + 10 ** (-elo / 400.0))
+
+
+def sprt_bounds(alpha: float, beta: float):
+    """(lower, upper) log-likelihood-ratio bounds for error rates alpha and beta"""
+    return math.log(beta / (1 - alpha)), math.log((1 - beta) / alpha)
+
+
+def sprt_llr(result: MatchResult, elo0: float, elo1: float) -> float:
+    """Generalized SPRT log-likelihood ratio of H1 (elo1) vs H0 (elo0).
+
+    Uses the normal approximation on per-game scores (1, 0.5, 0). The score
+    variance is estimated with one extra win, draw and loss so that a short
+    run of identical results does not divide by zero.
+    """
+    n = result.games
+    if n == 0:
+        return 0.0
+    w, d, l = result.wins + 1, result.draws + 1, result.losses + 1
+    m = w + d + l
+    mean = (w + 0.5 * d) / m
+    var = (w * (1 - mean) ** 2 + d * (0.5 - mean) ** 2 + l * mean ** 2) / m
+    s0, s1 = elo_to_score(elo0), elo_to_score(elo1)
+    return n * (s1 - s0) * (2 * result.score - s0 - s1) / (2 * var)
+
+
+@dataclass
+class SPRTResult:
+    """Outcome of a sequential test"""
+    decision: Optional[str]     # 'H1' (A is at least elo1 stronger), 'H0', or None if undecided
+    llr: float
+    lower: float
+    upper: float
+    result: MatchResult
+
+
+def run_sprt(agent_a, agent_b, elo0: float = 0.0, elo1: float = 50.0,
+             alpha: float = 0.05, beta: float = 0.05, batch: int = 20,
+             max_games: int = 20000, seed: Optional[int] = None, progress=None) -> SPRTResult:
+    """Play A vs B in batches until the SPRT accepts H0 or H1 (or max_games).
+
+    H0: A's Elo advantage is elo0; H1: it is elo1. ``alpha`` is the false
+    positive rate (accepting H1 under H0), ``beta`` the false negative rate.
+    Batches have an even size so colours stay balanced.
+    """
+    rng = random.Random(seed) if seed is not None else random
+    batch = max(2, batch + batch % 2)
+    lower, upper = sprt_bounds(alpha, beta)
+    cache = ResultCache()
+    total = MatchResult()
+    llr = 0.0
+    while total.games < max_games:
+        total.add(play_match(agent_a, agent_b, min(batch, max_games - total.games),
+                             cache=cache, rng=rng))
+        llr = sprt_llr(total, elo0, elo1)
+        if progress is not None:
+            progress(total, llr)
+        if llr >= upper:
+            return SPRTResult('H1', llr, lower, upper, total)
+        if llr <= lower:
+            return SPRTResult('H0', llr, lower, upper, total)
+    return SPRTResult(None, llr, lower, upper, total)
@@ -0,0 +1,59 @@
+"""
+Board symmetries for TicTacToe
+The 8 rotations and reflections (the dihedral group D4) of a square board;
+a rectangular board keeps the 4 that map it onto itself
+"""
+
+from typing import List
+
+
+def _rotate(perm: List[int], n: int) -> List[int]:
+    """Rotate a cell permutation 90 degrees clockwise"""
+    return [perm[(n - 1 - c) * n + r] for r in range(n) for c in range(n)]
+
+
+def dihedral_permutations(n: int = 3) -> List[List[int]]:
+    """Return the 8 symmetries of an n x n board as cell permutations.
+
+    Each permutation ``p`` maps a board to its transformed copy with
+    ``new_board[k] = board[p[k]]``. The identity comes first.
+    """
+    identity = list(range(n * n))
+    mirror = [r * n + (n - 1 - c) for r in range(n) for c in range(n)]
+    perms = []
+    for base in (identity, mirror):
+        p = base
+        for _ in range(4):
+            perms.append(p)
+            p = _rotate(p, n)
+    return perms
+
+
+def board_symmetries(rows: int = 3, cols: int = 3) -> List[List[int]]:
+    """Symmetries of a rows x cols board, identity first.
+
+    Square boards have all 8; other boards have the identity, both mirrors
+    and the half turn.
+    """
+    if rows == cols:
+        return dihedral_permutations(rows)
+    cells = [(r, c) for r in range(rows) for c in range(cols)]
+    flips = [(False, False), (False, True), (True, False), (True, True)]
+    return [[(rows - 1 - r if fr else r) * cols + (cols - 1 - c if fc else c) for r, c in cells]
+            for fr, fc in flips]
+
+
+def inverse_permutation(perm: List[int]) -> List[int]:
+    """Return ``inv`` such that ``inv[perm[k]] == k``"""
+    inv = [0] * len(perm)
+    for k, src in enumerate(perm):
+        inv[src] = k
+    return inv
+
+
+def transform_board(board: List[str], perm: List[int]) -> List[str]:
+    """Apply a cell permutation to a board"""
+    return [board[src] for src in perm]
+
+
+SYMMETRIES = dihedral_permutations(3)
@@ -0,0 +1,133 @@
+"""
+Auto-mode tournaments
+Plays computer-vs-computer games in-process or sharded across worker processes.
+
+Every game draws from its own random.Random seeded from (seed, game index),
+so the totals for a given seed do not depend on how the games are split
+between workers, and the global random state is left alone.
+"""
+
+import hashlib
+import multiprocessing as mp
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .gamelog import GameRecord, RecordSink
+from .latency import LatencyRecorder
+from .player import PlayerInput
+
+Counts = Tuple[int, int, int]  # (X wins, O wins, draws)
+
+_worker_controller = None  # per-process GameController, set by _init_worker
+_worker_log_games = False  # collect GameRecords and send them back with each chunk
+
+
+def game_seed(seed: int, index: int) -> int:
+    """Seed for game ``index`` of a tournament seeded with ``seed``.
+
+    A hash of the pair, so distinct (seed, index) pairs get unrelated seeds
+    however many games are played.
+    """
+    digest = hashlib.sha256(f"{seed}:{index}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def play_range(controller, start: int, stop: int, seed: int,
+               record: Optional[RecordSink] = None) -> Counts:
+    """Play games ``start``..``stop - 1`` on ``controller`` and count the results.
+
+    ``record`` receives a GameRecord for every game, if given.
+    """
+    wins_x = wins_o = draws = 0
+    for i in range(start, stop):
+        winner = controller.play_game_auto(random.Random(game_seed(seed, i)))
+        if record is not None:
+            kind = PlayerInput._ai_kind
+            record(GameRecord(controller.last_moves, winner, controller.last_start, kind, kind, seed, i))
+        if winner == 'X':
+            wins_x += 1
+        elif winner == 'O':
+            wins_o += 1
+        else:
+            draws += 1
+    return wins_x, wins_o, draws
+
+
+def _init_worker(ai_kind: str, deterministic: bool, log_games: bool = False) -> None:
+    """Build one controller per worker and load its agent once"""
+    global _worker_controller, _worker_log_games
+    _worker_log_games = log_games
+    from .controller import GameController
+    try:
+        import torch
+        torch.set_num_threads(1)  # one core per worker; avoid oversubscription
+    except ImportError:
+        pass
+    PlayerInput._ai_kind = ai_kind
+    controller = GameController()
+    controller.num_human_players = 0
+    controller.quiet = True
+    controller.deterministic = deterministic
+    controller._load_ai()
+    _worker_controller = controller
+
+
+def _play_chunk(chunk: Tuple[int, int, int]):
+    """Play one chunk in a worker; returns (games, counts, latency since last chunk, records)"""
+    start, stop, seed = chunk
+    records: List[GameRecord] = []
+    counts = play_range(_worker_controller, start, stop, seed,
+                        records.append if _worker_log_games else None)
+    latency = _worker_controller.latency
+    _worker_controller.latency = LatencyRecorder()
+    return stop - start, counts, latency, records
+
+
+def run_tournament(controller, num_games: int, jobs: int = 1, seed: Optional[int] = None,
+                   progress: Optional[Callable[[int, int], None]] = None,
+                   record: Optional[RecordSink] = None) -> Dict[str, int]:
+    """Play ``num_games`` auto games with the current AI kind.
+
+    With ``jobs > 1`` the games are split into chunks and played by a pool of
+    worker processes, each with its own controller and agent; their move
+    latencies are merged into ``controller.latency``. ``progress`` is called
+    with (games done, total) as chunks complete. ``record`` receives a
+    GameRecord for every game (in completion order when ``jobs > 1``).
+
+    Returns:
+        dict with 'X', 'O' and 'Draw' counts
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    jobs = max(1, jobs)
+    chunk_size = max(1, min(1000, -(-num_games // (jobs * 8))))
+    chunks: List[Tuple[int, int, int]] = [
+        (start, min(start + chunk_size, num_games), seed)
+        for start in range(0, num_games, chunk_size)
+    ]
+
+    totals = [0, 0, 0]
+    done = 0
+
+    def add(n: int, counts: Counts) -> None:
+        nonlocal done
+        for k in range(3):
+            totals[k] += counts[k]
+        done += n
+        if progress is not None:
+            progress(done, num_games)
+
+    if jobs == 1:
+        controller._load_ai()
+        for start, stop, chunk_seed in chunks:
+            add(stop - start, play_range(controller, start, stop, chunk_seed, record))
+    else:
+        initargs = (PlayerInput._ai_kind, controller.deterministic, record is not None)
+        with mp.Pool(jobs, initializer=_init_worker, initargs=initargs) as pool:
+            for n, counts, latency, records in pool.imap_unordered(_play_chunk, chunks):
+                controller.latency.merge(latency)
+                for game in records:
+                    record(game)
+                add(n, counts)
+
+    return {'X': totals[0], 'O': totals[1], 'Draw': totals[2]}
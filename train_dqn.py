@@ -1,6 +1,11 @@
 # train_dqn.py
 from tictactoe_package.dqn_agent import DQNAgent, DQNConfig, encode_board, legal_mask
 from tictactoe_package.game import TicTacToe  # your existing environment
+from tictactoe_package.heuristic import smart_move_mnk
+from tictactoe_package.gamelog import GameLogWriter, GameRecord, RecordSink
+from tictactoe_package.metrics import TrainingMetrics
+from tictactoe_package.profiling import run_profiled
+import dataclasses
 import random
 import  time #Needed for benchmarking
 
@@ -16,73 +21,43 @@ def outcome_reward(winner: str | None, mover: str) -> float:
         return 0.2  # make draw slightly positive to encourage avoiding losses
     return +1.0 if mover == winner else -1.0
 
-def check_winning_move(board, player):
-    """Check if there's a winning move for the player.
-    
-    Returns position index if winning move exists, None otherwise.
-    """
-    # Winning combinations to check
-    winning_combinations = [
-        [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
-        [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
-        [0, 4, 8], [2, 4, 6]              # Diagonals
-    ]
-    
-    for combo in winning_combinations:
-        positions = [board[i] for i in combo]
-        # Check if two positions have player's mark and one is empty
-        if positions.count(player) == 2 and positions.count(' ') == 1:
-            # Return the empty position that would complete the line
-            empty_idx = positions.index(' ')
-            return combo[empty_idx]
-    
-    return None
-
-def smart_opponent_move(board, opponent_mark):
-    """
-    Smart opponent strategy:
-    1. Win if possible
-    2. Block opponent from winning
-    3. Take center if available
-    4. Take corner
-    5. Random
+def train(episodes=30000, cfg: DQNConfig | None = None, metrics: TrainingMetrics | None = None,
+          record: RecordSink | None = None, policy_path: str = "dqn_policy.pt"):
+    """Train a DQN agent by self-play mixed with smart-opponent episodes.
+
+    The game is the cfg.rows x cfg.cols board with cfg.k in a row to win.
+    The update-to-data ratio is controlled by ``cfg.learn_every``,
+    ``cfg.gradient_steps`` and ``cfg.batch_size``. If ``metrics`` is given,
+    throughput counters are streamed to it once per episode. If ``record``
+    is given, it receives a GameRecord for every episode.
     """
-    # 1. Check if we can win
-    winning_move = check_winning_move(board, opponent_mark)
-    if winning_move is not None:
-        return winning_move
-    
-    # 2. Check if we need to block opponent
-    player_mark = 'X' if opponent_mark == 'O' else 'O'
-    blocking_move = check_winning_move(board, player_mark)
-    if blocking_move is not None:
-        return blocking_move
-    
-    # 3. Take center if available
-    if board[4] == ' ':
-        return 4
-    
-    # 4. Take a corner
-    corners = [0, 2, 6, 8]
-    available_corners = [c for c in corners if board[c] == ' ']
-    if available_corners:
-        return random.choice(available_corners)
-    
-    # 5. Take any available space
-    available = [i for i in range(9) if board[i] == ' ']
-    return random.choice(available) if available else None
-
-def train(episodes=30000):
-    cfg = DQNConfig()
-    cfg.verbose = False  # Disable verbose output during training for speed
+    # Disable verbose output during training for speed, without touching the caller's config
+    cfg = dataclasses.replace(cfg or DQNConfig(), verbose=False)
     agent = DQNAgent(cfg)
     print(f"Device: {agent.cfg.device}")
+    print(f"Learning every {cfg.learn_every} step(s), "
+          f"{cfg.gradient_steps} gradient step(s) of batch {cfg.batch_size}")
+    if cfg.replay_path:
+        print(f"Replay buffer: {cfg.replay_path} ({len(agent.buffer):,} transitions already stored)")
+
+    timers = {"inference": 0.0, "learn": 0.0}
+
+    def learn_step():
+        t = time.perf_counter()
+        taken = agent.maybe_learn()
+        timers["learn"] += time.perf_counter() - t
+        if taken and metrics is not None:
+            metrics.add_learn(agent.round_loss, agent.round_td_error, taken)
 
     for ep in range(1, episodes + 1):
-        env = TicTacToe()
+        env = TicTacToe(cfg.rows, cfg.cols, cfg.k)
         step_in_ep = 0
+        ep_start = time.perf_counter()
+        timers["inference"] = timers["learn"] = 0.0
         # Track previous DQN player's experience to update when opponent wins
         prev_dqn_experience = None  # (state, action, mover)
+        moves = []
+        winner = None
         
         # Decide if this episode uses smart opponent (every Nth episode)
         use_smart = (ep % SMART_OPPONENT_FREQUENCY == 0)
@@ -101,21 +76,22 @@ def train(episodes=30000):
             # Determine if this is a DQN move or smart opponent move
             is_smart_opponent_turn = use_smart and (env.current_player != dqn_player)
             
+            t = time.perf_counter()
             if is_smart_opponent_turn:
                 # Smart opponent's turn
-                a = smart_opponent_move(env.board, env.current_player)
-                if a is None:
-                    break  # no legal moves
+                a = smart_move_mnk(env.board, env.current_player, env.rows, env.cols, env.k)
             else:
                 # DQN's turn
                 a = agent.select_action(env.board, env.current_player, explore=True)
-                if a == -1:
-                    break  # no legal moves
+            timers["inference"] += time.perf_counter() - t
+            if a is None or a == -1:
+                break  # no legal moves
 
             # take action
             mover = env.current_player
             is_dqn_move = not is_smart_opponent_turn
             env.make_move(a)
+            moves.append(a)
             winner = env.check_winner()
             done = winner is not None or env.is_board_full()
             step_penalty = -0.01
@@ -129,7 +105,7 @@ def train(episodes=30000):
                 if is_dqn_move:
                     agent.remember(s, a, r, s_next, True, mask_next)
                     agent.step_count += 1
-                    agent.learn()
+                    learn_step()
                 
                 # If there was a previous DQN player and current player won, 
                 # update previous DQN player's experience with negative reward
@@ -142,7 +118,7 @@ def train(episodes=30000):
                         prev_mask_next = legal_mask(env.board)
                         agent.remember(prev_s, prev_a, prev_r, prev_s_next, True, prev_mask_next)
                         agent.step_count += 1
-                        agent.learn()
+                        learn_step()
                 
                 break
             else:
@@ -156,25 +132,79 @@ def train(episodes=30000):
                 if is_dqn_move:
                     agent.remember(s, a, r, s_next, False, mask_next)
                     agent.step_count += 1
-                    agent.learn()
+                    learn_step()
                     
                     # Store current experience as previous for next iteration
                     prev_dqn_experience = (s, a, mover)
 
             step_in_ep += 1
 
+        if record is not None:
+            x_name = "smart" if use_smart and dqn_player == 'O' else "dqn"
+            o_name = "smart" if use_smart and dqn_player == 'X' else "dqn"
+            record(GameRecord(tuple(moves), winner, 'X', x_name, o_name, index=ep))
+
+        if metrics is not None:
+            ep_time = time.perf_counter() - ep_start
+            metrics.add_steps(step_in_ep + 1)
+            metrics.add_time("inference", timers["inference"])
+            metrics.add_time("learn", timers["learn"])
+            metrics.add_time("env", ep_time - timers["inference"] - timers["learn"])
+            metrics.end_episode(epsilon=agent.epsilon(), buffer_fill=len(agent.buffer))
+
         if ep % 500 == 0:
             print(f"Episode {ep}/{episodes} | Buffer: {len(agent.buffer)} | Epsilon: {agent.epsilon():.2f}")
 
-    agent.save("dqn_policy.pt")
-    print("Saved DQN policy -> dqn_policy.pt")
+    agent.save(policy_path)
+    print(f"Saved DQN policy -> {policy_path} ({agent.grad_steps} gradient steps)")
+    return agent
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Train the DQN agent")
+    parser.add_argument("--episodes", type=int, default=30000)
+    parser.add_argument("--metrics", metavar="PATH", help="stream training metrics as JSONL to PATH")
+    parser.add_argument("--metrics-every", type=int, default=100, help="episodes per metrics record")
+    parser.add_argument("--game-log", metavar="PATH", help="append every training game to a binary game log")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="keep the replay buffer in this file; a later run starts with it warm")
+    parser.add_argument("--rows", type=int, default=3, help="board rows")
+    parser.add_argument("--cols", type=int, default=3, help="board columns")
+    parser.add_argument("--k", type=int, default=3, help="marks in a row to win")
+    parser.add_argument("--profile", nargs="?", const="train_dqn.prof", metavar="PATH",
+                        help="run under cProfile and write a .prof file plus a top-N summary")
+    parser.add_argument("--profile-top", type=int, default=25, help="functions in the profile summary")
+    args = parser.parse_args()
+    classic = args.rows == args.cols == args.k == 3
+    if args.game_log and not classic:
+        parser.error("--game-log records 3x3 games only")
+
     print("Starting DQN training...")
 # Start a timer    
     start_time = time.time()
 
-    train(episodes=30000)
+    metrics = TrainingMetrics(args.metrics, log_every=args.metrics_every) if args.metrics else None
+    game_log = GameLogWriter(args.game_log) if args.game_log else None
+    cfg = DQNConfig()
+    cfg.replay_path = args.replay
+    cfg.rows, cfg.cols, cfg.k = args.rows, args.cols, args.k
+    # the game and server load dqn_policy.pt, so other variants get their own file
+    policy_path = "dqn_policy.pt" if classic else f"dqn_policy_{args.rows}x{args.cols}k{args.k}.pt"
+    run = lambda: train(episodes=args.episodes, cfg=cfg, metrics=metrics,
+                        record=game_log.write if game_log else None, policy_path=policy_path)
+    agent = None
+    try:
+        if args.profile:
+            agent = run_profiled(run, args.profile, args.profile_top)
+        else:
+            agent = run()
+    finally:
+        if agent is not None:
+            agent.close()
+        if metrics is not None:
+            metrics.close()
+        if game_log is not None:
+            game_log.close()
 # End timer and display duration in seconds (formatted in MM:SS)
     end_time = time.time()
     duration = end_time - start_time
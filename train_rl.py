@@ -1,9 +1,52 @@
 # train_rl.py  (top-level next to tictactoe.py, or inside the package if you prefer)
+import argparse
 from tictactoe_package.rl_agent import RLAgent
+from tictactoe_package.gamelog import GameLogWriter
+from tictactoe_package.metrics import TrainingMetrics
+from tictactoe_package.profiling import run_profiled
+from tictactoe_package.qtable import BoundedQTable, EVICTION_POLICIES
 
 if __name__ == "__main__":
-    agent = RLAgent(alpha=0.2, gamma=0.95, epsilon=0.10)
-    print("Training RL agent by self-play (5,000 episodes)…")
-    agent.train_self_play(episodes=5000)
-    agent.save("q_table.json")
-    print("Saved learned policy to q_table.json")
+    parser = argparse.ArgumentParser(description="Train the Q-learning agent by self-play")
+    parser.add_argument("--episodes", type=int, default=5000)
+    parser.add_argument("--metrics", metavar="PATH", help="stream training metrics as JSONL to PATH")
+    parser.add_argument("--metrics-every", type=int, default=100, help="episodes per metrics record")
+    parser.add_argument("--game-log", metavar="PATH", help="append every training game to a binary game log")
+    parser.add_argument("--rows", type=int, default=3, help="board rows")
+    parser.add_argument("--cols", type=int, default=3, help="board columns")
+    parser.add_argument("--k", type=int, default=3, help="marks in a row to win")
+    parser.add_argument("--q-capacity", type=int, metavar="N",
+                        help="cap the Q-table at N entries, evicting as it fills (for large boards)")
+    parser.add_argument("--q-eviction", choices=EVICTION_POLICIES, default="lfu",
+                        help="entries evicted first: least frequently or least recently used")
+    parser.add_argument("--profile", nargs="?", const="train_rl.prof", metavar="PATH",
+                        help="run under cProfile and write a .prof file plus a top-N summary")
+    parser.add_argument("--profile-top", type=int, default=25, help="functions in the profile summary")
+    args = parser.parse_args()
+    classic = args.rows == args.cols == args.k == 3
+    if args.game_log and not classic:
+        parser.error("--game-log records 3x3 games only")
+    # the game and server load q_table.json, so other variants get their own file
+    out = "q_table.json" if classic else f"q_table_{args.rows}x{args.cols}k{args.k}.json"
+
+    agent = RLAgent(alpha=0.2, gamma=0.95, epsilon=0.10, rows=args.rows, cols=args.cols, k=args.k,
+                    q_capacity=args.q_capacity, q_eviction=args.q_eviction)
+    print(f"Training RL agent by self-play ({args.episodes:,} episodes)…")
+    metrics = TrainingMetrics(args.metrics, log_every=args.metrics_every) if args.metrics else None
+    game_log = GameLogWriter(args.game_log) if args.game_log else None
+    run = lambda: agent.train_self_play(episodes=args.episodes, metrics=metrics,
+                                        record=game_log.write if game_log else None)
+    try:
+        if args.profile:
+            run_profiled(run, args.profile, args.profile_top)
+        else:
+            run()
+    finally:
+        if metrics is not None:
+            metrics.close()
+        if game_log is not None:
+            game_log.close()
+    if isinstance(agent.q, BoundedQTable):
+        print(f"Q-table: {agent.q.summary()}")
+    agent.save(out)
+    print(f"Saved learned policy to {out}")